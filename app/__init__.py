@@ -1,7 +1,19 @@
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from linkedin_scraper import serialize
+
+
+class ResultJSONProvider(DefaultJSONProvider):
+    """jsonify() through the shared result serializer (orjson when installed)"""
+
+    def dumps(self, obj, **kwargs):
+        return serialize.dumps(obj, indent=bool(kwargs.get("indent")))
+
 
 def create_app():
     app = Flask(__name__)
+    app.json = ResultJSONProvider(app)
     
     from flask_basicauth import BasicAuth
     import os
@@ -16,5 +28,21 @@ def create_app():
     # Register Blueprints
     from app.routes import bp as main_bp
     app.register_blueprint(main_bp)
+
+    # Phase timings of every scrape feed the /metrics histograms
+    from app import metrics
+    metrics.install()
+
+    # Resolve chromedriver once at startup so requests never wait on webdriver-manager
+    from linkedin_scraper.chromedriver import resolve_chromedriver
+    try:
+        resolve_chromedriver()
+    except Exception as e:
+        app.logger.error(f"chromedriver resolution failed: {e}")
+
+    # Launch pooled browsers in the background so the first /scrape skips Chrome cold start
+    if os.environ.get('DRIVER_POOL_PREWARM', 'true').lower() == 'true':
+        from app.scraper import get_driver_pool
+        get_driver_pool().prewarm_async()
     
     return app
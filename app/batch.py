@@ -0,0 +1,87 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from linkedin_scraper import serialize
+
+# How many browsers may use the same session_id (= same LinkedIn account) at once
+MAX_WORKERS_PER_SESSION = int(os.getenv("MAX_WORKERS_PER_SESSION", "2"))
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def ndjson_line(record):
+    """One result as a newline-delimited JSON record (streamed batch output)"""
+    return serialize.dumps(record) + "\n"
+
+
+class SessionLimiter:
+    """Hands out per-session_id semaphores so one account is never hammered by every worker"""
+
+    def __init__(self, limit=MAX_WORKERS_PER_SESSION):
+        self.limit = max(1, int(limit))
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def slot(self, session_id):
+        with self._lock:
+            if session_id not in self._semaphores:
+                self._semaphores[session_id] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[session_id]
+
+
+class BatchExecutor:
+    """
+    Fans a list of URLs out to `workers` threads, each driving its own browser,
+    and returns the results in input order.
+
+    `scrape_fn(url, session_id=...)` does the actual work; it must not raise
+    for an ordinary scrape failure but return an error dict instead.
+    """
+
+    def __init__(self, scrape_fn, workers=4, per_session_limit=MAX_WORKERS_PER_SESSION):
+        self.scrape_fn = scrape_fn
+        self.workers = max(1, int(workers))
+        self.limiter = SessionLimiter(per_session_limit)
+
+    def _run_one(self, url, session_id):
+        with self.limiter.slot(session_id):
+            try:
+                return self.scrape_fn(url, session_id=session_id)
+            except Exception as e:
+                return {"url": url, "status": "error", "error": str(e)}
+
+    def imap(self, urls, session_id="default"):
+        """Yields results in input order as soon as each one (and all before it) is done"""
+        urls = list(urls)
+        if not urls:
+            return
+        # No point starting more threads than the session limit allows to run
+        workers = min(self.workers, self.limiter.limit, len(urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-worker") as pool:
+            # Only keep a small window of URLs in flight so huge batches don't pile up finished results
+            in_flight = deque()
+            for url in urls:
+                in_flight.append(pool.submit(self._run_one, url, session_id))
+                if len(in_flight) >= workers * 2:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def map(self, urls, session_id="default"):
+        return list(self.imap(urls, session_id))
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_batch_executor():
+    """Process wide executor for the Flask app; shares one session limiter across requests"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from app.scraper import scrape_profile_logic, DRIVER_POOL_SIZE
+            # Each worker checks a browser out of the pool, so the pool size caps useful concurrency
+            _executor = BatchExecutor(scrape_profile_logic, workers=int(os.getenv("BATCH_WORKERS", DRIVER_POOL_SIZE)))
+        return _executor
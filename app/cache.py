@@ -0,0 +1,102 @@
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from linkedin_scraper.urls import canonical_profile_url
+
+# Profile results are reused for this long unless a request asks for fresher data
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", "21600"))
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "1000"))
+
+
+class ProfileCache:
+    """
+    In-memory LRU of successful profile scrapes keyed by canonical profile URL.
+
+    Entries expire after `ttl` seconds; a caller can demand fresher data with
+    `max_age`. At most `max_entries` profiles are kept, least recently used go first.
+    Like the profile store, the cache is shared by all sessions: a profile
+    scraped with one session's cookies is served to every session_id.
+    """
+
+    def __init__(self, ttl=PROFILE_CACHE_TTL, max_entries=PROFILE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return self.ttl > 0
+
+    def get(self, url, max_age=None, sections=None):
+        """
+        Cached result (a copy, with cache_age added) or None.
+        With `sections`, only an entry that scraped at least those sections counts as a hit.
+        """
+        if not self.enabled:
+            return None
+        key = canonical_profile_url(url)
+        limit = self.max_age(max_age)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, data = entry
+            age = time.time() - stored_at
+            if age > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            if age > limit or not self.covers(data, sections):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        result = copy.deepcopy(data)
+        result["cached"] = True
+        result["cache_age"] = round(age, 1)
+        return result
+
+    def max_age(self, max_age=None):
+        """Oldest result a lookup with the caller's `max_age` may return"""
+        return self.ttl if max_age is None else min(self.ttl, max_age)
+
+    @staticmethod
+    def covers(data, sections):
+        if sections is None or "sections" not in data:
+            return True
+        return set(sections) <= set(data["sections"])
+
+    def set(self, url, data):
+        if not self.enabled:
+            return
+        key = canonical_profile_url(url)
+        with self._lock:
+            self._entries[key] = (time.time(), copy.deepcopy(data))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url):
+        with self._lock:
+            self._entries.pop(canonical_profile_url(url), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+profile_cache = ProfileCache()
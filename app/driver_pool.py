@@ -0,0 +1,230 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from linkedin_scraper import auth, timing
+
+# Origins whose storage gets wiped when a browser moves to another session_id
+RESET_ORIGINS = ["https://www.linkedin.com", "https://linkedin.com"]
+
+
+class PoolTimeout(Exception):
+    """Raised when no browser became free within the checkout timeout"""
+
+
+class PooledDriver:
+    """A pre-launched browser plus the bookkeeping the pool needs"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.session_id = None
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """
+    Bounded pool of warm Chrome instances.
+
+    Requests check a browser out with `with pool.driver(session_id) as driver:`.
+    Browsers are health checked on checkout, recycled after `max_uses`
+    scrapes and wiped (cookies + storage) whenever they switch session_id,
+    so tenants never see each other's login.
+    """
+
+    def __init__(self, factory, size=2, max_uses=25, checkout_timeout=120):
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = []
+        self._checked_out = {}
+        self._total = 0  # idle + checked out + currently launching
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    # --- lifecycle -------------------------------------------------------
+
+    def prewarm(self, count=None):
+        """Launches browsers up front so the first requests skip cold start"""
+        count = self.size if count is None else min(count, self.size)
+        for _ in range(count):
+            with self._cond:
+                if self._closed or self._total >= self.size:
+                    return
+                self._total += 1
+            slot = self._launch()
+            with self._cond:
+                if slot:
+                    self._idle.append(slot)
+                self._cond.notify()
+
+    def prewarm_async(self, count=None):
+        thread = threading.Thread(target=self.prewarm, args=(count,), daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for slot in idle:
+            self._quit(slot)
+
+    # --- checkout / return -----------------------------------------------
+
+    def acquire(self, session_id="default", timeout=None):
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            slot = None
+            launch = False
+            with self._cond:
+                self._waiting += 1
+                try:
+                    while not self._idle and self._total >= self.size and not self._closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise PoolTimeout(f"No browser free after {timeout}s ({self.size} in use)")
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+
+                if self._idle:
+                    # Prefer a browser that last served the same session (no reset needed)
+                    slot = next((s for s in reversed(self._idle) if s.session_id == session_id), self._idle[-1])
+                    self._idle.remove(slot)
+                else:
+                    self._total += 1
+                    launch = True
+
+            if launch:
+                slot = self._launch()
+                if slot is None:
+                    raise RuntimeError("Could not start Chrome for the driver pool")
+            elif not self._is_healthy(slot):
+                print("DEBUG: Pooled browser failed health check, replacing it")
+                self._discard(slot)
+                continue
+
+            if slot.session_id is not None and slot.session_id != session_id:
+                if not self._reset_state(slot):
+                    self._discard(slot)
+                    continue
+
+            slot.session_id = session_id
+            slot.uses += 1
+            with self._cond:
+                self._checked_out[id(slot.driver)] = slot
+            return slot.driver
+
+    def release(self, driver, discard=False):
+        with self._cond:
+            slot = self._checked_out.pop(id(driver), None)
+        if slot is None:
+            return
+
+        if discard or slot.uses >= self.max_uses or self._closed:
+            self._discard(slot)
+            return
+
+        try:
+            # Leave the browser on a blank page so it does not keep polling LinkedIn while idle
+            driver.get("about:blank")
+        except Exception:
+            self._discard(slot)
+            return
+
+        with self._cond:
+            self._idle.append(slot)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, session_id="default", timeout=None):
+        driver = self.acquire(session_id, timeout=timeout)
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            # Only throw the browser away if the error left it unusable
+            self.release(driver, discard=failed and not self.is_healthy(driver))
+
+    @staticmethod
+    def is_healthy(driver):
+        """Cheap liveness probe: one script round trip to the browser"""
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "in_use": len(self._checked_out),
+                "waiting": self._waiting,
+                "max_uses": self.max_uses,
+            }
+
+    # --- internals -------------------------------------------------------
+
+    def _launch(self):
+        try:
+            with timing.phase("DriverPool", "driver_startup"):
+                return PooledDriver(self.factory())
+        except Exception as e:
+            print(f"DEBUG: Failed to launch pooled browser: {e}")
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return None
+
+    def _discard(self, slot):
+        self._quit(slot)
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _quit(slot):
+        try:
+            slot.driver.quit()
+        except Exception:
+            pass
+
+    def _is_healthy(self, slot):
+        return self.is_healthy(slot.driver)
+
+    @staticmethod
+    def _reset_state(slot):
+        """Wipes cookies, storage and extra tabs so the next session starts clean"""
+        driver = slot.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get("about:blank")
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            auth.forget(driver)
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in RESET_ORIGINS:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            return True
+        except Exception as e:
+            print(f"DEBUG: Could not reset pooled browser state: {e}")
+            return False
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Columnar export of stored profiles (see linkedin_scraper/export.py).
+
+    python -m app.export --out export/                       # Parquet if pyarrow is installed, else CSV
+    python -m app.export --out export/ --since 2026-10-01 --company ACME
+    python -m app.export --out export/ --format csv --jobs jobs.ndjson --companies companies.json
+
+Profiles are read straight from the SQLite profile store: the filters run
+as indexed SQL and rows arrive oldest first, so Parquet row groups are
+ordered by scraped_at and readers can skip them by min/max statistics.
+Companies and jobs are not kept in the store; pass their to_dict()
+records as NDJSON or JSON files.
+
+GET /export streams one table of the store the same way.
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+from linkedin_scraper import export
+from app.store import profile_store
+
+
+def parse_since(value):
+    """Epoch seconds or an ISO date/datetime (local time) as epoch seconds; None passes through"""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"since must be epoch seconds or an ISO date, got {value!r}")
+
+
+def read_records(path):
+    """Records of an NDJSON file or a JSON file holding a list (or {"results": [...]})"""
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[" or (first == "{" and not path.endswith((".ndjson", ".jsonl"))):
+            data = json.load(f)
+            yield from (data.get("results", [data]) if isinstance(data, dict) else data)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def export_store(exporter, name=None, company=None, since=None):
+    """Adds every matching stored profile to `exporter`; returns the number of profiles"""
+    count = 0
+    for result in profile_store.iter_results(name=name, company=company, since=since):
+        exporter.add("profiles", result)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export stored profiles, companies and jobs to Parquet/Arrow/CSV")
+    parser.add_argument("--out", required=True, help="directory for the table files")
+    parser.add_argument("--format", choices=export.FORMATS, help=f"default: {export.default_format()}")
+    parser.add_argument("--since", help="only profiles scraped at/after this (epoch seconds or ISO date)")
+    parser.add_argument("--company", help="only profiles with this current company")
+    parser.add_argument("--name", help="only profiles with this name")
+    parser.add_argument("--no-profiles", action="store_true", help="skip the profile store")
+    parser.add_argument("--companies", action="append", default=[], help="NDJSON/JSON file of Company.to_dict() records")
+    parser.add_argument("--jobs", action="append", default=[], help="NDJSON/JSON file of Job.to_dict() records")
+    parser.add_argument("--chunk-size", type=int, default=export.CHUNK_SIZE, help="rows per row group")
+    args = parser.parse_args(argv)
+
+    try:
+        since = parse_since(args.since)
+    except ValueError as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+    with export.Exporter(args.out, format=args.format, chunk_size=args.chunk_size) as exporter:
+        if not args.no_profiles:
+            export_store(exporter, name=args.name, company=args.company, since=since)
+        for kind, paths in (("companies", args.companies), ("jobs", args.jobs)):
+            for path in paths:
+                for record in read_records(path):
+                    exporter.add(kind, record)
+
+    counts = exporter.counts()
+    for table, path in sorted(exporter.files.items()):
+        print(f"[export] {table}: {counts.get(table, 0)} rows -> {path}", file=sys.stderr)
+    print(f"[export] done in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    return counts
+
+
+if __name__ == "__main__":
+    main()
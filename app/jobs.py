@@ -0,0 +1,166 @@
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# Finished jobs are kept this long for polling before they are dropped
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "86400"))
+
+
+class ScrapeJob:
+    """A submitted batch: its URLs, per-item results and progress counters"""
+
+    def __init__(self, urls, session_id="default"):
+        self.id = uuid.uuid4().hex
+        self.urls = list(urls)
+        self.session_id = session_id
+        self.results = [None] * len(self.urls)
+        # Results in the order they finished, what /jobs/<id> pages over
+        self.done = []
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.succeeded = 0
+        self.status = "queued"  # queued -> running -> done | cancelled
+        self.created_at = datetime.now().isoformat()
+        self.finished_at = None
+        self.finished_ts = None
+        self.cancelled = False
+
+    def progress(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "session_id": self.session_id,
+            "total": len(self.urls),
+            "completed": self.completed,
+            "success": self.succeeded,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    def page(self, offset=0, limit=50):
+        """
+        Completed results in completion order, each with its input `index`, and the
+        offset to poll next (None once the job is over and everything was returned).
+        Offsets are stable: an item finishing later is appended, never inserted.
+        """
+        with self._lock:
+            results = self.done[offset:offset + limit]
+            end = offset + len(results)
+            more = end < len(self.done) or self.status in ("queued", "running")
+        return results, end if more else None
+
+
+class JobQueue:
+    """
+    Background worker threads that process scrape jobs item by item.
+
+    Each queue entry is one (job, index) pair, so several jobs progress side
+    by side and a large batch never blocks the HTTP thread that submitted it.
+    """
+
+    def __init__(self, scrape_fn, workers=2):
+        self.scrape_fn = scrape_fn
+        self.workers = max(1, int(workers))
+        self._jobs = {}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._started = False
+
+    def start(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"scrape-job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, urls, session_id="default"):
+        self.start()
+        job = ScrapeJob(urls, session_id)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        for index in range(len(job.urls)):
+            self._queue.put((job, index))
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._lock, job._lock:
+            job.cancelled = True
+            if job.status in ("queued", "running"):
+                job.status = "cancelled"
+                self._finish(job)
+        return job
+
+    def stats(self):
+        with self._lock:
+            active = sum(1 for j in self._jobs.values() if j.status in ("queued", "running"))
+            return {
+                "workers": self.workers,
+                "pending_items": self._queue.qsize(),
+                "active_jobs": active,
+                "known_jobs": len(self._jobs),
+            }
+
+    def _worker(self):
+        while True:
+            job, index = self._queue.get()
+            try:
+                if job.cancelled:
+                    continue
+                with self._lock:
+                    if job.status == "queued":
+                        job.status = "running"
+                try:
+                    result = self.scrape_fn(job.urls[index], session_id=job.session_id)
+                except Exception as e:
+                    result = {"url": job.urls[index], "status": "error", "error": str(e)}
+                result = dict(result, index=index)
+                with self._lock, job._lock:
+                    job.results[index] = result
+                    job.done.append(result)
+                    job.completed += 1
+                    if result.get("status") == "success":
+                        job.succeeded += 1
+                    if job.completed == len(job.urls) and not job.cancelled:
+                        job.status = "done"
+                        self._finish(job)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _finish(job):
+        job.finished_at = datetime.now().isoformat()
+        job.finished_ts = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job_id in [j.id for j in self._jobs.values() if j.finished_ts and j.finished_ts < cutoff]:
+            del self._jobs[job_id]
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue():
+    """Returns the process wide job queue (workers start on first submit)"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            from app.scraper import scrape_profile_logic, DRIVER_POOL_SIZE
+            # More workers than pooled browsers would only queue up on the pool
+            _job_queue = JobQueue(scrape_profile_logic, workers=int(os.getenv("JOB_WORKERS", DRIVER_POOL_SIZE)))
+        return _job_queue
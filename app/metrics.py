@@ -0,0 +1,158 @@
+"""
+Prometheus metrics for the app, rendered in the text exposition format on /metrics.
+
+Kept in-house (no prometheus_client dependency): counters and histograms
+with labels are all the app needs. Pool, queue and cache gauges are read
+from their stats() when /metrics is scraped.
+"""
+import threading
+
+from linkedin_scraper import timing
+
+# Scrape phases range from milliseconds (extraction) to a minute (slow navigation)
+PHASE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SCRAPE_BUCKETS = (1, 2.5, 5, 10, 20, 30, 45, 60, 90, 120, 300)
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=PHASE_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series["counts"]):
+                    labels = _labels(self.labelnames + ("le",), key + (_number(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_number(series['sum'])}")
+                lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+def sample(name, documentation, value, kind="gauge"):
+    """A single unlabelled value read from some stats() dict"""
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {_number(value)}"]
+
+
+phase_seconds = Histogram(
+    "linkedin_scraper_phase_seconds",
+    "Time spent per scrape phase (nested phases excluded)",
+    ("scraper", "phase"),
+)
+phase_errors = Counter(
+    "linkedin_scraper_phase_errors_total",
+    "Phases that ended with an exception",
+    ("scraper", "phase"),
+)
+scrapes = Counter(
+    "linkedin_scraper_scrapes_total",
+    "Profile scrape requests by outcome (success, error, cached, stored)",
+    ("status",),
+)
+scrape_seconds = Histogram(
+    "linkedin_scraper_scrape_seconds",
+    "End to end duration of profile scrapes that hit the browser",
+    ("status",),
+    buckets=SCRAPE_BUCKETS,
+)
+
+
+def record_phase(owner, phase, seconds, ok):
+    """timing hook feeding the phase histogram"""
+    phase_seconds.observe(seconds, scraper=owner, phase=phase)
+    if not ok:
+        phase_errors.inc(scraper=owner, phase=phase)
+
+
+_installed = False
+_installed_lock = threading.Lock()
+
+def install():
+    """Registers the timing hook once per process"""
+    global _installed
+    with _installed_lock:
+        if not _installed:
+            timing.add_hook(record_phase)
+            _installed = True
+
+
+def render(pool_stats=None, queue_stats=None, cache_stats=None, store_stats=None):
+    lines = []
+    for metric in (phase_seconds, phase_errors, scrapes, scrape_seconds):
+        lines += metric.render()
+    if pool_stats:
+        lines += sample("linkedin_scraper_driver_pool_size", "Configured number of pooled browsers", pool_stats["size"])
+        lines += sample("linkedin_scraper_driver_pool_browsers", "Browsers currently running", pool_stats["total"])
+        lines += sample("linkedin_scraper_driver_pool_idle", "Idle pooled browsers", pool_stats["idle"])
+        lines += sample("linkedin_scraper_driver_pool_in_use", "Checked out browsers", pool_stats["in_use"])
+        lines += sample("linkedin_scraper_driver_pool_waiting", "Requests waiting for a browser", pool_stats["waiting"])
+    if queue_stats:
+        lines += sample("linkedin_scraper_job_queue_pending_items", "URLs waiting in the job queue", queue_stats["pending_items"])
+        lines += sample("linkedin_scraper_job_queue_active_jobs", "Queued or running jobs", queue_stats["active_jobs"])
+    if cache_stats:
+        lines += sample("linkedin_scraper_profile_cache_entries", "Profiles in the cache", cache_stats["entries"])
+        lines += sample("linkedin_scraper_profile_cache_hits_total", "Profile cache hits", cache_stats["hits"], "counter")
+        lines += sample("linkedin_scraper_profile_cache_misses_total", "Profile cache misses", cache_stats["misses"], "counter")
+    if store_stats and store_stats["profiles"] is not None:
+        lines += sample("linkedin_scraper_profile_store_profiles", "Profiles in the SQLite store", store_stats["profiles"])
+        lines += sample("linkedin_scraper_profile_store_versions", "Stored profile versions", store_stats["versions"])
+        lines += sample("linkedin_scraper_profile_store_queued", "Results waiting for the store writer", store_stats["queued"])
+        lines += sample("linkedin_scraper_profile_store_errors_total", "Results the store writer failed to commit", store_stats["errors"], "counter")
+    return "\n".join(lines) + "\n"
@@ -1,5 +1,12 @@
-from flask import Blueprint, request, jsonify, render_template, current_app
-from app.scraper import scrape_profile_logic, login_to_linkedin, save_manual_cookies
+from flask import Blueprint, Response, request, jsonify, render_template, current_app, stream_with_context
+from app.scraper import scrape_profile_logic, login_to_linkedin, save_manual_cookies, get_driver_pool
+from app.jobs import get_job_queue
+from app.batch import get_batch_executor, ndjson_line, NDJSON_MIMETYPE
+from app.cache import profile_cache
+from app.store import profile_store
+from app.export import parse_since
+from app import metrics
+from linkedin_scraper import Person, auth, export
 from datetime import datetime
 
 bp = Blueprint('main', __name__)
@@ -10,7 +17,26 @@ def index():
 
 @bp.route('/health', methods=['GET'])
 def health():
-    return jsonify({"status": "ok", "timestamp": datetime.now().isoformat()})
+    return jsonify({
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        "driver_pool": get_driver_pool().stats(),
+        "job_queue": get_job_queue().stats(),
+        "profile_cache": profile_cache.stats(),
+        "profile_store": profile_store.stats(),
+        "auth": auth.sessions()
+    })
+
+@bp.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus text format: phase/scrape histograms, outcome counters, pool/queue/cache gauges"""
+    body = metrics.render(
+        pool_stats=get_driver_pool().stats(),
+        queue_stats=get_job_queue().stats(),
+        cache_stats=profile_cache.stats(),
+        store_stats=profile_store.stats()
+    )
+    return Response(body, mimetype="text/plain; version=0.0.4")
 
 @bp.route('/scrape', methods=['POST'])
 def scrape():
@@ -27,8 +53,27 @@ def scrape():
         
         # Get sessionId 
         session_id = data.get('session_id', 'default_user')
+
+        # Cache control: max_age (seconds) caps the age of a cached result, force_refresh skips the cache
+        max_age = data.get('max_age')
+        if max_age is not None:
+            try:
+                max_age = float(max_age)
+            except (TypeError, ValueError):
+                return jsonify({"status": "error", "error": "max_age must be a number of seconds"}), 400
+        force_refresh = data.get('force_refresh', False)
+        if isinstance(force_refresh, str):
+            # "false"/"0" from form-style clients must not count as true
+            force_refresh = force_refresh.strip().lower() in ('true', '1', 'yes', 'on')
+        force_refresh = bool(force_refresh)
         
-        result = scrape_profile_logic(url, session_id=session_id)
+        # Only fetch what the caller needs, e.g. ["top_card", "experiences"]
+        sections = data.get('sections')
+        if sections is not None:
+            if not isinstance(sections, list) or set(sections) - set(Person.SECTIONS):
+                return jsonify({"status": "error", "error": f"sections must be a list of: {', '.join(Person.SECTIONS)}"}), 400
+        
+        result = scrape_profile_logic(url, session_id=session_id, max_age=max_age, force_refresh=force_refresh, sections=sections)
         
         status_code = 200
         if result.get("status") == "error":
@@ -39,17 +84,90 @@ def scrape():
         current_app.logger.error(f"Unhandled Error in /scrape: {str(e)}")
         return jsonify({"status": "error", "error": str(e)}), 500
 
+@bp.route('/profiles', methods=['GET'])
+def profiles():
+    """
+    Stored profiles. ?url=... returns one profile (&history=true adds its versions),
+    otherwise ?name=, ?company= and ?since= (epoch seconds) filter, &offset/&limit page
+    """
+    url = request.args.get('url')
+    if url:
+        result = profile_store.get(url)
+        if result is None:
+            return jsonify({"status": "error", "error": "Profile not stored"}), 404
+        if request.args.get('history', '').lower() == 'true':
+            result["versions"] = profile_store.history(url)
+        return jsonify(result)
+
+    name = request.args.get('name')
+    company = request.args.get('company')
+    since = request.args.get('since', type=float)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    return jsonify({
+        "total": profile_store.count(name=name, company=company, since=since),
+        "offset": offset,
+        "results": profile_store.find(name=name, company=company, since=since, limit=limit, offset=offset)
+    })
+
+@bp.route('/export', methods=['GET'])
+def export_table():
+    """
+    Streams one table of the profile store: ?table=profiles|experiences|educations|accomplishments,
+    &format=parquet|arrow|csv (parquet needs pyarrow), filtered by &name=, &company=, &since=
+    """
+    table = request.args.get('table', 'profiles')
+    fmt = request.args.get('format') or export.default_format()
+    if table not in export.KINDS["profiles"]:
+        return jsonify({"status": "error", "error": f"table must be one of: {', '.join(export.KINDS['profiles'])}"}), 400
+    if fmt not in export.FORMATS:
+        return jsonify({"status": "error", "error": f"format must be one of: {', '.join(export.FORMATS)}"}), 400
+    if fmt != "csv" and export.pyarrow is None:
+        return jsonify({"status": "error", "error": f"{fmt} export needs pyarrow on the server, use format=csv"}), 400
+    try:
+        since = parse_since(request.args.get('since'))
+    except ValueError as e:
+        return jsonify({"status": "error", "error": str(e)}), 400
+
+    results = profile_store.iter_results(name=request.args.get('name'), company=request.args.get('company'), since=since)
+    return Response(
+        stream_with_context(export.stream(table, results, format=fmt)),
+        mimetype=export.MIMETYPES[fmt],
+        headers={
+            "Content-Disposition": f"attachment; filename={table}{export.EXTENSIONS[fmt]}",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
 @bp.route('/scrape/batch', methods=['POST'])
 def scrape_batch():
     data = request.get_json(silent=True) or {}
     urls = data.get('urls', [])
     
-    if not urls:
+    # A string would be split into one job item per character
+    if not urls or not isinstance(urls, list):
         return jsonify({"status": "error", "error": "URLs required"}), 400
-        
-    results = []
-    for url in urls:
-        results.append(scrape_profile_logic(url))
+
+    session_id = data.get('session_id', 'default_user')
+
+    # Large batches should not hold a gunicorn thread: hand them to the job queue
+    if data.get('async'):
+        job = get_job_queue().submit(urls, session_id=session_id)
+        return jsonify(_job_accepted(job)), 202
+
+    # Streaming: one NDJSON line per profile as soon as it (and all before it) is done,
+    # nothing is collected server side
+    if data.get('stream') or NDJSON_MIMETYPE in request.headers.get('Accept', ''):
+        results = get_batch_executor().imap(urls, session_id=session_id)
+        return Response(
+            stream_with_context(ndjson_line(r) for r in results),
+            mimetype=NDJSON_MIMETYPE,
+            # Keep reverse proxies from buffering the stream until it ends
+            headers={"X-Accel-Buffering": "no"}
+        )
+
+    # Scrape in parallel on the pooled browsers, results come back in input order
+    results = get_batch_executor().map(urls, session_id=session_id)
         
     return jsonify({
         "status": "success",
@@ -57,6 +175,51 @@ def scrape_batch():
         "results": results
     })
 
+def _job_accepted(job):
+    return {
+        "status": "accepted",
+        "job_id": job.id,
+        "total": len(job.urls),
+        "poll_url": f"/jobs/{job.id}"
+    }
+
+@bp.route('/jobs', methods=['POST'])
+def submit_job():
+    data = request.get_json(silent=True) or {}
+    urls = data.get('urls', [])
+
+    if not urls or not isinstance(urls, list):
+        return jsonify({"status": "error", "error": "URLs required"}), 400
+
+    session_id = data.get('session_id', 'default_user')
+    job = get_job_queue().submit(urls, session_id=session_id)
+    return jsonify(_job_accepted(job)), 202
+
+@bp.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "error": "Job not found"}), 404
+
+    # Page through completed items: /jobs/<id>?offset=0&limit=50, each result carries its input index
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    # Completion order, so offsets stay valid while items finish out of order
+    results, next_offset = job.page(offset, limit)
+
+    response = job.progress()
+    response["offset"] = offset
+    response["results"] = results
+    response["next_offset"] = next_offset
+    return jsonify(response)
+
+@bp.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = get_job_queue().cancel(job_id)
+    if job is None:
+        return jsonify({"status": "error", "error": "Job not found"}), 404
+    return jsonify(job.progress())
+
 @bp.route('/login', methods=['POST'])
 def login():
     try:
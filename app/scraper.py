@@ -1,24 +1,61 @@
 import os
 import json
 import time
+import atexit
+import threading
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from linkedin_scraper.chromedriver import chrome_service
 from linkedin_scraper import Person
+from linkedin_scraper.urls import canonical_profile_url
+from linkedin_scraper.resources import ResourcePolicy
+from linkedin_scraper import auth, network, timing
+from linkedin_scraper.cookies import LANG_COOKIE, inject as inject_cookies, jars as cookie_jars
+from linkedin_scraper.serialize import profile_dict
+from linkedin_scraper.profiler import profile_driver
+from app import metrics
+from app.driver_pool import DriverPool
+from app.cache import profile_cache
+from app.store import profile_store
 
 # Config
 COOKIES_DIR = "linkedin_session"
 # COOKIES_FILE is now dynamic
 SCRAPED_DATA_DIR = "scraped_data"
 
+# Driver Pool Config (warm browsers shared across requests)
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+DRIVER_POOL_MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "25"))
+DRIVER_POOL_TIMEOUT = int(os.getenv("DRIVER_POOL_TIMEOUT", "120"))
+
+# Read profiles from the API responses the page loads (DOM scraping as fallback)
+SCRAPE_INTERCEPT = os.getenv("SCRAPE_INTERCEPT", "false").lower() == "true"
+
+# Record every WebDriver command and add a hot-spot report to each result (debugging only)
+PROFILE_WEBDRIVER = os.getenv("PROFILE_WEBDRIVER", "false").lower() == "true"
+
+# Resolve www.linkedin.com to another host:port, e.g. the mock server in benchmarks/mock_linkedin.py
+LINKEDIN_HOST_OVERRIDE = os.getenv("LINKEDIN_HOST_OVERRIDE")
+
 # Ensure directories exist
 os.makedirs(COOKIES_DIR, exist_ok=True)
 os.makedirs(SCRAPED_DATA_DIR, exist_ok=True)
 
-def setup_driver():
-    """Chrome Setup - New instance per request for safety in container"""
+def default_resource_policy():
+    """Resource policy from env: RESOURCE_POLICY=default|off, BLOCK_RESOURCE_TYPES=image,font,media"""
+    if os.getenv("RESOURCE_POLICY", "default").lower() == "off":
+        return ResourcePolicy.off()
+    types = os.getenv("BLOCK_RESOURCE_TYPES")
+    if types is None:
+        return ResourcePolicy()
+    return ResourcePolicy(block_types=[t.strip() for t in types.split(",") if t.strip()])
+
+RESOURCE_POLICY = default_resource_policy()
+
+def setup_driver(resource_policy=None):
+    """Chrome Setup - Used by the driver pool and for interactive logins"""
+    policy = resource_policy or RESOURCE_POLICY
     opts = Options()
     
     # Headless mode only if requested (default True for Docker, likely False for local debug)
@@ -29,7 +66,7 @@ def setup_driver():
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--disable-gpu")
     opts.add_argument("--window-size=1920,1080")
-    opts.add_argument("--remote-debugging-port=9222") # Often helps in docker
+    # No fixed --remote-debugging-port: pooled browsers run side by side and would collide on it
     
     # Anti-detect settings
     opts.add_argument("--disable-blink-features=AutomationControlled")
@@ -38,12 +75,26 @@ def setup_driver():
 
     # Force English Language (Crucial for scraping logic that relies on "Experience", "Education" etc.)
     opts.add_argument("--lang=en-US")
-    opts.add_experimental_option('prefs', {'intl.accept_languages': 'en,en_US'})
+    prefs = {'intl.accept_languages': 'en,en_US'}
+    prefs.update(policy.chrome_prefs())
+    opts.add_experimental_option('prefs', prefs)
+
+    # Performance log feeds both the resource report and API interception
+    network.enable_performance_log(opts)
+
+    # URLs and cookie domains stay www.linkedin.com, only the connection goes elsewhere
+    if LINKEDIN_HOST_OVERRIDE:
+        opts.add_argument(f"--host-resolver-rules=MAP www.linkedin.com {LINKEDIN_HOST_OVERRIDE}")
+        opts.add_argument("--ignore-certificate-errors")
 
-    return webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+    driver = webdriver.Chrome(
+        service=chrome_service(),
         options=opts
     )
+    # Skip images, fonts, media and trackers we never read
+    if policy.enabled:
+        policy.apply(driver)
+    return driver
 
 def get_cookie_file(session_id):
     """Returns unique cookie path for a user session"""
@@ -51,55 +102,45 @@ def get_cookie_file(session_id):
     return os.path.join(COOKIES_DIR, f"cookies_{clean_id}.json")
 
 def load_cookies(driver, session_id):
-    """Loads saved session cookies for specific user"""
-    cookie_file = get_cookie_file(session_id)
-    if not os.path.exists(cookie_file):
-        return False
-    
+    """Sets the saved session cookies via CDP; no page load, the next navigation is signed in"""
     try:
-        driver.get("https://www.linkedin.com")
-        time.sleep(2)
-        
-        with open(cookie_file, 'r') as f:
-            cookies = json.load(f)
-        
-        for cookie in cookies:
-            try:
-                # Selenium expects specific keys, and expiry should be int/float
-                if 'sameSite' in cookie and cookie['sameSite'] not in ["Strict", "Lax", "None"]:
-                     del cookie['sameSite'] 
-                driver.add_cookie(cookie)
-            except:
-                pass
-        
+        cookies = cookie_jars.get(get_cookie_file(session_id))
+        if cookies is None:
+            return False
         # FORCE ENGLISH LANGUAGE COOKIE (Critical for scraper library)
-        try:
-            driver.add_cookie({
-                'name': 'lang',
-                'value': 'v=2&lang=en-us',
-                'domain': '.linkedin.com',
-                'path': '/'
-            })
-            print("DEBUG: Injected English language cookie.")
-        except Exception as e:
-            print(f"DEBUG: Failed to inject language cookie: {e}")
-
-        driver.refresh()
-        time.sleep(2)
+        count = inject_cookies(driver, cookies + [LANG_COOKIE])
+        print(f"DEBUG: Injected {count} cookies (incl. English language cookie).")
         return True
     except Exception as e:
         print(f"Error loading cookies: {e}")
         return False
 
 
-# SINGLETON REMOVED FOR SECURITY/ISOLATION
-# Each user needs their own isolated browser instance
+# Browsers are pooled, but isolation is kept: the pool wipes cookies and
+# storage whenever a browser is handed to a different session_id
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+def get_driver_pool():
+    """Returns the process wide driver pool (created on first use)"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool(
+                setup_driver,
+                size=DRIVER_POOL_SIZE,
+                max_uses=DRIVER_POOL_MAX_USES,
+                checkout_timeout=DRIVER_POOL_TIMEOUT
+            )
+            atexit.register(_driver_pool.shutdown)
+        return _driver_pool
 
 def login_to_linkedin(email, password, session_id):
     """Performs automated login and saves cookies for session"""
     driver = None
     try:
-        driver = setup_driver()
+        # Full resources here: the user may have to solve a captcha in this browser
+        driver = setup_driver(resource_policy=ResourcePolicy.off())
         driver.get("https://www.linkedin.com/login")
         time.sleep(2)
         
@@ -115,6 +156,7 @@ def login_to_linkedin(email, password, session_id):
                  # Check if login probably succeeded (url changed or feed visible)
                 if "feed" in driver.current_url or "checkpoint" not in driver.current_url:
                     save_cookies(driver, session_id)
+                    auth.session(session_id).reset()
                     return {"status": "success", "message": "Login successful"}
             except:
                 pass
@@ -136,8 +178,9 @@ def save_manual_cookies(cookie_json_str, session_id):
         # Validate JSON
         cookies = json.loads(cookie_json_str)
         if isinstance(cookies, list):
-            with open(get_cookie_file(session_id), 'w') as f:
-                json.dump(cookies, f)
+            cookie_jars.save(get_cookie_file(session_id), cookies)
+            # New cookies, new login: the next scrape checks it once
+            auth.session(session_id).reset()
             return {"status": "success", "message": "Cookies imported"}
         else:
             return {"status": "error", "message": "Invalid JSON: Must be a list of cookies"}
@@ -147,18 +190,39 @@ def save_manual_cookies(cookie_json_str, session_id):
 def save_cookies(driver, session_id):
     """Saves session cookies to unique file"""
     try:
-        with open(get_cookie_file(session_id), 'w') as f:
-            json.dump(driver.get_cookies(), f)
+        cookie_jars.save(get_cookie_file(session_id), driver.get_cookies())
     except Exception as e:
         print(f"Error saving cookies: {e}")
 
-def get_safe_attribute(obj, attr, default="N/A"):
-    """Helper to safely get attributes from objects"""
-    val = getattr(obj, attr, None)
-    return val if val else default
+def scrape_profile_logic(url, session_id="default", max_age=None, force_refresh=False, sections=None, resource_policy=None):
+    """Main scraping logic. Serves from the profile cache or store unless force_refresh or the entry is older than max_age"""
+    sections = list(Person.SECTIONS if sections is None else sections)
+
+    if not force_refresh:
+        cached = profile_cache.get(url, max_age=max_age, sections=sections)
+        if cached is not None:
+            print(f"DEBUG: Cache hit for {url} ({cached['cache_age']}s old)")
+            metrics.scrapes.inc(status="cached")
+            return cached
+        # Survives restarts and is shared by all workers, the in-memory cache is not
+        stored = profile_store.get(url, max_age=profile_cache.max_age(max_age))
+        if stored is not None and profile_cache.covers(stored, sections):
+            print(f"DEBUG: Profile store hit for {url} ({stored['stored_age']}s old)")
+            profile_cache.set(url, stored)
+            metrics.scrapes.inc(status="stored")
+            return stored
+
+    started = time.monotonic()
+    with timing.collect() as phases:
+        data = _scrape_with_browser(url, session_id, sections, resource_policy)
+    # Where the time went: driver_startup, cookie_load, navigation, wait, extraction, persistence
+    data["timings"] = {name: round(seconds, 3) for name, seconds in phases.items()}
+    metrics.scrapes.inc(status=data["status"])
+    metrics.scrape_seconds.observe(time.monotonic() - started, status=data["status"])
+    return data
 
-def scrape_profile_logic(url, session_id="default"):
-    """Main scraping logic"""
+def _scrape_with_browser(url, session_id, sections, resource_policy):
+    """Scrapes one profile on a pooled browser; always returns a result dict"""
     driver = None
     data = {
         "url": url,
@@ -166,11 +230,25 @@ def scrape_profile_logic(url, session_id="default"):
         "timestamp": datetime.now().isoformat()
     }
     
+    pool = get_driver_pool()
+    failed = False
+
     try:
-        print("DEBUG: Setting up driver...")
-        driver = setup_driver()
-        print("DEBUG: Driver setup complete. Loading cookies...")
-        load_cookies(driver, session_id)
+        print("DEBUG: Checking out pooled driver...")
+        with timing.phase("DriverPool", "wait"):
+            driver = pool.acquire(session_id)
+        policy = resource_policy or RESOURCE_POLICY
+        if resource_policy is not None:
+            resource_policy.apply(driver)
+        # Drop network events left over from the browser's previous request
+        network.reset(driver)
+        if PROFILE_WEBDRIVER:
+            profile_driver(driver).profiler.reset()
+        print("DEBUG: Driver ready. Loading cookies...")
+        with timing.phase("Person", "cookie_load"):
+            load_cookies(driver, session_id)
+        # Browsers of one session share what is known about its login
+        auth.bind(driver, session_id)
             
         print(f"DEBUG: Scraping URL: {url}")
         data["url"] = url 
@@ -179,10 +257,13 @@ def scrape_profile_logic(url, session_id="default"):
         print("DEBUG: Initializing Person object (Starting scrape)...")
         try:
             person = Person(
-                linkedin_url=url,
+                # Tracking params like ?trk= would end up inside the details/... sub page URLs
+                linkedin_url=canonical_profile_url(url),
                 driver=driver,
                 scrape=True,
-                close_on_complete=False 
+                close_on_complete=False,
+                sections=sections,
+                intercept=SCRAPE_INTERCEPT
             )
             print("DEBUG: Person object created. Scrape finished?")
         except Exception as p_err:
@@ -208,82 +289,41 @@ def scrape_profile_logic(url, session_id="default"):
         
         save_cookies(driver, session_id)
         
-        # Extract Data cleanly
-        data["name"] = get_safe_attribute(person, 'name')
-        data["job_title"] = get_safe_attribute(person, 'job_title')
-        data["company"] = get_safe_attribute(person, 'company')
-        data["location"] = get_safe_attribute(person, 'location')
-        
-        about = get_safe_attribute(person, 'about', [])
-        data["about"] = about[0] if about and len(about) > 0 else "N/A"
-        
-        # Experiences
-        data["experiences"] = []
-        for exp in get_safe_attribute(person, 'experiences', []):
-            data["experiences"].append({
-                "position_title": get_safe_attribute(exp, 'position_title'),
-                "institution_name": get_safe_attribute(exp, 'institution_name'),
-                "from_date": get_safe_attribute(exp, 'from_date'),
-                "to_date": get_safe_attribute(exp, 'to_date'),
-                "duration": get_safe_attribute(exp, 'duration'),
-                "location": get_safe_attribute(exp, 'location')
-            })
-
-        # Educations
-        data["educations"] = []
-        for edu in get_safe_attribute(person, 'educations', []):
-            data["educations"].append({
-                "institution_name": get_safe_attribute(edu, 'institution_name'),
-                "degree": get_safe_attribute(edu, 'degree'),
-                "from_date": get_safe_attribute(edu, 'from_date'),
-                "to_date": get_safe_attribute(edu, 'to_date')
-            })
-
-        # Process generic lists
-        data["interests"] = [get_safe_attribute(i, 'institution_name', str(i)) for i in get_safe_attribute(person, 'interests', [])]
-        
-        # Accomplishments
-        data["accomplishments"] = []
-        for acc in get_safe_attribute(person, 'accomplishments', []):
-            data["accomplishments"].append({
-                "category": get_safe_attribute(acc, 'category'),
-                "title": get_safe_attribute(acc, 'title')
-            })
-
-        # Skills (Try to get if available)
-        data["skills"] = [get_safe_attribute(s, 'name', str(s)) for s in get_safe_attribute(person, 'skills', [])]
-        
-        # Certifications
+        # Extract Data cleanly (same profile JSON as scrape_api.py and scrape_batch.py)
+        data["sections"] = sections
+        data.update(profile_dict(person))
+        # Not scraped by the library, kept so the response shape stays the same
+        data["skills"] = []
         data["certifications"] = []
-        for cert in get_safe_attribute(person, 'certifications', []):
-            data["certifications"].append({
-                "name": get_safe_attribute(cert, 'name'),
-                "organization": get_safe_attribute(cert, 'organization')
-            })
-
-        # Languages
         data["languages"] = []
-        for lang in get_safe_attribute(person, 'languages', []):
-             data["languages"].append({
-                "name": get_safe_attribute(lang, 'name'),
-                "proficiency": get_safe_attribute(lang, 'proficiency')
-            })
 
         data["status"] = "success"
+        if policy.enabled:
+            data["resources"] = policy.report(driver)
+        if PROFILE_WEBDRIVER:
+            data["webdriver_profile"] = driver.profiler.report()
+        profile_cache.set(url, data)
         
-        # Save to disk
+        # Upsert into the profile store (written by its own thread)
         if data["name"] != "N/A":
-            filename = f"{SCRAPED_DATA_DIR}/{data['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with timing.phase("Person", "persistence"):
+                profile_store.save(data)
                 
     except Exception as e:
+        failed = True
         data["error"] = str(e)
-    finally:
         if driver:
+            # Could be a logout the redirects didn't show: check actively next time
+            auth.state(driver).suspect(f"scrape failed: {e}")
+    finally:
+        if driver and resource_policy is not None:
+            # Per-call override: put the pool default back before the next request gets this browser
             try:
-                driver.quit()
-            except:
-                pass
+                RESOURCE_POLICY.apply(driver)
+            except Exception:
+                failed = True
+        if driver:
+            # Hand the browser back instead of quitting; recycle it if the scrape broke it
+            pool.release(driver, discard=failed and not pool.is_healthy(driver))
                 
     return data
@@ -0,0 +1,315 @@
+import atexit
+import copy
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from linkedin_scraper import serialize
+from linkedin_scraper.serialize import PROFILE_FIELDS, PROFILE_SECTION_FIELDS
+from linkedin_scraper.urls import canonical_profile_url
+
+PROFILE_DB = os.getenv("PROFILE_DB", os.path.join("scraped_data", "profiles.db"))
+# The writer commits once this many results are queued or after this many seconds
+PROFILE_DB_BATCH_SIZE = int(os.getenv("PROFILE_DB_BATCH_SIZE", "50"))
+PROFILE_DB_FLUSH_INTERVAL = float(os.getenv("PROFILE_DB_FLUSH_INTERVAL", "0.5"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    url TEXT PRIMARY KEY,
+    name TEXT COLLATE NOCASE,
+    company TEXT COLLATE NOCASE,
+    job_title TEXT,
+    scraped_at REAL NOT NULL,
+    version INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiles_name ON profiles (name);
+CREATE INDEX IF NOT EXISTS profiles_company ON profiles (company);
+CREATE INDEX IF NOT EXISTS profiles_scraped_at ON profiles (scraped_at);
+CREATE TABLE IF NOT EXISTS profile_versions (
+    url TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    scraped_at REAL NOT NULL,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (url, version)
+);
+"""
+
+# A re-scrape only bumps the version when the profile itself changed
+UPSERT = """
+INSERT INTO profiles (url, name, company, job_title, scraped_at, version, digest, data)
+VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    name = excluded.name,
+    company = excluded.company,
+    job_title = excluded.job_title,
+    scraped_at = excluded.scraped_at,
+    version = profiles.version + (profiles.digest IS NOT excluded.digest),
+    digest = excluded.digest,
+    data = excluded.data
+"""
+
+RECORD_VERSION = """
+INSERT OR IGNORE INTO profile_versions (url, version, scraped_at, digest, data)
+SELECT url, version, scraped_at, digest, data FROM profiles WHERE url = ?
+"""
+
+_STOP = object()
+
+
+def _column(value):
+    return None if value in (None, "", serialize.MISSING) else value
+
+
+def scraped_sections(data):
+    """The Person sections `data` covers; results without a "sections" list cover all of them"""
+    sections = data.get("sections")
+    return set(PROFILE_SECTION_FIELDS) if sections is None else set(sections) & set(PROFILE_SECTION_FIELDS)
+
+
+def profile_digest(data):
+    """
+    Hash of the profile fields of the sections `data` covers; timestamps,
+    timings, cache markers and sections that weren't scraped don't count
+    """
+    covered = set()
+    for section in scraped_sections(data):
+        covered.update(PROFILE_SECTION_FIELDS[section])
+    profile = {name: data.get(name) for name in PROFILE_FIELDS if name in covered}
+    return hashlib.sha1(serialize.dumps(profile).encode("utf-8")).hexdigest()
+
+
+def merge_sections(stored, data):
+    """
+    `stored` with the sections scraped in `data` replaced, so a partial scrape
+    (sections=["top_card"]) doesn't wipe the experiences etc. kept from an earlier one
+    """
+    merged = dict(stored)
+    for key, value in data.items():
+        if key not in PROFILE_FIELDS:
+            merged[key] = value
+    scraped = scraped_sections(data)
+    for section in scraped:
+        for name in PROFILE_SECTION_FIELDS[section]:
+            merged[name] = data.get(name)
+    merged["sections"] = [section for section in PROFILE_SECTION_FIELDS if section in scraped | scraped_sections(stored)]
+    return merged
+
+
+class ProfileStore:
+    """
+    SQLite store of successful profile scrapes, one row per canonical profile URL.
+
+    `save()` only queues the result; a single writer thread upserts queued
+    results in batched transactions and records a new row in profile_versions
+    whenever a profile's content changed. A result that only covers some
+    sections is merged into the stored row instead of replacing it. Reads run on per-thread connections
+    and never wait for the writer (WAL mode).
+    """
+
+    def __init__(self, path=PROFILE_DB, batch_size=PROFILE_DB_BATCH_SIZE, flush_interval=PROFILE_DB_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writer = None
+        self.written = 0
+        self.errors = 0
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="profile-store-writer", daemon=True)
+                self._writer.start()
+
+    # Writing
+
+    def save(self, data):
+        """
+        Queues a successful result for the writer thread. A copy is queued, so
+        later changes to `data` (timings, cache markers) don't end up in the row.
+        """
+        url = data.get("linkedin_url") or data.get("url")
+        if not url:
+            return
+        self._ensure_writer()
+        self._queue.put((canonical_profile_url(url), time.time(), copy.deepcopy(data)))
+
+    def _write_loop(self):
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while item is not _STOP and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                stop = batch[-1] is _STOP
+                rows = [entry for entry in batch if entry is not _STOP]
+                try:
+                    if rows:
+                        self._write(conn, rows)
+                except Exception as e:
+                    self.errors += len(rows)
+                    print(f"DEBUG: Profile store write failed ({len(rows)} results): {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write(self, conn, rows):
+        with conn:
+            for url, scraped_at, data in rows:
+                if scraped_sections(data) != set(PROFILE_SECTION_FIELDS):
+                    stored = conn.execute("SELECT data FROM profiles WHERE url = ?", (url,)).fetchone()
+                    if stored is not None:
+                        data = merge_sections(json.loads(stored[0]), data)
+                conn.execute(UPSERT, (
+                    url,
+                    _column(data.get("name")),
+                    _column(data.get("company")),
+                    _column(data.get("job_title")),
+                    scraped_at,
+                    profile_digest(data),
+                    serialize.dumps(data),
+                ))
+                conn.execute(RECORD_VERSION, (url,))
+        self.written += len(rows)
+
+    def flush(self):
+        """Blocks until everything queued so far is committed"""
+        self._queue.join()
+
+    def close(self):
+        with self._lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join()
+
+    # Reading
+
+    def get(self, url, max_age=None):
+        """Latest stored result for `url` (with stored_age in seconds) or None"""
+        row = self._reader().execute(
+            "SELECT scraped_at, data FROM profiles WHERE url = ?", (canonical_profile_url(url),)
+        ).fetchone()
+        if row is None:
+            return None
+        age = time.time() - row[0]
+        if max_age is not None and age > max_age:
+            return None
+        data = json.loads(row[1])
+        data["stored_age"] = round(age, 1)
+        return data
+
+    def history(self, url):
+        """Every stored version of `url`, newest first"""
+        rows = self._reader().execute(
+            "SELECT version, scraped_at, data FROM profile_versions WHERE url = ? ORDER BY version DESC",
+            (canonical_profile_url(url),),
+        )
+        return [{"version": version, "scraped_at": scraped_at, "data": json.loads(data)} for version, scraped_at, data in rows]
+
+    def find(self, name=None, company=None, since=None, limit=100, offset=0):
+        """Latest results matching name/company (case-insensitive) scraped at or after `since` (epoch seconds)"""
+        where, params = self._where(name, company, since)
+        rows = self._reader().execute(
+            f"SELECT data FROM profiles {where} ORDER BY scraped_at DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def iter_results(self, name=None, company=None, since=None, batch_size=1000):
+        """
+        Every matching result, oldest first, with scraped_at (epoch seconds) and
+        url (the canonical profile URL it is stored under) set from the row.
+        Streams through a cursor on its own connection, so memory stays flat.
+        """
+        where, params = self._where(name, company, since)
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f"SELECT url, scraped_at, data FROM profiles {where} ORDER BY scraped_at", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for url, scraped_at, data in rows:
+                    result = json.loads(data)
+                    result["url"] = url
+                    result["scraped_at"] = scraped_at
+                    yield result
+        finally:
+            conn.close()
+
+    def count(self, name=None, company=None, since=None):
+        where, params = self._where(name, company, since)
+        return self._reader().execute(f"SELECT COUNT(*) FROM profiles {where}", params).fetchone()[0]
+
+    @staticmethod
+    def _where(name, company, since):
+        clauses, params = [], []
+        if name:
+            clauses.append("name = ?")
+            params.append(name)
+        if company:
+            clauses.append("company = ?")
+            params.append(company)
+        if since is not None:
+            clauses.append("scraped_at >= ?")
+            params.append(since)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def stats(self):
+        try:
+            profiles, versions = self._reader().execute(
+                "SELECT (SELECT COUNT(*) FROM profiles), (SELECT COUNT(*) FROM profile_versions)"
+            ).fetchone()
+        except sqlite3.Error:
+            profiles = versions = None
+        return {
+            "path": self.path,
+            "profiles": profiles,
+            "versions": versions,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "errors": self.errors,
+        }
+
+
+profile_store = ProfileStore()
+
+# Commit whatever is still queued when the process exits
+atexit.register(profile_store.close)
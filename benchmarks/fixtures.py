@@ -0,0 +1,326 @@
+"""
+HTML fixtures with the structure the scrapers in linkedin_scraper/ expect.
+
+The captured debug/linkedin_profile.html only covers the main profile page,
+so the details pages, the company About and People tabs, job cards, job
+postings and the login flow pages are generated here. Contents are
+deterministic (seeded) so benchmark runs are comparable; `count` scales the
+lists to exercise the per-item hot paths.
+"""
+import os
+import random
+from html import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE_FIXTURE = os.path.join(ROOT, "debug", "linkedin_profile.html")
+
+TITLES = ["Software Engineer", "Senior Data Scientist", "Product Manager", "Engineering Manager", "Consultant", "Working Student"]
+COMPANIES = ["Acme GmbH", "Globex", "Initech", "Umbrella Corp", "Stark Industries", "Wayne Enterprises"]
+SCHOOLS = ["TU München", "ETH Zürich", "University of Oxford", "RWTH Aachen", "Stanford University"]
+DEGREES = ["Master of Science - MS, Computer Science", "Bachelor of Science - BS, Physics", "PhD, Mathematics"]
+CITIES = ["Berlin, Germany", "Munich, Bavaria, Germany", "Zurich, Switzerland", "London, England, United Kingdom"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Elif", "Felix", "Greta", "Hannah", "Jonas", "Lena", "Mehmet", "Sofia"]
+LAST_NAMES = ["Müller", "Schmidt", "Novak", "Rossi", "Yilmaz", "Dubois", "Keller", "Jansen", "Costa", "Weber"]
+WORDS = "data platform scale team lead customers pipeline python cloud latency design review growth product launch".split()
+
+
+def _sentence(rng, words=18):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _page(title, body, nav=True):
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{escape(title)} | LinkedIn</title></head>
+<body>{_NAV if nav else ""}
+{body}
+</body></html>"""
+
+
+_NAV = """<nav class="global-nav"><a class="global-nav__primary-link" href="/feed/">Home</a><div class="global-nav__me">me</div></nav>"""
+
+
+def _details_page(title, items):
+    return _page(title, f"""<main><section class="artdeco-card">
+<h2>{escape(title)}</h2>
+<div class="pvs-list__container"><div><div><ul>
+{"".join(items)}
+</ul></div></div></div>
+</section></main>""")
+
+
+def _entity(href, outer_spans, description, inner=""):
+    outer = "".join(f"<div><span>{escape(text)}</span></div>" for text in outer_spans)
+    text = f'<div class="pvs-list__container"><div><div><ul>{inner}</ul></div></div></div>' if inner else f"<div><span>{escape(description)}</span></div>"
+    return f"""<li class="pvs-list__paged-list-item">
+<div data-view-name="profile-component-entity">
+  <div><a href="{href}"><img alt="" src="data:,"></a></div>
+  <div>
+    <div><div>{outer}</div></div>
+    <div>{text}</div>
+  </div>
+</div></li>
+"""
+
+
+def _date_range(rng):
+    start = rng.randint(2005, 2021)
+    end = start + rng.randint(0, 3)
+    current = rng.random() < 0.2
+    to_date = "Present" if current else f"{rng.choice(MONTHS)} {end}"
+    return f"{rng.choice(MONTHS)} {start} - {to_date} · {rng.randint(1, 4)} yrs {rng.randint(1, 11)} mos"
+
+
+def experience_page(count=40, seed=1):
+    """details/experience with `count` positions; every 8th one is a company with several roles"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        href = f"https://www.linkedin.com/company/{1000 + i}/"
+        company = rng.choice(COMPANIES)
+        if i % 8 == 7:
+            # Grouped roles: company / total duration / location, roles in a nested list.
+            # The nested entities have a single child, so the outer loop skips them.
+            roles = "".join(f"""<li class="pvs-list__paged-list-item"><div data-view-name="profile-component-entity"><a href="{href}">
+<div><div><span>{escape(rng.choice(TITLES))}</span></div></div>
+<span><span>{escape(_date_range(rng))}</span></span>
+<span><span>{escape(rng.choice(CITIES))}</span></span></a></div></li>""" for _ in range(3))
+            items.append(_entity(href, [company, f"Full-time · {rng.randint(2, 9)} yrs", rng.choice(CITIES)], "", inner=roles))
+        else:
+            items.append(_entity(
+                href,
+                [rng.choice(TITLES), f"{company} · Full-time", _date_range(rng), rng.choice(CITIES)],
+                _sentence(rng, 40),
+            ))
+    return _details_page("Experience", items)
+
+
+def education_page(count=10, seed=2):
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        start = rng.randint(2000, 2018)
+        items.append(_entity(
+            f"https://www.linkedin.com/school/{2000 + i}/",
+            [rng.choice(SCHOOLS), rng.choice(DEGREES), f"{start} - {start + rng.randint(2, 5)}"],
+            _sentence(rng, 25),
+        ))
+    return _details_page("Education", items)
+
+
+def company_about_page(seed=3):
+    rng = random.Random(seed)
+    fields = [
+        ("Website", "https://www.acme.example"),
+        ("Industry", "Software Development"),
+        ("Company size", "1,001-5,000 employees"),
+        ("Headquarters", rng.choice(CITIES)),
+        ("Type", "Privately Held"),
+        ("Founded", str(rng.randint(1950, 2015))),
+        ("Specialties", ", ".join(rng.sample(WORDS, 6))),
+    ]
+    grid = "".join(f"<dt>{escape(k)}</dt><dd>{escape(v)}</dd>" for k, v in fields)
+    return _page("Acme GmbH: About", f"""<main>
+<section class="org-top-card"><h1 class="org-top-card-summary__title">Acme GmbH</h1>
+<div class="mt1"><span>See all {rng.randint(1000, 5000)} employees on LinkedIn</span></div>
+<nav class="org-page-navigation__items "><a href="about/">About</a><a href="people/">People</a></nav></section>
+<section class="artdeco-card org-page-details-module__card-spacing artdeco-card org-about-module__margin-bottom">
+<h2>Overview</h2><p>{escape(_sentence(rng, 60))}</p>
+<dl>{grid}</dl>
+</section>
+</main>""")
+
+
+def job_cards_page(count=25, seed=4):
+    rng = random.Random(seed)
+    cards = "".join(f"""<li class="job-card-list">
+<a class="job-card-list__title" href="/jobs/view/{4000000 + i}/">{escape(rng.choice(TITLES))}</a>
+<div class="artdeco-entity-lockup__subtitle">{escape(rng.choice(COMPANIES))}</div>
+<div class="job-card-container__metadata-wrapper">{escape(rng.choice(CITIES))}</div>
+</li>""" for i in range(count))
+    return _page("Jobs", f"""<main><div class="jobs-search-results-list"><ul>{cards}</ul></div></main>""")
+
+
+def people_items(start, count, seed=5):
+    """<li> entries of a company People tab, `start` keeps names and URLs unique across pages"""
+    items = []
+    for i in range(start, start + count):
+        rng = random.Random(seed * 100003 + i)
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        # Four text lines: name, degree badge, degree, designation (what __parse_employee__ splits on)
+        items.append(f"""<li class="org-people-profile-card__profile-card-spacing" style="min-height:120px">
+<a href="/in/mock-employee-{i}/"><span dir="ltr">{escape(name)}</span></a>
+<div>· {rng.choice(["2nd", "3rd+"])}</div>
+<div>{rng.choice(["2nd", "3rd+"])} degree connection</div>
+<div>{escape(rng.choice(TITLES))} at Acme GmbH</div>
+</li>""")
+    return "".join(items)
+
+
+def people_page(count=10, pages=1, seed=5):
+    """
+    Company People tab with the first `count` employees. Further pages of the
+    same size are fetched from people/more?page=N when the window is scrolled
+    to the bottom or "Show more results" is clicked; the button disappears
+    after the last page.
+    """
+    more = """<button class="scaffold-finite-scroll__load-button" type="button">Show more results</button>""" if pages > 1 else ""
+    return _page("Acme GmbH: People", f"""<main>
+<section class="org-top-card"><h1 class="org-top-card-summary__title">Acme GmbH</h1></section>
+<div class="scaffold-finite-scroll"><ul class="list-style-none scaffold-finite-scroll__content">
+{people_items(0, count, seed)}
+</ul>{more}</div>
+</main>
+<script>
+(function () {{
+  var next = 1, pages = {pages}, loading = false;
+  var list = document.querySelector('.list-style-none');
+  function load() {{
+    if (loading || next >= pages) return;
+    loading = true;
+    fetch(location.pathname.replace(/\/?$/, '/') + 'more?page=' + next)
+      .then(function (r) {{ if (!r.ok) throw new Error(r.status); return r.text(); }})
+      .then(function (items) {{
+        list.insertAdjacentHTML('beforeend', items);
+        next += 1;
+        if (next >= pages) {{
+          var button = document.querySelector('.scaffold-finite-scroll__load-button');
+          if (button) button.remove();
+        }}
+      }})
+      .catch(function () {{}})
+      .then(function () {{ loading = false; }});
+  }}
+  window.addEventListener('scroll', function () {{
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) load();
+  }});
+  var button = document.querySelector('.scaffold-finite-scroll__load-button');
+  if (button) button.addEventListener('click', load);
+}})();
+</script>""")
+
+
+def job_id(keywords, index):
+    """Stable posting id for the index-th search result"""
+    return 4000000 + (sum(map(ord, keywords)) * 7919 + index) % 900000
+
+
+def job_search_page(keywords="", start=0, total=100, page_size=25, seed=4):
+    """Search results for `keywords` from offset `start`, paginated like LinkedIn with ?start="""
+    start = max(0, min(start, total))
+    cards = []
+    for i in range(start, min(start + page_size, total)):
+        rng = random.Random(seed * 100003 + i)
+        posting = job_id(keywords, i)
+        cards.append(f"""<li class="jobs-search-results__list-item" data-occludable-job-id="{posting}"><div class="job-card-list" data-job-id="{posting}">
+<a class="job-card-list__title" href="/jobs/view/{posting}/">{escape(rng.choice(TITLES))}</a>
+<div class="artdeco-entity-lockup__subtitle">{escape(rng.choice(COMPANIES))}</div>
+<div class="job-card-container__metadata-wrapper">{escape(rng.choice(CITIES))}</div>
+</div></li>""")
+    page_count = (total + page_size - 1) // page_size
+    current = start // page_size
+    pages = "".join(
+        f'<li class="artdeco-pagination__indicator{" active selected" if p == current else ""}" data-test-pagination-page-btn="{p + 1}">'
+        f'<a href="?keywords={escape(keywords)}&start={p * page_size}"><span>{p + 1}</span></a></li>'
+        for p in range(page_count)
+    )
+    return _page(f"{keywords} Jobs", f"""<main>
+<div class="jobs-search-results-list" style="height:800px;overflow-y:auto">
+<div class="jobs-search-results-list__subtitle"><span>{total:,} results</span></div>
+<ul class="scaffold-layout__list-container">{"".join(cards)}</ul>
+{"" if cards else '<div class="jobs-search-no-results-banner">No matching jobs found.</div>'}
+<div class="jobs-search-pagination"><ul class="artdeco-pagination__pages">{pages}</ul></div>
+</div>
+</main>""")
+
+
+def recommended_jobs_page(count=6, seed=6):
+    """/jobs/ landing page: four card areas, the second one is not a job list"""
+    rng = random.Random(seed)
+
+    def area(title, offset):
+        items = "".join(f"""<li class="jobs-job-board-list__item">
+<a class="job-card-list__title" href="/jobs/view/{4900000 + offset + i}/">{escape(rng.choice(TITLES))}</a>
+<div class="artdeco-entity-lockup__subtitle">{escape(rng.choice(COMPANIES))}</div>
+<div class="job-card-container__metadata-wrapper">{escape(rng.choice(CITIES))}</div>
+</li>""" for i in range(count))
+        return f'<section class="artdeco-card"><h2>{title}</h2><ul>{items}</ul></section>'
+
+    return _page("Jobs", f"""<main><div class="scaffold-finite-scroll__content">
+{area("Top job picks for you", 0)}
+<section class="artdeco-card"><h2>Job collections</h2></section>
+{area("Still hiring", 100)}
+{area("More jobs for you", 200)}
+</div></main>""")
+
+
+def job_details_page(posting, seed=7):
+    """/jobs/view/<id>/; applicant count and salary card are left out on some postings"""
+    rng = random.Random(seed * 100003 + posting)
+    company = rng.choice(COMPANIES)
+    title = rng.choice(TITLES)
+    applicants = f'<span class="jobs-unified-top-card__applicant-count">{rng.randint(1, 200)} applicants</span>' if rng.random() < 0.7 else ""
+    salary = f'<div class="jobs-unified-description__salary-main-rail-card"><h2>Pay</h2><p>€{rng.randint(50, 90)}K/yr - €{rng.randint(91, 140)}K/yr</p></div>' if rng.random() < 0.4 else ""
+    paragraphs = "".join(f"<p>{escape(_sentence(rng, 30))}</p>" for _ in range(6))
+    return _page(f"{title} | {company}", f"""<main>
+<div class="job-details-jobs-unified-top-card">
+<h1 class="job-details-jobs-unified-top-card__job-title">{escape(title)}</h1>
+<div class="job-details-jobs-unified-top-card__company-name"><a href="/company/{company.split()[0].lower()}/life/">{escape(company)}</a></div>
+<div class="job-details-jobs-unified-top-card__primary-description-container">
+<span>{escape(rng.choice(CITIES))}</span><span>·</span><span>Reposted</span><span>{rng.randint(1, 4)} weeks ago</span>
+</div>
+{applicants}
+</div>
+<article class="jobs-description jobs-description--collapsed"><h2>About the job</h2>
+<div class="jobs-description__content">{paragraphs}</div>
+<button class="jobs-description__footer-button" type="button">See more</button>
+</article>
+{salary}
+</main>
+<script>
+document.querySelector('.jobs-description button').addEventListener('click', function () {{
+  this.parentNode.classList.toggle('jobs-description--collapsed');
+  this.textContent = this.parentNode.classList.contains('jobs-description--collapsed') ? 'See more' : 'See less';
+}});
+</script>""")
+
+
+def connections_page(count=20, seed=8):
+    rng = random.Random(seed)
+    cards = "".join(f"""<li class="mn-connection-card">
+<a class="mn-connection-card__link" href="/in/mock-contact-{i}/"></a>
+<div class="mn-connection-card__details">
+<span class="mn-connection-card__name">{escape(rng.choice(FIRST_NAMES))} {escape(rng.choice(LAST_NAMES))}</span>
+<span class="mn-connection-card__occupation">{escape(rng.choice(TITLES))}</span>
+</div></li>""" for i in range(count))
+    return _page("Connections", f'<main><section class="mn-connections"><ul>{cards}</ul></section></main>')
+
+
+def feed_page():
+    return _page("Feed", '<main><div class="feed-shared-update-v2">Welcome back</div></main>')
+
+
+def login_page(error=None):
+    """Sign-in form posting to /checkpoint/lg/login-submit, no global nav"""
+    alert = f'<div id="error-for-password" role="alert">{escape(error)}</div>' if error else ""
+    return _page("Sign In", f"""<main class="app__content"><form class="login__form" method="post" action="/checkpoint/lg/login-submit">
+<input id="username" name="session_key" type="text">
+<input id="password" name="session_password" type="password">
+{alert}
+<button class="btn__primary--large" type="submit">Sign in</button>
+</form></main>""", nav=False)
+
+
+def checkpoint_page():
+    return _page("Security Verification", """<main><h1>Let's do a quick security check</h1>
+<form id="captcha-challenge"><button type="submit">Verify</button></form></main>""", nav=False)
+
+
+def authwall_page():
+    return _page("Sign Up", """<main class="authwall"><h1>Join LinkedIn</h1>
+<a class="authwall-join-form__form-toggle--bottom" href="/login">Sign in</a></main>""", nav=False)
+
+
+def profile_page():
+    with open(PROFILE_FIXTURE, encoding="utf-8") as f:
+        return f.read()
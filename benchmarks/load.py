@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Load test: Flask app -> driver pool -> Person against the mock LinkedIn.
+
+Start the mock with --tls and the app with LINKEDIN_HOST_OVERRIDE pointing
+at it (see benchmarks/mock_linkedin.py), then:
+
+    python -m benchmarks.load --profiles 200 --concurrency 8
+    python -m benchmarks.load --batch --profiles 50          # one streamed /scrape/batch request
+
+Each profile URL is unique and sent with force_refresh, so every request
+hits a browser. Reports throughput, latency percentiles and the result
+status mix; the app's /metrics has the per-phase breakdown.
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Any li_at value passes the mock's login check
+MOCK_COOKIES = [{"name": "li_at", "value": "mock-load-test", "domain": ".linkedin.com", "path": "/", "secure": True}]
+
+
+def post(url, payload, timeout, accept="application/json"):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", "Accept": accept},
+    )
+    return urllib.request.urlopen(request, timeout=timeout)
+
+
+def scrape_one(app, url, session_id, sections, timeout):
+    payload = {"url": url, "session_id": session_id, "force_refresh": True}
+    if sections:
+        payload["sections"] = sections
+    started = time.perf_counter()
+    try:
+        with post(app + "/scrape", payload, timeout) as response:
+            status = json.load(response).get("status", "unknown")
+    except urllib.error.HTTPError as e:
+        status = f"http_{e.code}"
+    except Exception as e:
+        status = type(e).__name__
+    return status, time.perf_counter() - started
+
+
+def scrape_batch(app, urls, session_id, timeout):
+    """One streamed batch request; latency is measured per NDJSON line"""
+    started = time.perf_counter()
+    results = []
+    with post(app + "/scrape/batch", {"urls": urls, "session_id": session_id, "stream": True}, timeout, "application/x-ndjson") as response:
+        for line in response:
+            if line.strip():
+                results.append((json.loads(line).get("status", "unknown"), time.perf_counter() - started))
+    return results
+
+
+def percentile(values, share):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(share * (len(values) - 1))))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the app against the mock LinkedIn")
+    parser.add_argument("--app", default="http://127.0.0.1:5000", help="base URL of the Flask app")
+    parser.add_argument("--profiles", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--session-id", default="load-test")
+    parser.add_argument("--sections", help="comma separated, e.g. top_card,experiences")
+    parser.add_argument("--batch", action="store_true", help="send all profiles as one streamed /scrape/batch")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args(argv)
+
+    sections = [s.strip() for s in args.sections.split(",")] if args.sections else None
+    # Unique slugs keep the profile cache out of the measurement
+    run_id = int(time.time())
+    urls = [f"https://www.linkedin.com/in/mock-load-{run_id}-{i}/" for i in range(args.profiles)]
+
+    with post(args.app + "/cookies", {"session_id": args.session_id, "cookies": json.dumps(MOCK_COOKIES)}, 30):
+        pass
+
+    started = time.perf_counter()
+    if args.batch:
+        results = scrape_batch(args.app, urls, args.session_id, args.timeout)
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(
+                lambda url: scrape_one(args.app, url, args.session_id, sections, args.timeout), urls))
+    elapsed = time.perf_counter() - started
+
+    latencies = [seconds for _, seconds in results]
+    report = {
+        "profiles": len(results),
+        "concurrency": "batch executor" if args.batch else args.concurrency,
+        "seconds": round(elapsed, 2),
+        "profiles_per_minute": round(len(results) / elapsed * 60, 2) if elapsed else 0,
+        "latency_p50": round(percentile(latencies, 0.5), 2),
+        "latency_p95": round(percentile(latencies, 0.95), 2),
+        "latency_p99": round(percentile(latencies, 0.99), 2),
+        "status": dict(Counter(status for status, _ in results)),
+    }
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Mock LinkedIn for end-to-end and load tests.
+
+Serves profile (+ details/experience, details/education), company
+about/people, jobs, job search and job posting pages with the class names
+the scrapers in linkedin_scraper/ expect, plus the login flow. On top of
+that it can slow every page down and inject the failures a real scrape
+runs into:
+
+    --latency 0.4 --jitter 0.2    seconds added to every page
+    --checkpoint-rate 0.01        share of pages redirected to /checkpoint/challenge/
+    --rate-limit-rate 0.02        share of pages answered with 429 + Retry-After
+    --error-rate 0.01             share of pages answered with 500
+    --require-login               pages without an li_at cookie redirect to /authwall
+
+Any email/password signs in (li_at cookie). People and job search results
+are paginated (--people, --people-page-size, --jobs, --jobs-page-size).
+Request counts per page kind and status are served on /__mock__/stats.
+
+To run the app against it, serve HTTPS and let Chrome resolve
+www.linkedin.com to the mock, so canonical URLs and cookie domains stay
+untouched:
+
+    python -m benchmarks.mock_linkedin --tls --port 8443
+    LINKEDIN_HOST_OVERRIDE=127.0.0.1:8443 gunicorn ...
+    python -m benchmarks.load --profiles 200 --concurrency 8
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.cookies import SimpleCookie
+from urllib.parse import quote
+
+from . import fixtures
+from .server import FixtureServer, _cached, html, redirect
+
+# Never slowed down or failed: the login flow and the failure pages themselves
+EXEMPT = ("/login", "/checkpoint/", "/authwall", "/uas/", "/__mock__/")
+
+
+def _first(query, key, default=""):
+    return (query.get(key) or [default])[0]
+
+
+def _int(query, key, default=0):
+    try:
+        return int(_first(query, key, default))
+    except ValueError:
+        return default
+
+
+def self_signed_cert(directory, host="www.linkedin.com"):
+    """(certfile, keyfile) for `host`, generated with the openssl CLI"""
+    if shutil.which("openssl") is None:
+        raise RuntimeError("openssl not found, pass --cert/--key instead")
+    cert = os.path.join(directory, "mock-linkedin.crt")
+    key = os.path.join(directory, "mock-linkedin.key")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "30",
+         "-keyout", key, "-out", cert, "-subj", f"/CN={host}",
+         "-addext", f"subjectAltName=DNS:{host},DNS:*.linkedin.com,DNS:localhost,IP:127.0.0.1"],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return cert, key
+
+
+class MockLinkedIn(FixtureServer):
+    """FixtureServer with LinkedIn's page layout, latency and failure injection"""
+
+    def __init__(self, port=0, host="127.0.0.1", tls=None, latency=0.0, jitter=0.0,
+                 checkpoint_rate=0.0, rate_limit_rate=0.0, error_rate=0.0, retry_after=30,
+                 require_login=False, people=100, people_page_size=10, jobs=100, jobs_page_size=25,
+                 experiences=12, educations=3, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.checkpoint_rate = checkpoint_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.require_login = require_login
+        self.people = people
+        self.people_page_size = people_page_size
+        self.jobs = jobs
+        self.jobs_page_size = jobs_page_size
+        self.experiences = experiences
+        self.educations = educations
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+        super().__init__(self.mock_routes(), port=port, host=host, tls=tls)
+
+    def mock_routes(self):
+        people_pages = max(1, -(-self.people // self.people_page_size))
+        return [
+            (r"^/?$", lambda m, q: html(_cached("feed_page"))),
+            (r"^/feed/?$", lambda m, q: html(_cached("feed_page"))),
+            (r"^/login/?$", lambda m, q: html(_cached("login_page"))),
+            (r"^/(checkpoint/lg/login-submit|uas/login-submit)/?$", self.login_submit),
+            (r"^/checkpoint/.*$", lambda m, q: html(_cached("checkpoint_page"))),
+            (r"^/authwall/?$", lambda m, q: html(_cached("authwall_page"))),
+            (r"^/__mock__/stats/?$", lambda m, q: (200, {"Content-Type": "application/json"}, json.dumps(self.stats()))),
+            (r"^/in/[^/]+/details/experience/?$", lambda m, q: html(_cached("experience_page", self.experiences))),
+            (r"^/in/[^/]+/details/education/?$", lambda m, q: html(_cached("education_page", self.educations))),
+            (r"^/in/[^/]+/?$", lambda m, q: html(_cached("profile_page"))),
+            (r"^/mynetwork/invite-connect/connections/?$", lambda m, q: html(_cached("connections_page"))),
+            (r"^/company/[^/]+/people/more/?$", self.people_more),
+            (r"^/company/[^/]+/people/?$", lambda m, q: html(_cached("people_page", min(self.people, self.people_page_size), people_pages))),
+            (r"^/company/[^/]+(/about)?/?$", lambda m, q: html(_cached("company_about_page"))),
+            (r"^/jobs/view/(\d+)/?$", lambda m, q: html(_cached("job_details_page", int(m.group(1))))),
+            (r"^/jobs/search/?$", self.job_search),
+            (r"^/jobs/?$", lambda m, q: html(_cached("recommended_jobs_page"))),
+        ]
+
+    def login_submit(self, match, query):
+        if not _first(query, "session_key") or not _first(query, "session_password"):
+            return html(_cached("login_page", "Please enter your email and password."), 400)
+        token = "mock-%016x" % self._random().getrandbits(64)
+        return redirect("/feed/", headers={"Set-Cookie": f"li_at={token}; Path=/; Secure; HttpOnly"})
+
+    def people_more(self, match, query):
+        page = _int(query, "page", 1)
+        start = page * self.people_page_size
+        if page < 1 or start >= self.people:
+            return html("", 404)
+        return html(fixtures.people_items(start, min(self.people_page_size, self.people - start)))
+
+    def job_search(self, match, query):
+        keywords = _first(query, "keywords")
+        return html(_cached("job_search_page", keywords, _int(query, "start"), self.jobs, self.jobs_page_size))
+
+    def _random(self):
+        with self._rng_lock:
+            return random.Random(self._rng.getrandbits(32))
+
+    def _count(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(sorted(self._stats.items()))
+
+    def inject(self, path, request):
+        """Failure response for this page view, or None to serve it"""
+        if self.require_login:
+            cookie = SimpleCookie(request.headers.get("Cookie", "") if request is not None else "")
+            if "li_at" not in cookie:
+                return redirect("/authwall?sessionRedirect=" + quote(path, safe=""))
+        rng = self._random()
+        roll = rng.random()
+        if roll < self.checkpoint_rate:
+            return redirect("/checkpoint/challenge/?original_referer=" + quote(path, safe=""))
+        roll -= self.checkpoint_rate
+        if roll < self.rate_limit_rate:
+            return 429, {"Content-Type": "text/plain", "Retry-After": str(self.retry_after)}, "Too Many Requests"
+        roll -= self.rate_limit_rate
+        if roll < self.error_rate:
+            return html("<h1>Something went wrong</h1>", 500)
+        return None
+
+    def handle(self, path, query, request=None):
+        kind = path.strip("/").split("/")[0] or "feed"
+        if not path.startswith(EXEMPT):
+            delay = self.latency + self.jitter * (2 * self._random().random() - 1)
+            if delay > 0:
+                time.sleep(delay)
+            response = self.inject(path, request)
+            if response is not None:
+                self._count(f"{kind} {response[0]}")
+                return response
+        response = super().handle(path, query, request)
+        self._count(f"{kind} {response[0]}")
+        return response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mock LinkedIn server for end-to-end and load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--tls", action="store_true", help="serve HTTPS (self-signed unless --cert/--key are given)")
+    parser.add_argument("--cert")
+    parser.add_argument("--key")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every page")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds of random latency")
+    parser.add_argument("--checkpoint-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=30, help="Retry-After of the injected 429s")
+    parser.add_argument("--require-login", action="store_true")
+    parser.add_argument("--people", type=int, default=100, help="employees on the company People tab")
+    parser.add_argument("--people-page-size", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=100, help="results per job search")
+    parser.add_argument("--jobs-page-size", type=int, default=25)
+    parser.add_argument("--experiences", type=int, default=12)
+    parser.add_argument("--educations", type=int, default=3)
+    parser.add_argument("--seed", type=int, help="makes the injected failures reproducible")
+    args = parser.parse_args(argv)
+
+    cert_dir = None
+    tls = None
+    if args.cert and args.key:
+        tls = (args.cert, args.key)
+    elif args.tls:
+        cert_dir = tempfile.mkdtemp(prefix="mock-linkedin-")
+        tls = self_signed_cert(cert_dir)
+
+    server = MockLinkedIn(
+        port=args.port, host=args.host, tls=tls,
+        latency=args.latency, jitter=args.jitter,
+        checkpoint_rate=args.checkpoint_rate, rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate, retry_after=args.retry_after, require_login=args.require_login,
+        people=args.people, people_page_size=args.people_page_size,
+        jobs=args.jobs, jobs_page_size=args.jobs_page_size,
+        experiences=args.experiences, educations=args.educations, seed=args.seed,
+    )
+    print(f"[mock] serving on {server.base_url}", file=sys.stderr)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        if cert_dir:
+            shutil.rmtree(cert_dir, ignore_errors=True)
+        print(f"[mock] {json.dumps(server.stats())}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
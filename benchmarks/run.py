@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Offline extraction benchmarks.
+
+Serves the fixtures from a local HTTP server, loads each page once in
+headless Chrome and then runs one extraction path on it repeatedly: top
+card, experiences, educations, company About, job cards and job details,
+each with the webdriver, lxml and JS extractor backends where they exist.
+The parse/* cases run the lxml parsers without a browser.
+
+Per case it reports ops/sec, WebDriver commands per op and peak Python
+memory. Results are written to benchmarks/results/ and can be compared
+with an earlier run:
+
+    python -m benchmarks.run                      # all cases
+    python -m benchmarks.run experiences          # cases whose name contains "experiences"
+    python -m benchmarks.run --compare latest     # diff against the previous result file
+    python -m benchmarks.run --no-browser         # parse/* only, no Chrome needed
+
+Set CHROMEDRIVER_OFFLINE=true so chromedriver resolution never touches the network.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+
+from linkedin_scraper import Person, Company, Job, JobSearch, parsers
+from linkedin_scraper.chromedriver import chrome_service
+from linkedin_scraper.profiler import profile_driver
+from . import fixtures
+from .server import FixtureServer
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+PROFILE_PATH = "/in/bench-user/"
+JOB_PATH = "/jobs/view/4001234/"
+
+
+class Case:
+    """
+    One benchmark: `path` is loaded once, `prepare(driver, base_url)` returns the
+    state passed to every `run(state)` call. path=None means no browser is needed.
+    """
+
+    def __init__(self, name, path, prepare, run):
+        self.name = name
+        self.path = path
+        self.prepare = prepare
+        self.run = run
+
+    @property
+    def needs_browser(self):
+        return self.path is not None
+
+
+def _person(driver, base_url, **options):
+    return Person(linkedin_url=base_url + PROFILE_PATH.rstrip("/"), driver=driver, get=False, scrape=False, **options)
+
+
+def _details(section, **options):
+    """Loaded details page + Person whose read_<section>() is measured"""
+    def prepare(driver, base_url):
+        person = _person(driver, base_url, **options)
+        main = person.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+        return person, person.wait_for_element_to_load(name="pvs-list__container", base=main)
+
+    def run(state):
+        person, main_list = state
+        getattr(person, section).clear()
+        getattr(person, "read_" + section)(main_list)
+        return len(getattr(person, section))
+
+    return prepare, run
+
+
+def _top_card(use_extractors):
+    def prepare(driver, base_url):
+        return _person(driver, base_url, use_extractors=use_extractors)
+
+    def run(person):
+        if person.use_extractors:
+            person.get_top_card()
+        else:
+            person.get_name_and_location()
+            person.get_about()
+        return 1
+
+    return prepare, run
+
+
+def _company(use_extractors):
+    def prepare(driver, base_url):
+        # Company() loads the page itself
+        return Company(linkedin_url=base_url + "/company/acme/about/", driver=driver, scrape=False, use_extractors=use_extractors)
+
+    def run(company):
+        company.read_about()
+        return 1
+
+    return prepare, run
+
+
+def _job_cards(use_extractors):
+    def prepare(driver, base_url):
+        return JobSearch(driver, base_url=base_url + "/jobs/", scrape=False, use_extractors=use_extractors)
+
+    def run(search):
+        if search.use_extractors:
+            return len(search.scrape_job_cards(".jobs-search-results-list", ".job-card-list"))
+        cards = search.driver.find_elements(By.CLASS_NAME, "job-card-list")
+        return len([search.scrape_job_card(card) for card in cards])
+
+    return prepare, run
+
+
+def _job_details(use_extractors):
+    def prepare(driver, base_url):
+        return Job(linkedin_url=base_url + JOB_PATH, driver=driver, scrape=False, use_extractors=use_extractors)
+
+    def run(job):
+        job.read_details()
+        return 1
+
+    return prepare, run
+
+
+def _parse(parse, page):
+    return lambda driver, base_url: page(), lambda source: len(parse(source))
+
+
+def build_cases():
+    cases = [
+        Case("top_card/webdriver", PROFILE_PATH, *_top_card(False)),
+        Case("top_card/extractors", PROFILE_PATH, *_top_card(True)),
+    ]
+    for section, path in (("experiences", "details/experience/"), ("educations", "details/education/")):
+        cases += [
+            Case(f"{section}/webdriver", PROFILE_PATH + path, *_details(section)),
+            Case(f"{section}/lxml", PROFILE_PATH + path, *_details(section, parser="lxml")),
+            Case(f"{section}/extractors", PROFILE_PATH + path, *_details(section, use_extractors=True)),
+        ]
+    cases += [
+        Case("company_about/webdriver", "/company/acme/about/", *_company(False)),
+        Case("company_about/extractors", "/company/acme/about/", *_company(True)),
+        Case("job_cards/webdriver", "/jobs/search/", *_job_cards(False)),
+        Case("job_cards/extractors", "/jobs/search/", *_job_cards(True)),
+        Case("job_details/webdriver", JOB_PATH, *_job_details(False)),
+        Case("job_details/extractors", JOB_PATH, *_job_details(True)),
+        Case("parse/experiences", None, *_parse(parsers.parse_experiences, fixtures.experience_page)),
+        Case("parse/educations", None, *_parse(parsers.parse_educations, fixtures.education_page)),
+    ]
+    return cases
+
+
+def headless_driver():
+    opts = Options()
+    opts.add_argument("--headless=new")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--window-size=1920,1080")
+    return profile_driver(webdriver.Chrome(service=chrome_service(), options=opts))
+
+
+def measure(case, driver, base_url, min_time, max_runs):
+    if case.needs_browser:
+        driver.get(base_url + case.path)
+    state = case.prepare(driver, base_url)
+    items = case.run(state)  # warm-up, also checks the path works on this fixture
+
+    if driver is not None:
+        driver.profiler.reset()
+    tracemalloc.start()
+    runs = 0
+    started = time.perf_counter()
+    while runs < max_runs and (runs == 0 or time.perf_counter() - started < min_time):
+        case.run(state)
+        runs += 1
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "runs": runs,
+        "items": items,
+        "ops_per_sec": round(runs / elapsed, 3),
+        "ms_per_op": round(elapsed / runs * 1000, 3),
+        "peak_python_kb": round(peak / 1024, 1),
+    }
+    if driver is not None and case.needs_browser:
+        result["webdriver_commands_per_op"] = round(driver.profiler.commands / runs, 1)
+        result["js_heap_kb"] = round(driver.execute_script(
+            "return performance.memory ? performance.memory.usedJSHeapSize : 0;") / 1024, 1)
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def load_results(ref):
+    if ref == "latest":
+        files = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+        if not files:
+            return None
+        ref = files[-1]
+    with open(ref, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_table(results, baseline=None):
+    print(f"\n{'case':28} {'ops/sec':>10} {'ms/op':>10} {'cmds/op':>9} {'peak KB':>9}  {'vs baseline':>11}")
+    for name, r in results.items():
+        line = f"{name:28} {r['ops_per_sec']:>10.2f} {r['ms_per_op']:>10.2f} {r.get('webdriver_commands_per_op', '-'):>9} {r['peak_python_kb']:>9}"
+        before = (baseline or {}).get(name)
+        if before and before.get("ops_per_sec"):
+            change = (r["ops_per_sec"] / before["ops_per_sec"] - 1) * 100
+            line += f"  {change:>+10.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline extraction benchmarks")
+    parser.add_argument("filter", nargs="*", help="only run cases whose name contains one of these")
+    parser.add_argument("--min-time", type=float, default=2.0, help="seconds to spend per case (default 2)")
+    parser.add_argument("--max-runs", type=int, default=200)
+    parser.add_argument("--no-browser", action="store_true", help="only the parse/* cases")
+    parser.add_argument("--compare", metavar="FILE|latest", help="result file to compare against")
+    parser.add_argument("--no-save", action="store_true", help="don't write a result file")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in build_cases() if not args.filter or any(f in c.name for f in args.filter)]
+    if args.no_browser:
+        cases = [c for c in cases if not c.needs_browser]
+    previous = load_results(args.compare) if args.compare else None
+    baseline = previous["cases"] if previous else None
+
+    results = {}
+    driver = None
+    with FixtureServer() as server:
+        try:
+            if any(c.needs_browser for c in cases):
+                driver = headless_driver()
+            for case in cases:
+                print(f"[bench] {case.name} ...", file=sys.stderr)
+                try:
+                    results[case.name] = measure(case, driver, server.base_url, args.min_time, args.max_runs)
+                except Exception as e:
+                    print(f"[bench] {case.name} failed: {e}", file=sys.stderr)
+                    results[case.name] = {"error": str(e), "ops_per_sec": 0, "ms_per_op": 0, "peak_python_kb": 0}
+        finally:
+            if driver is not None:
+                driver.quit()
+
+    print_table(results, baseline)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "git_commit": git_commit(),
+                "python": platform.python_version(),
+                "min_time": args.min_time,
+                "cases": results,
+            }, f, indent=2)
+        print(f"\n[bench] results written to {path}", file=sys.stderr)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Local HTTP server for the benchmark fixtures.
+
+Routes are (regex, handler) pairs; a handler gets the match and the parsed
+query string (plus the form fields of a POST) and returns (status, headers,
+body). Generated pages are cached, so the server itself never shows up in
+the measurements.
+"""
+import re
+import ssl
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from . import fixtures
+
+
+def html(body, status=200):
+    return status, {"Content-Type": "text/html; charset=utf-8"}, body
+
+
+def redirect(location, status=302, headers=None):
+    return status, dict(headers or {}, Location=location), ""
+
+
+@lru_cache(maxsize=None)
+def _cached(name, *args):
+    return getattr(fixtures, name)(*args)
+
+
+def fixture_routes(experiences=40, educations=10, job_cards=25):
+    return [
+        (r"^/in/[^/]+/details/experience/?$", lambda m, q: html(_cached("experience_page", experiences))),
+        (r"^/in/[^/]+/details/education/?$", lambda m, q: html(_cached("education_page", educations))),
+        (r"^/in/[^/]+/?$", lambda m, q: html(_cached("profile_page"))),
+        (r"^/company/[^/]+(/about)?/?$", lambda m, q: html(_cached("company_about_page"))),
+        (r"^/jobs/view/(\d+)/?$", lambda m, q: html(_cached("job_details_page", int(m.group(1))))),
+        (r"^/jobs(/search)?/?$", lambda m, q: html(_cached("job_cards_page", job_cards))),
+    ]
+
+
+class FixtureServer:
+    """
+    Serves `routes` from a background thread; port 0 picks a free port.
+    tls=(certfile, keyfile) serves HTTPS instead of HTTP.
+    """
+
+    def __init__(self, routes=None, port=0, host="127.0.0.1", tls=None):
+        self.routes = [(re.compile(pattern), handler) for pattern, handler in (routes or fixture_routes())]
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                self.respond(parts.path, parse_qs(parts.query))
+
+            def do_POST(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                length = int(self.headers.get("Content-Length") or 0)
+                query.update(parse_qs(self.rfile.read(length).decode("utf-8")))
+                self.respond(parts.path, query)
+
+            def respond(self, path, query):
+                status, headers, body = server.handle(path, query, self)
+                data = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                try:
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The browser gave up on the response (navigated away, aborted fetch)
+                    self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.tls = tls
+        if tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*tls)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        host = "127.0.0.1" if host in ("", "0.0.0.0") else host
+        return f"{'https' if self.tls else 'http'}://{host}:{port}"
+
+    def handle(self, path, query, request=None):
+        """Response for `path`; `request` is the BaseHTTPRequestHandler (headers, command)"""
+        for pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match:
+                return handler(match, query)
+        return html("<h1>Not found</h1>", 404)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
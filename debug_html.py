@@ -9,9 +9,8 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from linkedin_scraper.chromedriver import chrome_service
 
 
 def setup_driver():
@@ -21,7 +20,7 @@ def setup_driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=chrome_service(),
         options=chrome_options
     )
     return driver
@@ -1,5 +1,6 @@
 import getpass
 from . import constants as c
+from . import cookies
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -38,8 +39,9 @@ def login(driver, email=None, password=None, cookie = None, timeout=10):
     element = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, c.VERIFY_LOGIN_ID)))
   
 def _login_with_cookie(driver, cookie):
-    driver.get("https://www.linkedin.com/login")
-    driver.add_cookie({
+    # Set before any page load, so no /login round trip
+    cookies.inject(driver, [{
       "name": "li_at",
-      "value": cookie
-    })
+      "value": cookie,
+      "domain": ".linkedin.com"
+    }])
@@ -0,0 +1,142 @@
+"""
+Cached login state, so a scrape doesn't have to prove it is signed in first.
+
+Every driver has an `AuthState`; drivers that use the same LinkedIn
+session can share one with `bind(driver, session_id)`. The state
+remembers when the login was last confirmed by an active check (the
+global nav probe in `Scraper.is_signed_in`) and trusts it for `AUTH_TTL`
+seconds. In between, logouts are detected passively: `Scraper.navigate`
+looks at where each page load ended up, and a redirect to /login,
+/checkpoint or /authwall marks the state as logged out. The active check
+only runs again when the confirmation expired, something looked suspicious
+(`suspect()`, e.g. a failed scrape) or a page loaded fine after a logout
+had been seen.
+"""
+import os
+import threading
+import weakref
+from time import monotonic
+from urllib.parse import urlsplit
+
+# How long a confirmed login is trusted without another active check
+AUTH_TTL = float(os.getenv("LINKEDIN_AUTH_TTL", "1800"))
+
+# Where LinkedIn sends requests of a signed out (or challenged) browser
+LOGGED_OUT_PATHS = ("/login", "/uas/login", "/checkpoint", "/authwall", "/signup")
+
+_drivers = weakref.WeakKeyDictionary()
+_sessions = {}
+_lock = threading.Lock()
+
+
+def is_logged_out_url(url):
+    path = urlsplit(url or "").path
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in LOGGED_OUT_PATHS)
+
+
+class AuthState:
+    """What is known about one login; signed_in is True, False or None (unknown)"""
+
+    def __init__(self, ttl=None):
+        self.ttl = AUTH_TTL if ttl is None else ttl
+        self.signed_in = None
+        self.confirmed_at = None
+        self.reason = None
+        self.checks = 0
+
+    def confirm(self):
+        self.signed_in = True
+        self.confirmed_at = monotonic()
+        self.reason = None
+
+    def logged_out(self, reason):
+        self.signed_in = False
+        self.confirmed_at = None
+        self.reason = reason
+
+    def suspect(self, reason):
+        """Keeps what is known but forces an active check next time"""
+        self.confirmed_at = None
+        self.reason = reason
+
+    def reset(self):
+        self.signed_in = None
+        self.confirmed_at = None
+        self.reason = None
+
+    def record(self, signed_in, reason="login check failed"):
+        """
+        Result of an active check. A failed check can be a slow page as well as a
+        logout, so it only makes the state unknown; False is kept for observed redirects.
+        """
+        self.checks += 1
+        if signed_in:
+            self.confirm()
+        else:
+            self.signed_in = None
+            self.suspect(reason)
+
+    def known(self):
+        """True/False when that can be trusted without a check, None when a check is due.
+        False means a redirect to a login page was seen."""
+        if self.signed_in is False:
+            return False
+        if self.signed_in and self.confirmed_at is not None and monotonic() - self.confirmed_at < self.ttl:
+            return True
+        return None
+
+    def stats(self):
+        return {
+            "signed_in": self.signed_in,
+            "confirmed_age": round(monotonic() - self.confirmed_at, 1) if self.confirmed_at is not None else None,
+            "reason": self.reason,
+            "checks": self.checks,
+        }
+
+
+def state(driver):
+    with _lock:
+        current = _drivers.get(driver)
+        if current is None:
+            current = _drivers[driver] = AuthState()
+        return current
+
+
+def session(session_id):
+    with _lock:
+        current = _sessions.get(session_id)
+        if current is None:
+            current = _sessions[session_id] = AuthState()
+        return current
+
+
+def bind(driver, session_id):
+    """Lets `driver` share the state of `session_id`; call it once the session's cookies are loaded"""
+    shared = session(session_id)
+    with _lock:
+        _drivers[driver] = shared
+    return shared
+
+
+def forget(driver):
+    """Drops the driver's state, e.g. after its cookies were wiped"""
+    with _lock:
+        _drivers.pop(driver, None)
+
+
+def observe(driver, url=None):
+    """Passive check after a page load; False if it was redirected to a login page, else None"""
+    url = url if url is not None else driver.current_url
+    current = state(driver)
+    if is_logged_out_url(url):
+        current.logged_out(f"redirected to {urlsplit(url).path}")
+        return False
+    if current.signed_in is False and urlsplit(url).scheme in ("http", "https"):
+        # A real page after a logout was seen: maybe signed in again, check next time
+        current.reset()
+    return None
+
+
+def sessions():
+    with _lock:
+        return {session_id: current.stats() for session_id, current in _sessions.items()}
@@ -0,0 +1,155 @@
+"""
+Resolves the chromedriver binary once per process.
+
+Lookup order:
+  1. CHROMEDRIVER env var (pinned path, always wins)
+  2. the bundled linkedin_scraper/drivers/chromedriver
+  3. the on-disk cache written by a previous resolution, if it still matches Chrome
+  4. a chromedriver on PATH whose major version matches Chrome
+  5. webdriver-manager download (skipped in offline mode)
+
+Offline mode (CHROMEDRIVER_OFFLINE=true) never touches the network and
+fails loudly if none of 1-4 produced a driver.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+
+from selenium.webdriver.chrome.service import Service
+
+BUNDLED_DRIVER = os.path.join(os.path.dirname(__file__), "drivers", "chromedriver")
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+_resolved_path = None
+_lock = threading.Lock()
+
+
+class ChromedriverNotFound(Exception):
+    pass
+
+
+def cache_file():
+    cache_dir = os.getenv("CHROMEDRIVER_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper")
+    return os.path.join(cache_dir, "chromedriver.json")
+
+
+def is_offline():
+    return os.getenv("CHROMEDRIVER_OFFLINE", "false").lower() == "true"
+
+
+def _major(version):
+    match = re.search(r"(\d+)\.", version or "")
+    return match.group(1) if match else None
+
+
+def _version_of(binary):
+    try:
+        out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except Exception:
+        return None
+    match = re.search(r"\d+(\.\d+)+", out)
+    return match.group(0) if match else None
+
+
+def installed_chrome_version():
+    """Version string of the local Chrome/Chromium, or None if it can't be found"""
+    candidates = [os.getenv("CHROME_BIN")] + CHROME_BINARIES
+    for name in candidates:
+        if not name:
+            continue
+        binary = name if os.path.isabs(name) else shutil.which(name)
+        if binary and os.path.exists(binary):
+            version = _version_of(binary)
+            if version:
+                return version
+    return None
+
+
+def chromedriver_version(path):
+    return _version_of(path)
+
+
+def _matches(path, chrome_major):
+    if not path or not os.path.exists(path):
+        return False
+    if chrome_major is None:
+        # Can't verify without a known Chrome, trust the binary
+        return True
+    return _major(chromedriver_version(path)) == chrome_major
+
+
+def _read_cache():
+    try:
+        with open(cache_file(), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path, chrome_version):
+    try:
+        os.makedirs(os.path.dirname(cache_file()), exist_ok=True)
+        with open(cache_file(), "w") as f:
+            json.dump({
+                "path": path,
+                "chrome_version": chrome_version,
+                "driver_version": chromedriver_version(path),
+            }, f)
+    except OSError as e:
+        print(f"DEBUG: Could not write chromedriver cache: {e}")
+
+
+def _resolve(offline):
+    pinned = os.getenv("CHROMEDRIVER")
+    if pinned:
+        if not os.path.exists(pinned):
+            raise ChromedriverNotFound(f"CHROMEDRIVER points to a missing file: {pinned}")
+        return pinned
+
+    if os.path.exists(BUNDLED_DRIVER):
+        return BUNDLED_DRIVER
+
+    chrome_version = installed_chrome_version()
+    chrome_major = _major(chrome_version)
+
+    cached = _read_cache()
+    cached_path = cached.get("path")
+    if cached_path and os.path.exists(cached_path):
+        # Cheap path: the cache records the Chrome major it was resolved for
+        if chrome_major is None or _major(cached.get("chrome_version")) == chrome_major:
+            return cached_path
+
+    on_path = shutil.which("chromedriver")
+    if _matches(on_path, chrome_major):
+        _write_cache(on_path, chrome_version)
+        return on_path
+
+    if offline:
+        raise ChromedriverNotFound(
+            "Offline mode: no matching chromedriver found. Set CHROMEDRIVER to a pinned binary "
+            f"(Chrome version: {chrome_version or 'unknown'})"
+        )
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    _write_cache(path, chrome_version)
+    return path
+
+
+def resolve_chromedriver(offline=None, refresh=False):
+    """Path to a chromedriver matching the installed Chrome. Resolved once, then memoized."""
+    global _resolved_path
+    offline = is_offline() if offline is None else offline
+    with _lock:
+        if _resolved_path is None or refresh:
+            _resolved_path = _resolve(offline)
+            print(f"DEBUG: Using chromedriver at {_resolved_path}")
+        return _resolved_path
+
+
+def chrome_service(**kwargs):
+    """Selenium Service for the resolved chromedriver"""
+    return Service(resolve_chromedriver(), **kwargs)
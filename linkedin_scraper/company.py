@@ -5,9 +5,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
+from .chromedriver import chrome_service
 from .objects import Scraper
+from .pagination import ListPaginator
 from .person import Person
-import time
+from . import network
+from . import voyager
 import os
 import json
 
@@ -33,6 +36,10 @@ class CompanySummary(object):
             return """ {name} {followers} """.format(name = self.name, followers = self.followers)
 
 class Company(Scraper):
+    WAITS = {
+        "company_about": (0.5, 5),
+        "employees_more": (0, 6),
+    }
     linkedin_url = None
     name = None
     about_us =None
@@ -47,9 +54,10 @@ class Company(Scraper):
     showcase_pages = []
     affiliated_companies = []
     employees = []
+    employees_cursor = 0
     headcount = None
 
-    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True):
+    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True, use_extractors = False, waits = None, intercept = False):
         self.linkedin_url = linkedin_url
         self.name = name
         self.about_us = about_us
@@ -63,20 +71,23 @@ class Company(Scraper):
         self.specialties = specialties
         self.showcase_pages = showcase_pages
         self.affiliated_companies = affiliated_companies
+        self.use_extractors = use_extractors
+        # Read the about fields from the captured API responses, DOM scraping stays the fallback
+        self.intercept = intercept
+        self.waits = waits or {}
 
         if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(os.path.dirname(__file__), 'drivers/chromedriver')
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
-
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+            options = webdriver.ChromeOptions()
+            if intercept:
+                network.enable_performance_log(options)
+            with self.phase("driver_startup"):
+                try:
+                    driver = webdriver.Chrome(service=chrome_service(), options=options)
+                except:
+                    driver = webdriver.Chrome(options=options)
 
-        driver.get(linkedin_url)
         self.driver = driver
+        self.navigate(linkedin_url)
 
         if scrape:
             self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
@@ -87,11 +98,93 @@ class Company(Scraper):
     def __get_text_under_subtitle_by_class(self, driver, class_name):
         return self.__get_text_under_subtitle(driver.find_element(By.CLASS_NAME, class_name))
 
-    def scrape(self, get_employees=True, close_on_complete=True):
-        if self.is_signed_in():
-            self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+    def __apply_about(self, about):
+        """Maps the company_about extractor result onto the company fields"""
+        self.about_us = about["about_us"]
+        self.headcount = about["headcount"]
+        fields = about["fields"]
+        self.website = fields.get("Website", self.website)
+        self.phone = fields.get("Phone", self.phone)
+        self.industry = fields.get("Industry", self.industry)
+        self.company_size = fields.get("Company size", self.company_size)
+        self.headquarters = fields.get("Headquarters", self.headquarters)
+        self.company_type = fields.get("Type", self.company_type)
+        self.founded = fields.get("Founded", self.founded)
+        if "Specialties" in fields:
+            self.specialties = "\n".join(fields["Specialties"].split(", "))
+
+    def get_from_api(self):
+        """Applies the intercepted Company JSON; True if it had the about fields"""
+        company = voyager.find_company(self.api_entities(voyager.COMPANY), self.linkedin_url)
+        if company is None:
+            return False
+        fields = voyager.company_fields(company)
+        for key, value in fields.items():
+            setattr(self, key, value)
+        return "about_us" in fields or "website" in fields
+
+    def read_about(self):
+        """Reads the already loaded About tab into the company fields (no navigation)"""
+        driver = self.driver
+        if self.use_extractors:
+            self.__apply_about(self.run_extractor("company_about"))
         else:
-            self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
+                section_id = 4
+            else:
+                section_id = 3
+           #section ID is no longer needed, we are using class name now.
+            #grid = driver.find_elements_by_tag_name("section")[section_id]
+            grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
+            print(grid)
+            descWrapper = grid.find_elements(By.TAG_NAME, "p")
+            if len(descWrapper) > 0:
+                self.about_us = descWrapper[0].text.strip()
+            labels = grid.find_elements(By.TAG_NAME, "dt")
+            values = grid.find_elements(By.TAG_NAME, "dd")
+            num_attributes = min(len(labels), len(values))
+            #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
+            # if num_attributes == 0:
+            #     exit()
+            x_off = 0
+            for i in range(num_attributes):
+                txt = labels[i].text.strip()
+                if txt == 'Website':
+                    self.website = values[i+x_off].text.strip()
+                if txt == 'Phone':
+                    self.phone = values[i+x_off].text.strip()
+                elif txt == 'Industry':
+                    self.industry = values[i+x_off].text.strip()
+                elif txt == 'Company size':
+                    self.company_size = values[i+x_off].text.strip()
+                    if len(values) > len(labels):
+                        x_off = 1
+                elif txt == 'Headquarters':
+                        self.headquarters = values[i+x_off].text.strip()
+                elif txt == 'Type':
+                    self.company_type = values[i+x_off].text.strip()
+                elif txt == 'Founded':
+                    self.founded = values[i+x_off].text.strip()
+                elif txt == 'Specialties':
+                    self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
+
+            try:
+                grid = driver.find_element(By.CLASS_NAME, "mt1")
+                spans = grid.find_elements(By.TAG_NAME, "span")
+                for span in spans:
+                    txt = span.text.strip()
+                    if "See all" in txt and "employees on LinkedIn" in txt:
+                        self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
+            except NoSuchElementException: # Does not exist in page, skip it
+                pass
+
+    def scrape(self, get_employees=True, close_on_complete=True):
+        # Navigation and waits inside are timed as their own phases
+        with self.phase("extraction"):
+            if self.is_signed_in():
+                self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            else:
+                self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
 
     def __parse_employee__(self, employee_raw):
 
@@ -118,73 +211,55 @@ class Company(Scraper):
             # print(e)
             return None
 
+    # List items of the People tab from index arguments[1] on, so each batch only transfers what is new
+    NEW_EMPLOYEE_ITEMS_JS = "return Array.from(arguments[0].querySelectorAll('li')).slice(arguments[1]);"
+
     def get_employees(self, wait_time=10):
-        total = []
-        list_css = "list-style-none"
-        next_xpath = '//button[@aria-label="Next"]'
+        return list(self.iter_employees(wait_time=wait_time))
+
+    def iter_employees(self, limit=None, cursor=0, wait_time=10):
+        """
+        Yields the People tab's employees as they are parsed, each profile URL once.
+        Only list items added since the last batch are read. After the generator
+        stops, `employees_cursor` is the number of list items consumed; pass it as
+        `cursor` to resume there.
+        """
         driver = self.driver
+        seen = set()
+        yielded = 0
+        self.employees_cursor = cursor
 
-        try:
-            see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
-        except:
-            pass
-        driver.get(os.path.join(self.linkedin_url, "people"))
+        self.navigate(os.path.join(self.linkedin_url, "people"))
 
         _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
-
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
-
-        results_list = driver.find_element(By.CLASS_NAME, list_css)
-        results_li = results_list.find_elements(By.TAG_NAME, "li")
-        for res in results_li:
-            total.append(self.__parse_employee__(res))
-
-        def is_loaded(previous_results):
-          loop = 0
-          driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-          results_li = results_list.find_elements(By.TAG_NAME, "li")
-          while len(results_li) == previous_results and loop <= 5:
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            loop += 1
-          return loop <= 5
-
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
-
-        results_li_len = len(results_li)
-        while is_loaded(results_li_len):
-            try:
-                driver.find_element(By.XPATH,next_xpath).click()
-            except:
-                pass
-            _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
-
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
-
-            get_data(results_li_len)
-            results_li_len = len(total)
-        return total
+        results_list = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, "list-style-none")))
+
+        # One smooth scroll / "Show more results" click per page, done when the button is gone
+        pages = ListPaginator(self, results_list, site="employees_more")
+        while True:
+            # Items before the cursor are only loaded, never parsed
+            if pages.count > self.employees_cursor:
+                for res in driver.execute_script(self.NEW_EMPLOYEE_ITEMS_JS, results_list, self.employees_cursor):
+                    self.employees_cursor += 1
+                    employee = self.__parse_employee__(res)
+                    if employee is None or employee["linkedin_url"] in seen:
+                        continue
+                    seen.add(employee["linkedin_url"])
+                    yield employee
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+            if not pages.next_page():
+                return
 
 
 
     def scrape_logged_in(self, get_employees = True, close_on_complete = True):
         driver = self.driver
 
-        driver.get(self.linkedin_url)
+        if self.intercept:
+            self.start_interception()
+        self.navigate(self.linkedin_url)
 
         _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
 
@@ -192,66 +267,21 @@ class Company(Scraper):
 
         self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
 
-        # Click About Tab or View All Link
-        try:
-          self.__find_first_available_element__(
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='page_member_main_nav_about_tab']"),
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
-          ).click()
-        except:
-          driver.get(os.path.join(self.linkedin_url, "about"))
+        # The company page JSON already carries the about fields, then the About tab is skipped
+        if not (self.intercept and self.get_from_api()):
+            # Click About Tab or View All Link
+            try:
+              self.__find_first_available_element__(
+                navigation.find_elements(By.XPATH, "//a[@data-control-name='page_member_main_nav_about_tab']"),
+                navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
+              ).click()
+            except:
+              self.navigate(os.path.join(self.linkedin_url, "about"))
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
-        time.sleep(3)
+            _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
+            self.wait_for_stable_count(".org-about-module__margin-bottom dt", site="company_about")
 
-        if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
-            section_id = 4
-        else:
-            section_id = 3
-       #section ID is no longer needed, we are using class name now.
-        #grid = driver.find_elements_by_tag_name("section")[section_id]
-        grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
-        print(grid)
-        descWrapper = grid.find_elements(By.TAG_NAME, "p")
-        if len(descWrapper) > 0:
-            self.about_us = descWrapper[0].text.strip()
-        labels = grid.find_elements(By.TAG_NAME, "dt")
-        values = grid.find_elements(By.TAG_NAME, "dd")
-        num_attributes = min(len(labels), len(values))
-        #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
-        # if num_attributes == 0:
-        #     exit()
-        x_off = 0
-        for i in range(num_attributes):
-            txt = labels[i].text.strip()
-            if txt == 'Website':
-                self.website = values[i+x_off].text.strip()
-            if txt == 'Phone':
-                self.phone = values[i+x_off].text.strip()
-            elif txt == 'Industry':
-                self.industry = values[i+x_off].text.strip()
-            elif txt == 'Company size':
-                self.company_size = values[i+x_off].text.strip()
-                if len(values) > len(labels):
-                    x_off = 1
-            elif txt == 'Headquarters':
-                    self.headquarters = values[i+x_off].text.strip()
-            elif txt == 'Type':
-                self.company_type = values[i+x_off].text.strip()
-            elif txt == 'Founded':
-                self.founded = values[i+x_off].text.strip()
-            elif txt == 'Specialties':
-                self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
-
-        try:
-            grid = driver.find_element(By.CLASS_NAME, "mt1")
-            spans = grid.find_elements(By.TAG_NAME, "span")
-            for span in spans:
-                txt = span.text.strip()
-                if "See all" in txt and "employees on LinkedIn" in txt:
-                    self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
-        except NoSuchElementException: # Does not exist in page, skip it
-            pass
+            self.read_about()
 
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
 
@@ -286,7 +316,7 @@ class Company(Scraper):
         if get_employees:
             self.employees = self.get_employees()
 
-        driver.get(self.linkedin_url)
+        self.navigate(self.linkedin_url)
 
         if close_on_complete:
             driver.close()
@@ -295,7 +325,7 @@ class Company(Scraper):
         driver = self.driver
         retry_times = 0
         while self.is_signed_in() and retry_times <= retry_limit:
-            page = driver.get(self.linkedin_url)
+            page = self.navigate(self.linkedin_url)
             retry_times = retry_times + 1
 
         self.name = driver.find_element(By.CLASS_NAME, "name").text.strip()
@@ -346,11 +376,28 @@ class Company(Scraper):
         if get_employees:
             self.employees = self.get_employees()
 
-        driver.get(self.linkedin_url)
+        self.navigate(self.linkedin_url)
 
         if close_on_complete:
             driver.close()
 
+    def to_dict(self):
+        return {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "about_us": self.about_us,
+            "website": self.website,
+            "phone": self.phone,
+            "headquarters": self.headquarters,
+            "founded": self.founded,
+            "industry": self.industry,
+            "company_type": self.company_type,
+            "company_size": self.company_size,
+            "specialties": self.specialties,
+            "headcount": self.headcount,
+            "employees": list(self.employees)
+        }
+
     def __repr__(self):
         _output = {}
         _output['name'] = self.name
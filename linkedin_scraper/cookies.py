@@ -0,0 +1,113 @@
+"""
+Session cookies, parsed once and injected before the first navigation.
+
+Selenium's add_cookie only works for the domain of the page currently
+loaded, so the old way to restore a session was: open linkedin.com, add
+the cookies one by one, reload. `inject` uses CDP Network.setCookies
+instead, which takes all cookies in one call on a blank tab; the first
+page the scraper opens is already signed in.
+
+`jars` caches the parsed cookie file of every session in memory and only
+re-reads a file when its mtime or size changed, so a new upload via
+/cookies or a login in another process is picked up on the next scrape.
+"""
+import json
+import os
+import threading
+import time
+
+LINKEDIN_URL = "https://www.linkedin.com"
+
+# LinkedIn's UI language; the selectors expect the English page
+LANG_COOKIE = {"name": "lang", "value": "v=2&lang=en-us", "domain": ".linkedin.com", "path": "/"}
+
+SAME_SITE = ("Strict", "Lax", "None")
+
+
+def to_cdp(cookie):
+    """Network.CookieParam for a cookie as returned by driver.get_cookies()"""
+    param = {"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path") or "/"}
+    if cookie.get("domain"):
+        param["domain"] = cookie["domain"]
+    else:
+        param["url"] = LINKEDIN_URL
+    for key in ("secure", "httpOnly"):
+        if key in cookie:
+            param[key] = bool(cookie[key])
+    if cookie.get("expiry") is not None:
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in SAME_SITE:
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def inject(driver, cookies):
+    """Sets `cookies` (driver.get_cookies() format) in the browser without loading a page"""
+    now = time.time()
+    params = [to_cdp(c) for c in cookies if c.get("name") and (c.get("expiry") is None or c["expiry"] > now)]
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        return len(params)
+    # Not a Chromium driver: add_cookie needs a page on the cookie's domain
+    driver.get(LINKEDIN_URL)
+    for cookie in cookies:
+        try:
+            driver.add_cookie({key: value for key, value in cookie.items() if key != "sameSite" or value in SAME_SITE})
+        except Exception:
+            pass
+    return len(cookies)
+
+
+class CookieJars:
+    """Parsed cookie files by path, re-read only when the file changed on disk"""
+
+    def __init__(self):
+        self._jars = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path):
+        """The cookies in `path` (shared list, don't modify) or None if there is no file"""
+        signature = self._signature(path)
+        if signature is None:
+            with self._lock:
+                self._jars.pop(path, None)
+            return None
+        with self._lock:
+            cached = self._jars.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        with open(path, encoding="utf-8") as f:
+            cookies = json.load(f)
+        if not isinstance(cookies, list):
+            raise ValueError(f"{path}: expected a list of cookies")
+        with self._lock:
+            self._jars[path] = (signature, cookies)
+        return cookies
+
+    def save(self, path, cookies):
+        """Writes `cookies` to `path` (atomically) and keeps them cached"""
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+        os.replace(tmp, path)
+        signature = self._signature(path)
+        with self._lock:
+            self._jars[path] = (signature, list(cookies))
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._jars.clear()
+            else:
+                self._jars.pop(path, None)
+
+
+jars = CookieJars()
@@ -0,0 +1,344 @@
+"""
+Columnar export of scrape results.
+
+`Exporter` writes profiles, companies and jobs as tables, one file per
+table: Parquet (or Arrow IPC) when pyarrow is installed, CSV otherwise.
+Profiles are flattened into a profiles table plus experiences, educations
+and accomplishments child tables keyed by profile_url; companies into
+companies plus employees. Rows are buffered per table and written every
+`chunk_size` rows, so each chunk becomes one Parquet row group and memory
+stays flat however many records go through.
+
+    with Exporter("export/") as out:
+        for job in jobs:
+            out.add("jobs", job)   # Job, Company, Person/Profile or their to_dict()
+    out.files  # {"jobs": "export/jobs.parquet"}
+
+`stream()` yields a single table as bytes for HTTP responses.
+"""
+import csv
+import io
+import os
+from datetime import datetime, timezone
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional, CSV is written without it
+    pyarrow = None
+
+from .serialize import MISSING
+from .urls import canonical_profile_url
+
+FORMATS = ("parquet", "arrow", "csv")
+EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+MIMETYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+    "csv": "text/csv",
+}
+CHUNK_SIZE = 10000
+
+# Columns and their types per table
+TABLES = {
+    "profiles": (
+        ("url", "string"), ("name", "string"), ("headline", "string"), ("job_title", "string"),
+        ("company", "string"), ("location", "string"), ("about", "string"), ("interests", "string"),
+        ("scraped_at", "timestamp"),
+    ),
+    "experiences": (
+        ("profile_url", "string"), ("position", "int"), ("position_title", "string"),
+        ("institution_name", "string"), ("from_date", "string"), ("to_date", "string"),
+        ("duration", "string"), ("location", "string"),
+    ),
+    "educations": (
+        ("profile_url", "string"), ("position", "int"), ("institution_name", "string"),
+        ("degree", "string"), ("from_date", "string"), ("to_date", "string"),
+    ),
+    "accomplishments": (
+        ("profile_url", "string"), ("position", "int"), ("category", "string"), ("title", "string"),
+    ),
+    "companies": (
+        ("url", "string"), ("name", "string"), ("about_us", "string"), ("website", "string"),
+        ("phone", "string"), ("headquarters", "string"), ("founded", "string"), ("industry", "string"),
+        ("company_type", "string"), ("company_size", "string"), ("specialties", "string"),
+        ("headcount", "int"),
+    ),
+    "employees": (
+        ("company_url", "string"), ("position", "int"), ("name", "string"),
+        ("designation", "string"), ("linkedin_url", "string"),
+    ),
+    "jobs": (
+        ("url", "string"), ("job_title", "string"), ("company", "string"),
+        ("company_linkedin_url", "string"), ("location", "string"), ("posted_date", "string"),
+        ("applicant_count", "string"), ("job_description", "string"), ("benefits", "string"),
+    ),
+}
+
+# The tables each kind of record is flattened into
+KINDS = {
+    "profiles": ("profiles", "experiences", "educations", "accomplishments"),
+    "companies": ("companies", "employees"),
+    "jobs": ("jobs",),
+}
+
+
+def default_format():
+    return "parquet" if pyarrow is not None else "csv"
+
+
+def kind_of(table):
+    for kind, tables in KINDS.items():
+        if table in tables:
+            return kind
+    raise ValueError(f"unknown table {table!r}, expected one of {', '.join(TABLES)}")
+
+
+def schema(table):
+    types = {"string": pyarrow.string(), "int": pyarrow.int64(), "timestamp": pyarrow.timestamp("ms", tz="UTC")}
+    return pyarrow.schema([(column, types[kind]) for column, kind in TABLES[table]])
+
+
+# Flattening
+
+def _cell(value):
+    if value is None or value == "" or value == MISSING:
+        return None
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(item) for item in value if item not in (None, "", MISSING)) or None
+    return value
+
+
+def _titles(items):
+    """Interests are names (Profile) or Interest records/dicts (Person); one cell of their titles"""
+    names = []
+    for item in items or ():
+        if isinstance(item, dict):
+            item = item.get("title") or item.get("institution_name")
+        elif not isinstance(item, str):
+            item = getattr(item, "title", None) or getattr(item, "institution_name", None)
+        names.append(item)
+    return _cell(names)
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _timestamp(record):
+    """scraped_at (epoch seconds, set by the profile store) or the result's ISO timestamp"""
+    value = record.get("scraped_at")
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    try:
+        value = datetime.fromisoformat(record.get("timestamp"))
+    except (TypeError, ValueError):
+        return None
+    return value.astimezone(timezone.utc)
+
+
+def _as_dict(record):
+    if isinstance(record, dict):
+        return record
+    if hasattr(record, "result"):
+        # Person -> Profile record, which keeps linkedin_url
+        record = record.result()
+    return record.to_dict()
+
+
+def _children(url_column, url, items, table):
+    columns = [column for column, _ in TABLES[table] if column not in (url_column, "position")]
+    rows = []
+    for position, item in enumerate(items or ()):
+        item = _as_dict(item)
+        row = {column: _cell(item.get(column)) for column in columns}
+        row[url_column] = url
+        row["position"] = position
+        rows.append(row)
+    return rows
+
+
+def flatten(kind, record):
+    """{table: rows} of one record of `kind` (profiles, companies or jobs)"""
+    record = _as_dict(record)
+    url = record.get("linkedin_url") or record.get("url")
+    if kind == "profiles":
+        profile = {column: _cell(record.get(column)) for column, _ in TABLES["profiles"]}
+        # The same key as the profile store, whatever URL the record came with
+        url = canonical_profile_url(url)
+        profile.update(url=url, interests=_titles(record.get("interests")), scraped_at=_timestamp(record))
+        return {
+            "profiles": [profile],
+            "experiences": _children("profile_url", url, record.get("experiences"), "experiences"),
+            "educations": _children("profile_url", url, record.get("educations"), "educations"),
+            "accomplishments": _children("profile_url", url, record.get("accomplishments"), "accomplishments"),
+        }
+    if kind == "companies":
+        company = {column: _cell(record.get(column)) for column, _ in TABLES["companies"]}
+        company.update(url=url, headcount=_int(record.get("headcount")))
+        return {
+            "companies": [company],
+            "employees": _children("company_url", url, record.get("employees"), "employees"),
+        }
+    if kind == "jobs":
+        job = {column: _cell(record.get(column)) for column, _ in TABLES["jobs"]}
+        job["url"] = url
+        return {"jobs": [job]}
+    raise ValueError(f"unknown record kind {kind!r}, expected one of {', '.join(KINDS)}")
+
+
+# Writing
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class TableWriter:
+    """
+    Writes rows of one table to `sink`, a path or a binary file object.
+    Each write() becomes one Parquet row group / Arrow record batch.
+    """
+
+    def __init__(self, table, sink, format=None):
+        self.format = format or default_format()
+        if self.format not in FORMATS:
+            raise ValueError(f"unknown format {self.format!r}, expected one of {', '.join(FORMATS)}")
+        if self.format != "csv" and pyarrow is None:
+            raise RuntimeError(f"{self.format} export needs pyarrow; install it or use format='csv'")
+        self.table = table
+        self.columns = [column for column, _ in TABLES[table]]
+        self.rows = 0
+        self._owned = isinstance(sink, (str, os.PathLike))
+        self._file = open(sink, "wb") if self._owned else sink
+        if self.format == "csv":
+            self._text = io.TextIOWrapper(self._file, encoding="utf-8", newline="", write_through=True)
+            self._csv = csv.writer(self._text)
+            self._csv.writerow(self.columns)
+        else:
+            self._schema = schema(table)
+            if self.format == "parquet":
+                self._writer = pyarrow.parquet.ParquetWriter(self._file, self._schema, compression="zstd")
+            else:
+                self._writer = pyarrow.ipc.new_file(self._file, self._schema)
+
+    def write(self, rows):
+        if not rows:
+            return
+        if self.format == "csv":
+            self._csv.writerows([[_csv_cell(row.get(column)) for column in self.columns] for row in rows])
+        else:
+            self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self._schema))
+        self.rows += len(rows)
+
+    def close(self):
+        if self.format == "csv":
+            self._text.flush()
+            # Leave the sink open, it may not be ours
+            self._text.detach()
+        else:
+            self._writer.close()
+        if self._owned:
+            self._file.close()
+
+
+class Exporter:
+    """Writes records into one file per table under `directory`; use as a context manager"""
+
+    def __init__(self, directory, format=None, chunk_size=CHUNK_SIZE):
+        self.directory = directory
+        self.format = format or default_format()
+        self.chunk_size = max(1, int(chunk_size))
+        self.files = {}
+        self._kinds = set()
+        self._writers = {}
+        self._buffers = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, kind, record):
+        self._kinds.add(kind)
+        for table, rows in flatten(kind, record).items():
+            buffer = self._buffers.setdefault(table, [])
+            buffer.extend(rows)
+            if len(buffer) >= self.chunk_size:
+                self._flush(table)
+
+    def _writer(self, table):
+        writer = self._writers.get(table)
+        if writer is None:
+            path = os.path.join(self.directory, table + EXTENSIONS[self.format])
+            writer = self._writers[table] = TableWriter(table, path, self.format)
+            self.files[table] = path
+        return writer
+
+    def _flush(self, table):
+        rows = self._buffers.pop(table, None)
+        if rows:
+            self._writer(table).write(rows)
+
+    def counts(self):
+        return {table: writer.rows for table, writer in self._writers.items()}
+
+    def close(self):
+        for table in list(self._buffers):
+            self._flush(table)
+        # Child tables without rows still get a file with the header/schema
+        for kind in self._kinds:
+            for table in KINDS[kind]:
+                self._writer(table)
+        for writer in self._writers.values():
+            writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Chunks(io.RawIOBase):
+    """Write-only sink that hands out what was written since the last drain()"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream(table, records, format=None, chunk_size=CHUNK_SIZE):
+    """Yields `table` of `records` as bytes, one chunk per row group"""
+    kind = kind_of(table)
+    sink = _Chunks()
+    writer = TableWriter(table, sink, format)
+    rows = []
+    for record in records:
+        rows.extend(flatten(kind, record)[table])
+        if len(rows) >= chunk_size:
+            writer.write(rows)
+            rows = []
+            yield sink.drain()
+    writer.write(rows)
+    writer.close()
+    yield sink.drain()
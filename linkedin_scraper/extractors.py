@@ -0,0 +1,217 @@
+"""
+In-browser extractors.
+
+Each script runs once through `driver.execute_script` and returns a whole
+section as plain JSON (dicts/lists of strings), so a section costs one
+chromedriver round trip instead of one per element. Keys match the field
+names of the dataclasses / attributes they are mapped onto.
+"""
+
+# Shared helpers, prepended to every extractor
+_HELPERS = r"""
+const kids = (el) => el ? Array.from(el.children) : [];
+const text = (el) => el ? (el.innerText || '').trim() : '';
+const first = (root, sel) => root ? root.querySelector(sel) : null;
+const spanText = (el) => text(first(el, 'span'));
+const attr = (el, name) => el ? el.getAttribute(name) : null;
+const splitTimes = (workTimes) => {
+    let times = '', duration = null;
+    if (workTimes) {
+        const parts = workTimes.split('·');
+        times = parts.length ? parts[0].trim() : '';
+        duration = parts.length > 1 ? parts[1].trim() : null;
+    }
+    const words = times ? times.split(' ') : [];
+    return {
+        from_date: times ? words.slice(0, 2).join(' ') : '',
+        to_date: times && words.length > 3 ? words.slice(3).join(' ') : '',
+        duration: duration,
+    };
+};
+const detailEntities = () => {
+    const main = document.querySelector('main');
+    const list = first(main, '.pvs-list__container');
+    if (!list) return [];
+    return Array.from(list.querySelectorAll('.pvs-list__paged-list-item'))
+        .map((item) => first(item, "div[data-view-name='profile-component-entity']"))
+        .filter(Boolean);
+};
+"""
+
+TOP_CARD = r"""
+const panel = document.querySelector("[class='mt2 relative']");
+const picture = first(document.querySelector('.pv-top-card-profile-picture'), 'img');
+const about = document.getElementById('about');
+return {
+    name: text(first(panel, 'h1')),
+    headline: text(first(panel, '.text-body-medium.break-words')),
+    location: text(document.querySelector("[class='text-body-small inline t-black--light break-words']")),
+    open_to_work: (attr(picture, 'title') || '').includes('#OPEN_TO_WORK'),
+    about: about ? (text(first(about.parentElement, '.display-flex')) || null) : null,
+};
+"""
+
+EXPERIENCES = r"""
+const results = [];
+for (const position of detailEntities()) {
+    const elements = kids(position);
+    if (elements.length < 2) continue;
+    const linkedinUrl = attr(kids(elements[0])[0], 'href');
+    if (!linkedinUrl) continue;
+
+    const details = kids(elements[1]);
+    const summary = details[0], summaryText = details[1];
+    if (!summary) continue;
+    const outer = kids(kids(summary)[0]);
+
+    let title = '', company = '', workTimes = '', location = '';
+    if (outer.length === 4) {
+        [title, company, workTimes, location] = outer.map(spanText);
+    } else if (outer.length === 3) {
+        if (text(outer[2]).includes('·')) {
+            [title, company, workTimes] = outer.map(spanText);
+        } else {
+            [company, workTimes, location] = outer.map(spanText);
+        }
+    } else {
+        company = outer.length ? spanText(outer[0]) : '';
+        workTimes = outer.length > 1 ? spanText(outer[1]) : '';
+    }
+
+    let inner = [];
+    if (summaryText && kids(summaryText).some((e) => e.getAttribute('class') === 'pvs-list__container')) {
+        let container = first(summaryText, '.pvs-list__container');
+        for (let i = 0; i < 3 && container; i++) container = kids(container)[0];
+        if (container) inner = Array.from(container.querySelectorAll('.pvs-list__paged-list-item'));
+    }
+
+    if (inner.length > 1) {
+        for (const description of inner) {
+            const res = kids(first(description, 'a'));
+            if (!res.length) continue;
+            const titleElem = first(kids(res[0])[0], '*');
+            results.push(Object.assign({
+                position_title: text(titleElem),
+                location: res[2] ? text(kids(res[2])[0]) : null,
+                description: text(description),
+                institution_name: company,
+                linkedin_url: linkedinUrl,
+            }, splitTimes(res[1] ? text(kids(res[1])[0]) : '')));
+        }
+    } else {
+        results.push(Object.assign({
+            position_title: title,
+            location: location,
+            description: text(summaryText),
+            institution_name: company,
+            linkedin_url: linkedinUrl,
+        }, splitTimes(workTimes)));
+    }
+}
+return results;
+"""
+
+EDUCATIONS = r"""
+const results = [];
+for (const position of detailEntities()) {
+    const elements = kids(position);
+    if (elements.length < 2) continue;
+    const details = kids(elements[1]);
+    const summary = details[0], summaryText = details[1];
+    if (!summary || !kids(summary).length) continue;
+    const outer = kids(kids(summary)[0]);
+
+    let fromDate = null, toDate = null;
+    const times = outer.length > 2 ? spanText(outer[2]) : '';
+    if (times && times.includes('-')) {
+        const split = times.split(' ');
+        const dash = split.indexOf('-');
+        if (dash > 0) fromDate = split[dash - 1];
+        if (dash < split.length - 1) toDate = split[split.length - 1];
+    }
+    results.push({
+        institution_name: outer.length ? spanText(outer[0]) : '',
+        degree: outer.length > 1 ? spanText(outer[1]) : null,
+        from_date: fromDate,
+        to_date: toDate,
+        description: text(summaryText),
+        linkedin_url: attr(kids(elements[0])[0], 'href'),
+    });
+}
+return results;
+"""
+
+COMPANY_ABOUT = r"""
+const grid = document.querySelector('.artdeco-card.org-page-details-module__card-spacing.org-about-module__margin-bottom');
+const fields = {};
+for (const label of (grid ? grid.querySelectorAll('dt') : [])) {
+    // The value is the next <dd>; "Company size" has a second <dd> with associated members
+    let value = label.nextElementSibling;
+    while (value && value.tagName !== 'DD') value = value.nextElementSibling;
+    if (value) fields[text(label)] = text(value);
+}
+let headcount = null;
+for (const span of document.querySelectorAll('.mt1 span')) {
+    const t = text(span);
+    if (t.includes('See all') && t.includes('employees on LinkedIn')) {
+        headcount = parseInt(t.replace('See all', '').replace('employees on LinkedIn', '').replace(/,/g, '').trim(), 10) || null;
+    }
+}
+return {
+    name: text(document.querySelector('.org-top-card-summary__title')),
+    about_us: text(first(grid, 'p')) || null,
+    fields: fields,
+    headcount: headcount,
+};
+"""
+
+JOB_CARDS = r"""
+// arguments[0]: container element or CSS selector to search in (defaults to the whole page)
+const root = typeof arguments[0] === 'string' ? document.querySelector(arguments[0]) : (arguments[0] || document);
+const cardSelector = arguments[1] || '.job-card-list, .jobs-job-board-list__item';
+return Array.from(root ? root.querySelectorAll(cardSelector) : []).map((card) => {
+    const link = first(card, '.job-card-list__title');
+    return {
+        job_title: text(link),
+        linkedin_url: attr(link, 'href') ? link.href : null,
+        company: text(first(card, '.artdeco-entity-lockup__subtitle')),
+        location: text(first(card, '.job-card-container__metadata-wrapper')),
+    };
+}).filter((job) => job.linkedin_url);
+"""
+
+JOB_DETAILS = r"""
+const company = document.querySelector('.job-details-jobs-unified-top-card__company-name');
+const spans = Array.from(document.querySelectorAll('.job-details-jobs-unified-top-card__primary-description-container span'))
+    .map(text).filter((t) => t !== '');
+const description = document.querySelector('.jobs-description');
+const applicants = document.querySelector('.jobs-unified-top-card__applicant-count');
+const salary = document.querySelector('.jobs-unified-description__salary-main-rail-card');
+return {
+    job_title: text(document.querySelector('.job-details-jobs-unified-top-card__job-title')),
+    company: text(company),
+    company_linkedin_url: attr(first(company, 'a'), 'href') ? first(company, 'a').href : null,
+    location: spans[0] || null,
+    posted_date: spans[3] || null,
+    applicant_count: applicants ? text(applicants) : 0,
+    // textContent includes the collapsed part of the description without clicking "see more"
+    job_description: description ? description.textContent.replace(/[ \t]+/g, ' ').replace(/\n\s*\n+/g, '\n').trim() : null,
+    benefits: salary ? text(salary) : null,
+};
+"""
+
+EXTRACTORS = {
+    "top_card": TOP_CARD,
+    "experiences": EXPERIENCES,
+    "educations": EDUCATIONS,
+    "company_about": COMPANY_ABOUT,
+    "job_cards": JOB_CARDS,
+    "job_details": JOB_DETAILS,
+}
+
+
+def script(name):
+    """Full script for `execute_script`, helpers included"""
+    if name not in EXTRACTORS:
+        raise KeyError(f"Unknown extractor: {name}")
+    return _HELPERS + EXTRACTORS[name]
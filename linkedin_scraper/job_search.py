@@ -1,11 +1,14 @@
 import os
-from typing import List
-from time import sleep
+from collections import deque
+from itertools import count
+from typing import Iterator, List
 import urllib.parse
 
 from .objects import Scraper
 from . import constants as c
+from . import resources
 from .jobs import Job
+from .urls import job_id
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -14,12 +17,21 @@ from selenium.webdriver.common.keys import Keys
 
 
 class JobSearch(Scraper):
+    PAGE_SIZE = 25
     AREAS = ["recommended_jobs", None, "still_hiring", "more_jobs"]
-
-    def __init__(self, driver, base_url="https://www.linkedin.com/jobs/", close_on_complete=False, scrape=True, scrape_recommended_jobs=True):
+    WAITS = {
+        "recommended_jobs": (0.5, 10),
+        "job_search_results": (0.5, 10),
+        "job_search_scroll": (0.2, 5),
+        "job_details_tab": (0, 30),
+    }
+
+    def __init__(self, driver, base_url="https://www.linkedin.com/jobs/", close_on_complete=False, scrape=True, scrape_recommended_jobs=True, use_extractors=False, waits=None):
         super().__init__()
         self.driver = driver
         self.base_url = base_url
+        self.use_extractors = use_extractors
+        self.waits = waits or {}
 
         if scrape:
             self.scrape(close_on_complete, scrape_recommended_jobs)
@@ -27,7 +39,9 @@ class JobSearch(Scraper):
 
     def scrape(self, close_on_complete=True, scrape_recommended_jobs=True):
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete, scrape_recommended_jobs=scrape_recommended_jobs)
+            # Navigation and waits inside are timed as their own phases
+            with self.phase("extraction"):
+                self.scrape_logged_in(close_on_complete=close_on_complete, scrape_recommended_jobs=scrape_recommended_jobs)
         else:
             raise NotImplemented("This part is not implemented yet")
 
@@ -36,26 +50,39 @@ class JobSearch(Scraper):
         job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
         job_title = job_div.text.strip()
         linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
+        company = base_element.find_element(By.CLASS_NAME, "artdeco-entity-lockup__subtitle").text
+        location = base_element.find_element(By.CLASS_NAME, "job-card-container__metadata-wrapper").text
         job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
         return job
 
 
+    def scrape_job_cards(self, root, card_selector=None) -> List[Job]:
+        """All job cards under `root` (element or CSS selector) in one extractor call"""
+        return self.run_extractor(
+            "job_cards",
+            lambda card: Job(scrape=False, driver=self.driver, **card),
+            root,
+            card_selector,
+        )
+
+
     def scrape_logged_in(self, close_on_complete=True, scrape_recommended_jobs=True):
         driver = self.driver
-        driver.get(self.base_url)
+        self.navigate(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+            self.wait_for_stable_count(".scaffold-finite-scroll__content .artdeco-card", site="recommended_jobs")
             job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
             areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
             for i, area in enumerate(areas):
                 area_name = self.AREAS[i]
                 if not area_name:
                     continue
+                if self.use_extractors:
+                    setattr(self, area_name, self.scrape_job_cards(area, ".jobs-job-board-list__item"))
+                    continue
                 area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
+                for job_posting in area.find_elements(By.CLASS_NAME, "jobs-job-board-list__item"):
                     job = self.scrape_job_card(job_posting)
                     area_results.append(job)
                 setattr(self, area_name, area_results)
@@ -63,26 +90,133 @@ class JobSearch(Scraper):
 
 
     def search(self, search_term: str) -> List[Job]:
+        with self.phase("extraction"):
+            return self._search(search_term)
+
+    def iter_search(self, search_term: str, limit=None, details=False, tabs=3) -> Iterator[Job]:
+        """
+        Yields the search results page by page (?start= offsets), each job id once,
+        until a page comes back short or brings nothing new. details=True fills each
+        Job from its posting page first, see iter_details.
+        """
+        jobs = self._iter_cards(search_term)
+        if details:
+            jobs = self.iter_details(jobs, tabs=tabs)
+        for yielded, job in enumerate(jobs, 1):
+            yield job
+            if limit is not None and yielded >= limit:
+                return
+
+    def _iter_cards(self, search_term):
+        seen = set()
+        for start in count(0, self.PAGE_SIZE):
+            with self.phase("extraction"):
+                cards = self._search(search_term, start)
+            new = 0
+            for job in cards:
+                key = job_id(job.linkedin_url) or job.linkedin_url
+                if key in seen:
+                    continue
+                seen.add(key)
+                new += 1
+                yield job
+            if new == 0 or len(cards) < self.PAGE_SIZE:
+                return
+
+    def iter_details(self, jobs, tabs=3) -> Iterator[Job]:
+        """
+        Scrapes the posting page of every Job in `jobs` and yields them in order.
+        Up to `tabs` postings load at the same time in their own browser tabs; the
+        driver only reads a tab once its page is needed, so page loads overlap
+        and extraction stays sequential. A posting whose page doesn't load within
+        job_details_tab's max_wait is skipped. The tabs are closed when the generator ends.
+        """
+        driver = self.driver
+        home = driver.current_window_handle
+        opened = []
+        idle = []
+        loading = deque()
+        jobs = iter(jobs)
+        try:
+            while True:
+                while len(loading) < tabs:
+                    # `jobs` may navigate (next search page), always from the search tab
+                    driver.switch_to.window(home)
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    if idle:
+                        handle = idle.pop()
+                        driver.switch_to.window(handle)
+                    else:
+                        driver.switch_to.new_window("tab")
+                        handle = driver.current_window_handle
+                        opened.append(handle)
+                        # The block list is per tab, a new one starts without it
+                        policy = resources.applied(driver)
+                        if policy is not None:
+                            policy.apply(driver)
+                    # Starts the navigation without waiting for the page. The marker tells the
+                    # previous posting in a reused tab apart from the new document.
+                    driver.execute_script(
+                        "document.documentElement.setAttribute('data-stale', '');"
+                        "window.location.href = arguments[0];", job.linkedin_url)
+                    loading.append((job, handle))
+                if not loading:
+                    return
+                job, handle = loading.popleft()
+                driver.switch_to.window(handle)
+                loaded = self.wait_until(lambda d: d.execute_script(
+                    "return !document.documentElement.hasAttribute('data-stale');"), site="job_details_tab")
+                if not loaded:
+                    # Still the previous posting's DOM, reading it would mix up two jobs. The tab
+                    # may still be navigating, so it is closed rather than reused.
+                    print(f"DEBUG: Job details page did not load in time, skipping {job.linkedin_url}")
+                    driver.close()
+                    opened.remove(handle)
+                    continue
+                idle.append(handle)
+                job.use_extractors = self.use_extractors
+                try:
+                    with self.phase("extraction"):
+                        job.read_details()
+                except Exception as e:
+                    print(f"DEBUG: Job details failed for {job.linkedin_url}: {e}")
+                yield job
+        finally:
+            for handle in opened:
+                try:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                except Exception:
+                    pass
+            driver.switch_to.window(home)
+
+    def _search(self, search_term, start=0):
         url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
-        self.driver.get(url)
+        if start:
+            url += f"&start={start}"
+        self.navigate(url)
         self.scroll_to_bottom()
         self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
         job_listing_class_name = "jobs-search-results-list"
+        cards_css = f".{job_listing_class_name} .job-card-list"
+        # Past the last page LinkedIn shows the no results banner instead of cards
+        self.wait_for_selector(f"{cards_css}, .jobs-search-no-results-banner", site="job_search_results")
+        if not self.count_elements(cards_css):
+            return []
         job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        # Cards render lazily as the list scrolls; wait for each batch to settle
+        for percent in (0.3, 0.6, 1):
+            self.scroll_class_name_element_to_page_percent(job_listing_class_name, percent)
+            self.focus()
+            self.wait_for_stable_count(cards_css, site="job_search_scroll")
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        if self.use_extractors:
+            self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing)
+            return self.scrape_job_cards(job_listing, ".job-card-list")
 
         job_results = []
         for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
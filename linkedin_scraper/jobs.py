@@ -1,13 +1,28 @@
-from selenium.common.exceptions import TimeoutException
+import re
 
 from .objects import Scraper
 from . import constants as c
+from . import voyager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# Required parts of a posting page; everything else is optional and read without waiting
+TITLE_CLASS = "job-details-jobs-unified-top-card__job-title"
+DESCRIPTION_CLASS = "jobs-description"
+
+
+def clean_text(text):
+    """Collapses the whitespace of textContent the way the job_details extractor does"""
+    text = re.sub(r"[ \t]+", " ", text or "")
+    return re.sub(r"\n\s*\n+", "\n", text).strip()
+
+
 class Job(Scraper):
+    WAITS = {
+        "job_details": (0, 10),
+    }
 
     def __init__(
         self,
@@ -23,6 +38,8 @@ class Job(Scraper):
         driver=None,
         close_on_complete=True,
         scrape=True,
+        use_extractors=False,
+        intercept=False,
     ):
         super().__init__()
         self.linkedin_url = linkedin_url
@@ -35,6 +52,9 @@ class Job(Scraper):
         self.applicant_count = applicant_count
         self.job_description = job_description
         self.benefits = benefits
+        self.use_extractors = use_extractors
+        # Read the posting from the captured API responses, DOM scraping stays the fallback
+        self.intercept = intercept
 
         if scrape:
             self.scrape(close_on_complete)
@@ -44,7 +64,9 @@ class Job(Scraper):
 
     def scrape(self, close_on_complete=True):
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete)
+            # Navigation and waits inside are timed as their own phases
+            with self.phase("extraction"):
+                self.scrape_logged_in(close_on_complete=close_on_complete)
         else:
             raise NotImplemented("This part is not implemented yet")
 
@@ -62,32 +84,62 @@ class Job(Scraper):
         }
 
 
+    def get_from_api(self):
+        """Applies the intercepted JobPosting JSON; True if it had title and description"""
+        self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title")
+        posting = voyager.find_job(self.api_entities(voyager.JOB_POSTING), self.linkedin_url)
+        if posting is None:
+            return False
+        fields = voyager.job_fields(posting)
+        for key, value in fields.items():
+            setattr(self, key, value)
+        return "job_title" in fields and "job_description" in fields
+
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         
-        driver.get(self.linkedin_url)
+        if self.intercept:
+            self.start_interception()
+        self.navigate(self.linkedin_url)
         self.focus()
-        self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
-        self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
-        self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
-        primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
-        texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
-        self.location = texts[0]
-        self.posted_date = texts[3]
-        
-        try:
-            self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
-        except TimeoutException:
-            self.applicant_count = 0
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        job_description_elem.find_element(By.TAG_NAME, "button").click()
-        self.job_description = job_description_elem.text.strip()
-        try:
-            self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
-        except TimeoutException:
-            self.benefits = None
+        self.read_details()
 
         if close_on_complete:
             driver.close()
+
+    def wait_for_details(self):
+        """One wait until title and description are both on the page"""
+        return self.wait_until(lambda driver: driver.execute_script(
+            "return !!document.querySelector(arguments[0]) && !!document.querySelector(arguments[1]);",
+            "." + TITLE_CLASS, "." + DESCRIPTION_CLASS,
+        ), site="job_details")
+
+    def read_details(self):
+        """Reads the already loaded posting page into the job fields (no navigation)"""
+        if self.intercept and self.get_from_api():
+            return
+        self.wait_for_details()
+        if self.use_extractors:
+            for key, value in self.run_extractor("job_details").items():
+                setattr(self, key, value)
+            return
+
+        # Single pass: optional parts are looked up with find_elements, which returns
+        # [] right away instead of waiting for a timeout
+        driver = self.driver
+        self.job_title = driver.find_element(By.CLASS_NAME, TITLE_CLASS).text.strip()
+        company = driver.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__company-name")
+        self.company = company.text.strip()
+        links = company.find_elements(By.TAG_NAME, "a")
+        self.company_linkedin_url = links[0].get_attribute("href") if links else None
+        spans = driver.find_elements(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__primary-description-container span")
+        texts = [text for text in (span.text.strip() for span in spans) if text]
+        self.location = texts[0] if texts else None
+        self.posted_date = texts[3] if len(texts) > 3 else None
+
+        applicants = driver.find_elements(By.CLASS_NAME, "jobs-unified-top-card__applicant-count")
+        self.applicant_count = applicants[0].text.strip() if applicants else 0
+        # textContent includes the collapsed part, no need to click "see more"
+        self.job_description = clean_text(driver.find_element(By.CLASS_NAME, DESCRIPTION_CLASS).get_attribute("textContent"))
+        benefits = driver.find_elements(By.CLASS_NAME, "jobs-unified-description__salary-main-rail-card")
+        self.benefits = benefits[0].text.strip() if benefits else None
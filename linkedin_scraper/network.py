@@ -0,0 +1,141 @@
+"""
+Network events of a Chrome driver, read from its performance log.
+
+chromedriver hands out each performance log entry only once, so several
+readers (the resource report, API interception) would steal events from
+each other. Everything goes through a per-driver buffer here instead;
+readers take a `mark()` and later ask for the events since that mark.
+
+The driver must have been started with the performance log enabled,
+see `enable_performance_log`.
+"""
+import base64
+import json
+import threading
+import weakref
+from collections import deque
+from fnmatch import fnmatchcase
+
+# Oldest events are dropped beyond this many per driver
+MAX_EVENTS = 20000
+
+_buffers = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+class _EventBuffer:
+    def __init__(self, max_events=MAX_EVENTS):
+        self.events = deque(maxlen=max_events)
+        self.total = 0
+
+    @property
+    def position(self):
+        return self.total
+
+    def since(self, position):
+        dropped = self.total - len(self.events)
+        return list(self.events)[max(0, position - dropped):]
+
+    def clear(self):
+        self.events.clear()
+
+
+def enable_performance_log(opts):
+    """Turns on the performance log for a driver about to be created from these options"""
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def _collect(driver):
+    """Moves new performance log entries into the driver's buffer; None if the log is unavailable"""
+    buffer = _buffers.get(driver)
+    if buffer is None:
+        buffer = _buffers[driver] = _EventBuffer()
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        buffer.events.append(message)
+        buffer.total += 1
+    return buffer
+
+
+def mark(driver):
+    """Position to pass to `events(since=...)` to only see what happens from now on"""
+    with _lock:
+        buffer = _collect(driver)
+        return buffer.position if buffer else 0
+
+
+def events(driver, since=0):
+    """CDP messages ({"method": ..., "params": ...}) seen since `since`, or None without a performance log"""
+    with _lock:
+        buffer = _collect(driver)
+        return buffer.since(since) if buffer else None
+
+
+def reset(driver):
+    """Forgets every event collected so far (e.g. by the previous request on a pooled browser)"""
+    with _lock:
+        buffer = _collect(driver)
+        if buffer:
+            buffer.clear()
+
+
+def responses(driver, since=0, pattern="*", mime_type=None):
+    """
+    Finished responses since `since` whose URL matches `pattern`:
+    a list of {"request_id", "url", "status", "mime_type"} in arrival order.
+    """
+    messages = events(driver, since) or []
+    received = {}
+    finished = []
+    for message in messages:
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.responseReceived":
+            response = params.get("response", {})
+            url = response.get("url", "")
+            if not fnmatchcase(url, pattern):
+                continue
+            if mime_type and mime_type not in response.get("mimeType", ""):
+                continue
+            received[params.get("requestId")] = {
+                "request_id": params.get("requestId"),
+                "url": url,
+                "status": response.get("status"),
+                "mime_type": response.get("mimeType"),
+            }
+        elif method == "Network.loadingFinished" and params.get("requestId") in received:
+            finished.append(received.pop(params["requestId"]))
+    return finished
+
+
+def response_body(driver, request_id):
+    """Body of a finished response as text, None once Chrome has evicted it"""
+    try:
+        body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+    except Exception:
+        return None
+    if body.get("base64Encoded"):
+        return base64.b64decode(body["body"]).decode("utf-8", "replace")
+    return body.get("body")
+
+
+def json_responses(driver, since=0, pattern="*", mime_type="json"):
+    """Parsed JSON bodies of the matching responses since `since`, as (url, payload) pairs"""
+    payloads = []
+    for response in responses(driver, since, pattern, mime_type):
+        if response["status"] and response["status"] >= 400:
+            continue
+        body = response_body(driver, response["request_id"])
+        if not body:
+            continue
+        try:
+            payloads.append((response["url"], json.loads(body)))
+        except ValueError:
+            continue
+    return payloads
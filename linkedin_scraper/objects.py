@@ -1,25 +1,34 @@
-from dataclasses import dataclass
-from time import sleep
+import random
+from dataclasses import dataclass, field, fields, is_dataclass
+from time import sleep, monotonic
 
 from selenium.webdriver import Chrome
 
+from . import auth
 from . import constants as c
+from . import extractors
+from . import network
+from . import voyager
+from . import timing
+from .serialize import Record
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 
-@dataclass
-class Contact:
+# Result records are slotted: no per-instance __dict__, and to_dict()/to_json() from serialize
+@dataclass(slots=True)
+class Contact(Record):
     name: str = None
     occupation: str = None
     url: str = None
 
 
-@dataclass
-class Institution:
+@dataclass(slots=True)
+class Institution(Record):
     institution_name: str = None
     linkedin_url: str = None
     website: str = None
@@ -30,7 +39,7 @@ class Institution:
     founded: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Experience(Institution):
     from_date: str = None
     to_date: str = None
@@ -40,7 +49,7 @@ class Experience(Institution):
     location: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Education(Institution):
     from_date: str = None
     to_date: str = None
@@ -48,15 +57,33 @@ class Education(Institution):
     degree: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Interest(Institution):
-    title = None
+    title: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Accomplishment(Institution):
-    category = None
-    title = None
+    category: str = None
+    title: str = None
+
+
+@dataclass(slots=True)
+class Profile(Record):
+    """What a Person scrape produced, see Person.result()"""
+    linkedin_url: str = None
+    name: str = None
+    headline: str = None
+    job_title: str = None
+    company: str = None
+    location: str = None
+    about: str = None
+    open_to_work: bool = None
+    experiences: list = field(default_factory=list)
+    educations: list = field(default_factory=list)
+    interests: list = field(default_factory=list)
+    accomplishments: list = field(default_factory=list)
+    contacts: list = field(default_factory=list)
 
 
 @dataclass
@@ -65,10 +92,119 @@ class Scraper:
     WAIT_FOR_ELEMENT_TIMEOUT = 5
     TOP_CARD = "pv-top-card"
 
+    # Readiness waits, per call site: (min_delay, max_wait) in seconds.
+    # max_wait bounds how long a DOM condition is polled, min_delay is a
+    # human-like pause that is kept even when the page is ready earlier.
+    # Subclasses list their call sites in WAITS; pass waits={...} to override.
+    # An override replaces single fields: (None, 3) or {"max_wait": 3} keeps min_delay.
+    WAITS = {}
+    DEFAULT_WAIT = (0, 10)
+    POLL_INTERVAL = 0.1
+
     @staticmethod
     def wait(duration):
         sleep(int(duration))
 
+    def phase(self, name):
+        """Context manager timing a block as one of timing.PHASES"""
+        return timing.phase(self, name)
+
+    def navigate(self, url):
+        with self.phase("navigation"):
+            self.driver.get(url)
+        # Passive login check: a redirect to /login, /checkpoint or /authwall means signed out
+        auth.observe(self.driver)
+
+    WAIT_FIELDS = ("min_delay", "max_wait")
+
+    @classmethod
+    def _merge_wait(cls, limits, override):
+        """`limits` with the fields `override` sets; a tuple with None entries or a dict"""
+        if not override:
+            return limits
+        if isinstance(override, dict):
+            override = tuple(override.get(name) for name in cls.WAIT_FIELDS)
+        return tuple(value if value is not None else default for value, default in zip(override, limits))
+
+    def wait_limits(self, site):
+        """(min_delay, max_wait) of a call site: DEFAULT_WAIT, then WAITS, then waits={...}"""
+        overrides = getattr(self, "waits", None) or {}
+        limits = self._merge_wait(tuple(self.DEFAULT_WAIT), self.WAITS.get(site))
+        return self._merge_wait(limits, overrides.get(site))
+
+    def human_delay(self, site, started=None):
+        """Sleeps whatever is left of the call site's min_delay (with a little jitter)"""
+        min_delay, _ = self.wait_limits(site)
+        if min_delay <= 0:
+            return
+        target = random.uniform(min_delay, min_delay * 1.5)
+        elapsed = monotonic() - started if started is not None else 0
+        if target > elapsed:
+            sleep(target - elapsed)
+
+    def wait_until(self, condition, site=None, timeout=None):
+        """
+        Polls condition(driver) every POLL_INTERVAL until it returns something truthy.
+        Returns that value, or None once the call site's max_wait is up.
+        """
+        started = monotonic()
+        _, max_wait = self.wait_limits(site)
+        with self.phase("wait"):
+            try:
+                result = WebDriverWait(
+                    self.driver, max_wait if timeout is None else timeout, poll_frequency=self.POLL_INTERVAL
+                ).until(condition)
+            except TimeoutException:
+                result = None
+            self.human_delay(site, started)
+        return result
+
+    def count_elements(self, css, base=None):
+        if base is None:
+            return self.driver.execute_script("return document.querySelectorAll(arguments[0]).length;", css)
+        return self.driver.execute_script("return arguments[1].querySelectorAll(arguments[0]).length;", css, base)
+
+    def wait_for_selector(self, css, site=None, base=None):
+        """Waits until at least one element matches; returns the count (0 on timeout)"""
+        return self.wait_until(lambda _: self.count_elements(css, base), site=site) or 0
+
+    def wait_for_count_above(self, css, previous, site=None, base=None):
+        """Waits until a list grows past `previous` items; returns the new count or None"""
+        def grown(_):
+            count = self.count_elements(css, base)
+            return count if count > previous else False
+        return self.wait_until(grown, site=site)
+
+    def wait_for_stable_count(self, css, site=None, base=None, stable_for=0.5):
+        """Waits until a non-empty list stops growing for `stable_for` seconds; returns its count"""
+        state = {"count": -1, "since": monotonic()}
+
+        def stable(_):
+            count = self.count_elements(css, base)
+            now = monotonic()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return count if count > 0 and now - state["since"] >= stable_for else False
+
+        return self.wait_until(stable, site=site) or max(state["count"], 0)
+
+    def wait_for_network_idle(self, site=None, idle_for=0.5):
+        """Waits for document.readyState == complete and no new resource requests for `idle_for` seconds"""
+        state = {"resources": -1, "since": monotonic()}
+
+        def idle(_):
+            ready, resources = self.driver.execute_script(
+                "return [document.readyState, performance.getEntriesByType('resource').length];"
+            )
+            now = monotonic()
+            if ready != "complete" or resources != state["resources"]:
+                state["resources"], state["since"] = resources, now
+                return False
+            return now - state["since"] >= idle_for
+
+        return bool(self.wait_until(idle, site=site))
+
     def focus(self):
         self.driver.execute_script('alert("Focus window")')
         self.driver.switch_to.alert.accept()
@@ -77,41 +213,94 @@ class Scraper:
         action = webdriver.ActionChains(self.driver)
         action.move_to_element(elem).perform()
 
+    def run_extractor(self, name, into=None, *args):
+        """
+        Runs a bundled extractor from `extractors` in one execute_script call.
+        `into` maps the JSON result: a dataclass gets the matching keys as fields,
+        any other callable is called with the raw item. Lists are mapped item by item.
+        """
+        data = self.driver.execute_script(extractors.script(name), *args)
+        if into is None or data is None:
+            return data
+        if isinstance(data, list):
+            return [self._map_extracted(item, into) for item in data]
+        return self._map_extracted(data, into)
+
+    @staticmethod
+    def _map_extracted(item, into):
+        if is_dataclass(into):
+            names = {f.name for f in fields(into)}
+            return into(**{k: v for k, v in item.items() if k in names})
+        return into(item)
+
+    # Network interception: read the JSON the page was hydrated from instead of
+    # walking the rendered DOM. Needs a driver started with the performance log
+    # (network.enable_performance_log); without one the API lookups come back
+    # empty and the DOM scrapers run as before.
+    def start_interception(self):
+        """Only responses from here on are considered by api_entities()"""
+        self._network_mark = network.mark(self.driver)
+
+    def api_payloads(self, pattern=voyager.API_PATTERN):
+        return network.json_responses(self.driver, since=getattr(self, "_network_mark", 0), pattern=pattern)
+
+    def api_entities(self, type_suffix, payloads=None):
+        """voyager entities of that $type captured since start_interception()"""
+        return voyager.entities(self.api_payloads() if payloads is None else payloads, type_suffix)
+
     def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    by,
-                    name
+        with self.phase("wait"):
+            return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (
+                        by,
+                        name
+                    )
                 )
             )
-        )
 
     def wait_for_all_elements_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_all_elements_located(
-                (
-                    by,
-                    name
+        with self.phase("wait"):
+            return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_all_elements_located(
+                    (
+                        by,
+                        name
+                    )
                 )
             )
-        )
 
 
-    def is_signed_in(self):
+    def is_signed_in(self, check=False):
+        """
+        Trusts the driver's cached auth state (see auth.py); the nav bar probe only
+        runs when the last confirmation expired, a logout was seen or check=True
+        """
+        state = auth.state(self.driver)
+        if not check:
+            if auth.observe(self.driver) is False:
+                return False
+            known = state.known()
+            if known is not None:
+                return known
+        signed_in = self.probe_signed_in()
+        state.record(signed_in, reason="global nav missing")
+        return signed_in
+
+    def probe_signed_in(self):
+        """Active check: waits up to WAIT_FOR_ELEMENT_TIMEOUT for the global nav"""
         try:
-            WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (
-                        By.CLASS_NAME,
-                        c.VERIFY_LOGIN_ID,
+            with self.phase("wait"):
+                WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                    EC.presence_of_element_located(
+                        (
+                            By.CLASS_NAME,
+                            c.VERIFY_LOGIN_ID,
+                        )
                     )
                 )
-            )
-
-            self.driver.find_element(By.CLASS_NAME, c.VERIFY_LOGIN_ID)
             return True
         except Exception as e:
             pass
@@ -0,0 +1,82 @@
+"""
+Pagination for lazily loaded lists such as a company's People tab.
+
+Each `next_page()` is one async script: it clicks the "Show more results"
+button if there is one, smooth-scrolls to the bottom once and resolves as
+soon as a MutationObserver sees the list grow. Nothing sleeps for a fixed
+time, so a page costs what the site takes to deliver it. Once the list has
+shown a load-more button, the button disappearing is the end marker;
+lists without one end when nothing new arrives within the call site's
+max_wait.
+"""
+from time import monotonic
+
+PAGINATE_JS = r"""
+const [list, itemCss, previous, buttonCss, buttonMode, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const count = () => list.querySelectorAll(itemCss).length;
+const button = () => buttonCss ? document.querySelector(buttonCss) : null;
+let finished = false, clicked = false, observer = null, timer = null;
+function finish() {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done({count: count(), button: !!button(), clicked: clicked});
+}
+if (count() > previous || (buttonMode && !button())) {
+    finish();
+} else {
+    observer = new MutationObserver(() => { if (count() > previous) finish(); });
+    observer.observe(list, {childList: true, subtree: true});
+    timer = setTimeout(finish, timeoutMs);
+    const more = button();
+    if (more && !more.disabled) {
+        more.click();
+        clicked = true;
+    }
+    window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'});
+}
+"""
+
+
+class ListPaginator:
+    """
+    Loads the next batch of `list_element` on demand for `scraper`.
+    `count` is the number of items seen so far, `finished` turns True at the end marker.
+    """
+
+    LOAD_MORE_CSS = ".scaffold-finite-scroll__load-button"
+
+    def __init__(self, scraper, list_element, item_css="li", load_more_css=LOAD_MORE_CSS, site=None):
+        self.scraper = scraper
+        self.list_element = list_element
+        self.item_css = item_css
+        self.load_more_css = load_more_css
+        self.site = site
+        self.count = scraper.driver.execute_script(
+            "return arguments[0].querySelectorAll(arguments[1]).length;", list_element, item_css)
+        # The page's own timeout has to stay below the driver's script timeout
+        self.script_timeout = (scraper.driver.timeouts.script or 30) - 1
+        self.button_mode = False
+        self.finished = False
+
+    def next_page(self):
+        """Waits for more items; False once the list is exhausted"""
+        if self.finished:
+            return False
+        driver = self.scraper.driver
+        _, max_wait = self.scraper.wait_limits(self.site)
+        started = monotonic()
+        with self.scraper.phase("wait"):
+            result = driver.execute_async_script(
+                PAGINATE_JS, self.list_element, self.item_css, self.count,
+                self.load_more_css, self.button_mode, int(min(max_wait, self.script_timeout) * 1000),
+            )
+            self.scraper.human_delay(self.site, started)
+        self.button_mode = self.button_mode or result["button"] or result["clicked"]
+        grew = result["count"] > self.count
+        self.count = result["count"]
+        if not grew or (self.button_mode and not result["button"]):
+            self.finished = True
+        return grew
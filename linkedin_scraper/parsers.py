@@ -0,0 +1,258 @@
+"""
+lxml backend for the profile detail pages.
+
+Takes one `driver.page_source` snapshot and walks it locally, mirroring the
+WebDriver traversal in Person.get_experiences / get_educations step by step,
+so a whole details page costs a single round trip to chromedriver.
+"""
+import re
+
+from lxml import html
+
+from .objects import Experience, Education
+
+# Elements the browser hides from WebElement.text
+HIDDEN_CLASSES = ("visually-hidden",)
+SKIPPED_TAGS = ("script", "style", "template", "noscript")
+BLOCK_TAGS = (
+    "div", "p", "li", "ul", "ol", "section", "article", "header", "footer",
+    "h1", "h2", "h3", "h4", "h5", "h6", "br", "tr", "table", "main",
+)
+
+
+def by_class(name):
+    """XPath predicate equivalent to By.CLASS_NAME"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(elems):
+    return elems[0] if elems else None
+
+
+def _children(elem):
+    """By.XPATH '*' - direct element children"""
+    return [child for child in elem if isinstance(child.tag, str)]
+
+
+def _is_hidden(elem):
+    if elem.tag in SKIPPED_TAGS:
+        return True
+    classes = (elem.get("class") or "").split()
+    return any(c in classes for c in HIDDEN_CLASSES)
+
+
+def text(elem):
+    """Approximates WebElement.text: visible text, one line per block, whitespace collapsed"""
+    if elem is None:
+        return ""
+    parts = []
+
+    def walk(e):
+        block = e.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if e.text:
+            parts.append(e.text)
+        for child in e:
+            if isinstance(child.tag, str) and not _is_hidden(child):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(elem)
+    lines = (re.sub(r"\s+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _span_text(elem):
+    """find_element(By.TAG_NAME, 'span').text"""
+    return text(_first(elem.xpath(".//span")))
+
+
+def split_work_times(work_times):
+    """'Jan 2020 - Present · 4 yrs' -> (from_date, to_date, duration)"""
+    if work_times:
+        parts = work_times.split("·")
+        times = parts[0].strip() if parts else ""
+        duration = parts[1].strip() if len(parts) > 1 else None
+    else:
+        times = ""
+        duration = None
+
+    from_date = " ".join(times.split(" ")[:2]) if times else ""
+    to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+    return from_date, to_date, duration
+
+
+def _main_list(tree):
+    main = _first(tree.xpath("//main"))
+    if main is None:
+        return None
+    return _first(main.xpath(f".//*[{by_class('pvs-list__container')}]"))
+
+
+def _entities(main_list):
+    for item in main_list.xpath(f".//*[{by_class('pvs-list__paged-list-item')}]"):
+        entity = _first(item.xpath(".//div[@data-view-name='profile-component-entity']"))
+        if entity is not None:
+            yield entity
+
+
+def parse_experiences(page_source):
+    """Experiences from a details/experience page snapshot"""
+    tree = html.fromstring(page_source)
+    main_list = _main_list(tree)
+    if main_list is None:
+        return []
+
+    experiences = []
+    for position in _entities(main_list):
+        elements = _children(position)
+        if len(elements) < 2:
+            continue
+        company_logo_elem, position_details = elements[0], elements[1]
+
+        logo_children = _children(company_logo_elem)
+        company_linkedin_url = logo_children[0].get("href") if logo_children else None
+        if not company_linkedin_url:
+            continue
+
+        position_details_list = _children(position_details)
+        position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+        position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+        if position_summary_details is None:
+            continue
+
+        summary_children = _children(position_summary_details)
+        outer_positions = _children(summary_children[0]) if summary_children else []
+
+        if len(outer_positions) == 4:
+            position_title, company, work_times, location = (_span_text(e) for e in outer_positions)
+        elif len(outer_positions) == 3:
+            if "·" in text(outer_positions[2]):
+                position_title = _span_text(outer_positions[0])
+                company = _span_text(outer_positions[1])
+                work_times = _span_text(outer_positions[2])
+                location = ""
+            else:
+                position_title = ""
+                company = _span_text(outer_positions[0])
+                work_times = _span_text(outer_positions[1])
+                location = _span_text(outer_positions[2])
+        else:
+            position_title = ""
+            company = _span_text(outer_positions[0]) if outer_positions else ""
+            work_times = _span_text(outer_positions[1]) if len(outer_positions) > 1 else ""
+            location = ""
+
+        from_date, to_date, duration = split_work_times(work_times)
+
+        inner_positions = []
+        if position_summary_text is not None and any(
+            e.get("class") == "pvs-list__container" for e in _children(position_summary_text)
+        ):
+            container = _first(position_summary_text.xpath(f".//*[{by_class('pvs-list__container')}]"))
+            for _ in range(3):
+                container = _first(_children(container)) if container is not None else None
+            if container is not None:
+                inner_positions = container.xpath(f".//*[{by_class('pvs-list__paged-list-item')}]")
+
+        if len(inner_positions) > 1:
+            for description in inner_positions:
+                anchor = _first(description.xpath(".//a"))
+                if anchor is None:
+                    continue
+                res = _children(anchor)
+                position_title_elem = res[0] if len(res) > 0 else None
+                work_times_elem = res[1] if len(res) > 1 else None
+                location_elem = res[2] if len(res) > 2 else None
+
+                try:
+                    location = text(_children(location_elem)[0]) if location_elem is not None else None
+                    position_title = (
+                        text(_children(position_title_elem)[0].xpath(".//*")[0])
+                        if position_title_elem is not None else ""
+                    )
+                    work_times = text(_children(work_times_elem)[0]) if work_times_elem is not None else ""
+                except IndexError:
+                    continue
+
+                from_date, to_date, duration = split_work_times(work_times)
+                experiences.append(Experience(
+                    position_title=position_title,
+                    from_date=from_date,
+                    to_date=to_date,
+                    duration=duration,
+                    location=location,
+                    description=text(description),
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url
+                ))
+        else:
+            experiences.append(Experience(
+                position_title=position_title,
+                from_date=from_date,
+                to_date=to_date,
+                duration=duration,
+                location=location,
+                description=text(position_summary_text),
+                institution_name=company,
+                linkedin_url=company_linkedin_url
+            ))
+    return experiences
+
+
+def parse_educations(page_source):
+    """Educations from a details/education page snapshot"""
+    tree = html.fromstring(page_source)
+    main_list = _main_list(tree)
+    if main_list is None:
+        return []
+
+    educations = []
+    for position in _entities(main_list):
+        elements = _children(position)
+        if len(elements) < 2:
+            continue
+        institution_logo_elem, position_details = elements[0], elements[1]
+
+        logo_children = _children(institution_logo_elem)
+        institution_linkedin_url = logo_children[0].get("href") if logo_children else None
+
+        position_details_list = _children(position_details)
+        position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+        position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+        if position_summary_details is None:
+            continue
+
+        summary_children = _children(position_summary_details)
+        if not summary_children:
+            continue
+        outer_positions = _children(summary_children[0])
+
+        institution_name = _span_text(outer_positions[0]) if outer_positions else ""
+        degree = _span_text(outer_positions[1]) if len(outer_positions) > 1 else None
+
+        from_date = None
+        to_date = None
+        if len(outer_positions) > 2:
+            times = _span_text(outer_positions[2])
+            if times and "-" in times:
+                split_times = times.split(" ")
+                dash_index = split_times.index("-") if "-" in split_times else -1
+                if dash_index > 0:
+                    from_date = split_times[dash_index - 1]
+                if dash_index < len(split_times) - 1:
+                    to_date = split_times[-1]
+
+        educations.append(Education(
+            from_date=from_date,
+            to_date=to_date,
+            description=text(position_summary_text),
+            degree=degree,
+            institution_name=institution_name,
+            linkedin_url=institution_linkedin_url
+        ))
+    return educations
@@ -4,15 +4,26 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
-from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact
+from .chromedriver import chrome_service
+from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact, Profile
 import os
 from linkedin_scraper import selectors
+from . import parsers
+from . import network
+from . import voyager
+from .serialize import profile_dict
 
 
 class Person(Scraper):
 
+    # Everything scrape() can fetch; pass a subset as sections=[...] to skip the rest
+    SECTIONS = ("top_card", "about", "experiences", "educations", "interests", "accomplishments", "contacts")
+
     __TOP_CARD = "main"
     __WAIT_FOR_ELEMENT_TIMEOUT = 5
+    WAITS = {
+        "profile_top_card": (1, 10),
+    }
 
     def __init__(
         self,
@@ -31,6 +42,11 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
+        parser="webdriver",
+        use_extractors=False,
+        waits=None,
+        sections=None,
+        intercept=False,
     ):
         self.linkedin_url = linkedin_url
         self.name = name
@@ -41,28 +57,42 @@ class Person(Scraper):
         self.accomplishments = accomplishments or []
         self.also_viewed_urls = []
         self.contacts = contacts or []
+        # "webdriver" walks the live DOM, "lxml" parses one page_source snapshot locally
+        self.parser = parser
+        # Read whole sections with the bundled JS extractors (one round trip each)
+        self.use_extractors = use_extractors
+        # Read profile data from the captured API responses, DOM scraping stays the fallback
+        self.intercept = intercept
+        self.headline = None
+        self.waits = waits or {}
+        self.sections = self.SECTIONS if sections is None else tuple(sections)
+        unknown = set(self.sections) - set(self.SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
 
         if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(
-                        os.path.dirname(__file__), "drivers/chromedriver"
-                    )
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
+            options = webdriver.ChromeOptions()
+            if intercept:
+                network.enable_performance_log(options)
+            with self.phase("driver_startup"):
+                try:
+                    driver = webdriver.Chrome(service=chrome_service(), options=options)
+                except:
+                    driver = webdriver.Chrome(options=options)
 
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+        self.driver = driver
 
         if get:
-            driver.get(linkedin_url)
-
-        self.driver = driver
+            if intercept:
+                self.start_interception()
+            self.navigate(linkedin_url)
 
         if scrape:
             self.scrape(close_on_complete)
 
+    def wants(self, section):
+        return section in self.sections
+
     def add_about(self, about):
         self.about.append(about)
 
@@ -86,7 +116,9 @@ class Person(Scraper):
 
     def scrape(self, close_on_complete=True):
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete)
+            # Navigation and waits inside are timed as their own phases
+            with self.phase("extraction"):
+                self.scrape_logged_in(close_on_complete=close_on_complete)
         else:
             print("you are not logged in!")
 
@@ -106,14 +138,61 @@ class Person(Scraper):
         except:
             return False
 
+    # Top level entries of a details list; grouped roles nest more list items inside one entry
+    TOP_LEVEL_ITEMS = ".pvs-list__container .pvs-list__paged-list-item:not(.pvs-list__paged-list-item .pvs-list__paged-list-item)"
+
+    def _profile_urn(self):
+        """entityUrn of this person's profile, from the profile page or the responses since then"""
+        urn = getattr(self, "_profile_entity_urn", None)
+        if urn is None:
+            profile = voyager.find_profile(self.api_entities(voyager.PROFILE), self.linkedin_url)
+            urn = self._profile_entity_urn = profile.get("entityUrn") if profile else None
+        return urn
+
+    def _api_items(self, type_suffix, into, mapper, main):
+        """
+        Dataclass objects from the captured API entities of one $type that belong
+        to this profile; None (use the DOM) when the profile can't be identified or
+        the API list is shorter than what the page rendered.
+        """
+        entities = voyager.owned_by(self.api_entities(type_suffix), self._profile_urn())
+        if not entities:
+            return None
+        rendered = self.count_elements(self.TOP_LEVEL_ITEMS, main)
+        if len(entities) < rendered:
+            print(f"DEBUG: {len(entities)} API entities but {rendered} rendered items, reading the page")
+            return None
+        return [into(**mapper(entity)) for entity in entities]
+
     def get_experiences(self):
         url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
+        if self.intercept:
+            self.start_interception()
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+        if self.intercept:
+            self.wait_for_element_to_load(name="pvs-list__container", base=main)
+            experiences = self._api_items(voyager.POSITION, Experience, voyager.experience_fields, main)
+            if experiences:
+                for experience in experiences:
+                    self.add_experience(experience)
+                return
         self.scroll_to_half()
         self.scroll_to_bottom()
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        self.read_experiences(main_list)
+
+    def read_experiences(self, main_list):
+        """Reads the already loaded details/experience list into self.experiences (no navigation)"""
+        if self.use_extractors:
+            for experience in self.run_extractor("experiences", Experience):
+                self.add_experience(experience)
+            return
+        if self.parser == "lxml":
+            for experience in parsers.parse_experiences(self.driver.page_source):
+                self.add_experience(experience)
+            return
         for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
             position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
             
@@ -218,7 +297,7 @@ class Person(Scraper):
                             to_date=to_date,
                             duration=duration,
                             location=location,
-                            description=description,
+                            description=description.text,
                             institution_name=company,
                             linkedin_url=company_linkedin_url
                         )
@@ -243,12 +322,33 @@ class Person(Scraper):
 
     def get_educations(self):
         url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
+        if self.intercept:
+            self.start_interception()
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+        if self.intercept:
+            self.wait_for_element_to_load(name="pvs-list__container", base=main)
+            educations = self._api_items(voyager.EDUCATION, Education, voyager.education_fields, main)
+            if educations:
+                for education in educations:
+                    self.add_education(education)
+                return
         self.scroll_to_half()
         self.scroll_to_bottom()
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        self.read_educations(main_list)
+
+    def read_educations(self, main_list):
+        """Reads the already loaded details/education list into self.educations (no navigation)"""
+        if self.use_extractors:
+            for education in self.run_extractor("educations", Education):
+                self.add_education(education)
+            return
+        if self.parser == "lxml":
+            for education in parsers.parse_educations(self.driver.page_source):
+                self.add_education(education)
+            return
         for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
             try:
                 position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
@@ -318,6 +418,10 @@ class Person(Scraper):
         top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
         self.name = top_panel.find_element(By.TAG_NAME, "h1").text
         self.location = top_panel.find_element(By.XPATH, "//*[@class='text-body-small inline t-black--light break-words']").text
+        try:
+            self.headline = top_panel.find_element(By.CSS_SELECTOR, ".text-body-medium.break-words").text or None
+        except NoSuchElementException:
+            self.headline = None
 
     def get_about(self):
         try:
@@ -326,44 +430,36 @@ class Person(Scraper):
             about=None
         self.about = about
 
-    def scrape_logged_in(self, close_on_complete=True):
+    def get_top_card(self):
+        top_card = self.run_extractor("top_card")
+        self.name = top_card["name"]
+        self.location = top_card["location"]
+        self.headline = top_card["headline"] or None
+        self.open_to_work = top_card["open_to_work"]
+        self.about = top_card["about"]
+
+    def get_from_api(self):
+        """Fills top card and about from the intercepted profile JSON; returns the sections it filled"""
+        filled = set()
+        profile = voyager.find_profile(self.api_entities(voyager.PROFILE), self.linkedin_url)
+        if profile is None:
+            return filled
+        self._profile_entity_urn = profile.get("entityUrn")
+        fields = voyager.profile_fields(profile)
+        if self.wants("top_card") and "name" in fields:
+            self.name = fields["name"]
+            self.location = fields.get("location")
+            self.headline = fields.get("headline")
+            # the badge is only in the DOM
+            self.open_to_work = self.is_open_to_work()
+            filled.add("top_card")
+        if self.wants("about") and "about" in fields:
+            self.about = fields["about"]
+            filled.add("about")
+        return filled
+
+    def get_interests(self):
         driver = self.driver
-        duration = None
-
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    By.TAG_NAME,
-                    self.__TOP_CARD,
-                )
-            )
-        )
-        self.focus()
-        self.wait(5)
-
-        # get name and location
-        self.get_name_and_location()
-
-        self.open_to_work = self.is_open_to_work()
-
-        # get about
-        self.get_about()
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
-        )
-
-        # get experience
-        self.get_experiences()
-
-        # get education
-        self.get_educations()
-
-        driver.get(self.linkedin_url)
-
-        # get interest
         try:
 
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
@@ -387,7 +483,8 @@ class Person(Scraper):
         except:
             pass
 
-        # get accomplishment
+    def get_accomplishments(self):
+        driver = self.driver
         try:
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located(
@@ -407,14 +504,15 @@ class Person(Scraper):
                 for title in block.find_element(By.TAG_NAME,
                     "ul"
                 ).find_elements(By.TAG_NAME, "li"):
-                    accomplishment = Accomplishment(category.text, title.text)
+                    accomplishment = Accomplishment(category=category.text, title=title.text)
                     self.add_accomplishment(accomplishment)
         except:
             pass
 
-        # get connections
+    def get_contacts(self):
+        driver = self.driver
         try:
-            driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
+            self.navigate("https://www.linkedin.com/mynetwork/invite-connect/connections/")
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
             )
@@ -431,6 +529,64 @@ class Person(Scraper):
         except:
             connections = None
 
+    def scrape_logged_in(self, close_on_complete=True):
+        driver = self.driver
+        duration = None
+
+        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+            EC.presence_of_element_located(
+                (
+                    By.TAG_NAME,
+                    self.__TOP_CARD,
+                )
+            )
+        )
+        self.focus()
+        # Top card is rendered client side; wait for the name instead of a fixed 5s
+        self.wait_for_selector("main h1", site="profile_top_card")
+
+        filled = self.get_from_api() if self.intercept else set()
+        pending = [section for section in ("top_card", "about") if self.wants(section) and section not in filled]
+
+        if self.use_extractors and pending:
+            # name, location, headline, open to work and about in one call
+            self.get_top_card()
+        else:
+            if "top_card" in pending:
+                # get name and location
+                self.get_name_and_location()
+
+                self.open_to_work = self.is_open_to_work()
+
+            if "about" in pending:
+                # get about
+                self.get_about()
+        driver.execute_script(
+            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
+        )
+        driver.execute_script(
+            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
+        )
+
+        # Every section below costs at least one page load, so skipped ones are never visited
+        if self.wants("experiences"):
+            self.get_experiences()
+
+        if self.wants("educations"):
+            self.get_educations()
+
+        if self.wants("interests") or self.wants("accomplishments"):
+            self.navigate(self.linkedin_url)
+
+            if self.wants("interests"):
+                self.get_interests()
+
+            if self.wants("accomplishments"):
+                self.get_accomplishments()
+
+        if self.wants("contacts"):
+            self.get_contacts()
+
         if close_on_complete:
             driver.quit()
 
@@ -456,6 +612,30 @@ class Person(Scraper):
         else:
             return None
 
+    def result(self):
+        """The scraped data as a slotted Profile record"""
+        # The extractor and API paths store about as a string, the DOM path as a list
+        about = self.about if isinstance(self.about, str) else (self.about[0] if self.about else None)
+        return Profile(
+            linkedin_url=self.linkedin_url,
+            name=self.name,
+            headline=self.headline,
+            job_title=self.job_title,
+            company=self.company,
+            location=getattr(self, "location", None),
+            about=about,
+            open_to_work=getattr(self, "open_to_work", None),
+            experiences=list(self.experiences),
+            educations=list(self.educations),
+            interests=[interest.institution_name for interest in self.interests],
+            accomplishments=list(self.accomplishments),
+            contacts=list(self.contacts),
+        )
+
+    def to_dict(self):
+        """The profile JSON of the API, "N/A" for missing fields"""
+        return profile_dict(self.result())
+
     def __repr__(self):
         return "<Person {name}\n\nAbout\n{about}\n\nExperience\n{exp}\n\nEducation\n{edu}\n\nInterest\n{int}\n\nAccomplishments\n{acc}\n\nContacts\n{conn}>".format(
             name=self.name,
@@ -0,0 +1,169 @@
+"""
+Opt-in WebDriver command profiler.
+
+Every chromedriver round trip (driver calls and WebElement calls alike)
+goes through `driver.execute`. `profile_driver` wraps that method on one
+driver instance and records the command, the scraper method that
+triggered it, the latency and the payload size. The driver object itself
+is returned unchanged, so it can be passed to Person(driver=...) and
+friends as usual:
+
+    driver = profile_driver(webdriver.Chrome())
+    person = Person(url, driver=driver, close_on_complete=False)
+    print(driver.profiler.format_report())
+    # Person.get_experiences: 1,240 findChildElement calls, 9.30 s, 310.2 KB
+
+Call `driver.profiler.reset()` between scrapes on a reused driver.
+"""
+import json
+import sys
+import threading
+from time import perf_counter
+
+from .objects import Scraper
+
+
+def _payload_size(value):
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _codes(code):
+    """`code` and the code of every lambda/comprehension/inner function in it"""
+    found = {code}
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            found |= _codes(const)
+    return found
+
+
+_base_codes = None
+
+
+def _scraper_codes():
+    """Code objects of the shared Scraper helpers (wait_until, count_elements, ...)"""
+    global _base_codes
+    if _base_codes is None:
+        codes = set()
+        for value in vars(Scraper).values():
+            function = getattr(value, "__func__", None) or getattr(value, "fget", None) or value
+            if hasattr(function, "__code__"):
+                codes |= _codes(function.__code__)
+        _base_codes = codes
+    return _base_codes
+
+
+def _call_site(frame):
+    """
+    "Class.method" of the innermost section method on the stack. The shared
+    Scraper helpers and lambdas are skipped, so a count_elements() poll from
+    get_experiences counts as Person.get_experiences; else the nearest caller outside selenium.
+    """
+    helper = fallback = None
+    base_codes = _scraper_codes()
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, Scraper):
+            site = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            if frame.f_code not in base_codes and not frame.f_code.co_name.startswith("<"):
+                return site
+            if helper is None and not frame.f_code.co_name.startswith("<"):
+                helper = site
+        module = frame.f_globals.get("__name__", "")
+        if fallback is None and not module.startswith(("selenium", __name__)):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    # Helpers called from outside a scraper, e.g. is_signed_in() from a script
+    return helper or fallback or "<unknown>"
+
+
+class CommandProfiler:
+    """Aggregates WebDriver commands per (call site, command)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self.commands = 0
+            self.seconds = 0.0
+
+    def record(self, call_site, command, seconds, request_bytes, response_bytes):
+        with self._lock:
+            entry = self._stats.get((call_site, command))
+            if entry is None:
+                entry = self._stats[(call_site, command)] = {
+                    "call_site": call_site,
+                    "command": command,
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                }
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["request_bytes"] += request_bytes
+            entry["response_bytes"] += response_bytes
+            self.commands += 1
+            self.seconds += seconds
+
+    def report(self, top=10):
+        """Most expensive (call site, command) pairs by total latency"""
+        with self._lock:
+            entries = [dict(e) for e in self._stats.values()]
+        entries.sort(key=lambda e: e["seconds"], reverse=True)
+        for entry in entries:
+            entry["seconds"] = round(entry["seconds"], 3)
+        return {
+            "commands": self.commands,
+            "seconds": round(self.seconds, 3),
+            "hot_spots": entries[:top] if top else entries,
+        }
+
+    def format_report(self, top=10):
+        report = self.report(top)
+        lines = [f"{report['commands']:,} WebDriver commands, {report['seconds']:.2f} s"]
+        for e in report["hot_spots"]:
+            size = (e["request_bytes"] + e["response_bytes"]) / 1024
+            lines.append(f"{e['call_site']}: {e['calls']:,} {e['command']} calls, {e['seconds']:.2f} s, {size:.1f} KB")
+        return "\n".join(lines)
+
+
+def profile_driver(driver, profiler=None):
+    """Instruments driver.execute in place; the profiler is available as driver.profiler"""
+    if getattr(driver, "profiler", None) is not None:
+        return driver
+    profiler = profiler or CommandProfiler()
+    execute = driver.execute
+
+    def profiled_execute(driver_command, params=None):
+        # BiDi commands are generators, not chromedriver round trips
+        if not isinstance(driver_command, str):
+            return execute(driver_command, params)
+        call_site = _call_site(sys._getframe(1))
+        request_bytes = _payload_size(params) if params else 0
+        response = None
+        started = perf_counter()
+        try:
+            response = execute(driver_command, params)
+            return response
+        finally:
+            # Failed lookups (NoSuchElement) are recorded too, they are often the expensive part
+            response_bytes = _payload_size(response) if response is not None else 0
+            profiler.record(call_site, driver_command, perf_counter() - started, request_bytes, response_bytes)
+
+    driver.execute = profiled_execute
+    driver.profiler = profiler
+    return driver
+
+
+def unprofile_driver(driver):
+    """Removes the instrumentation again"""
+    if "execute" in vars(driver):
+        del driver.execute
+    driver.profiler = None
+    return driver
@@ -0,0 +1,152 @@
+"""
+Resource policy for the scraping browser: blocks images, fonts, media and
+third-party trackers we never read, and reports what that saved.
+
+Blocking is done with CDP Network.setBlockedURLs, so it can be changed per
+call on a running browser. Images can additionally be disabled through
+Chrome prefs at launch (no decoding at all), but then they stay off for
+the lifetime of that browser.
+"""
+import weakref
+from fnmatch import fnmatchcase
+
+from . import network
+
+# URL patterns per resource type (CDP wildcard syntax)
+TYPE_PATTERNS = {
+    "image": [
+        "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.png", "*.png?*", "*.gif", "*.gif?*",
+        "*.webp", "*.webp?*", "*.svg", "*.svg?*", "*.ico", "*media.licdn.com/dms/image/*",
+    ],
+    "font": ["*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.otf", "*.otf?*"],
+    "media": ["*.mp4", "*.mp4?*", "*.webm", "*.webm?*", "*.m3u8*", "*.mp3", "*dms.licdn.com/playlist/*"],
+}
+
+# Third-party ads / analytics only. LinkedIn's own telemetry is left alone on purpose,
+# blocking first-party endpoints is an easy bot signal.
+TRACKER_PATTERNS = [
+    "*doubleclick.net/*",
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*googlesyndication.com/*",
+    "*bat.bing.com/*",
+    "*facebook.net/*",
+]
+
+DEFAULT_BLOCKED_TYPES = ("image", "font", "media")
+
+# Policy last applied per driver, so tabs opened later can get the same block list
+_applied = weakref.WeakKeyDictionary()
+
+# Rough transfer sizes used to estimate what a blocked request would have cost
+TYPICAL_BYTES = {"image": 35_000, "font": 40_000, "media": 500_000, "tracker": 15_000}
+
+
+class ResourcePolicy:
+    """What the browser may load. ResourcePolicy() is the safe default, ResourcePolicy.off() blocks nothing."""
+
+    def __init__(self, block_types=DEFAULT_BLOCKED_TYPES, block_trackers=True, extra_patterns=(), allow_patterns=(), disable_images_pref=False):
+        unknown = set(block_types) - set(TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.block_types = tuple(block_types)
+        self.block_trackers = block_trackers
+        self.extra_patterns = tuple(extra_patterns)
+        self.allow_patterns = tuple(allow_patterns)
+        self.disable_images_pref = disable_images_pref
+
+    @classmethod
+    def off(cls):
+        return cls(block_types=(), block_trackers=False)
+
+    def override(self, **changes):
+        """Copy of this policy with some settings replaced, for per-call tweaks"""
+        settings = {
+            "block_types": self.block_types,
+            "block_trackers": self.block_trackers,
+            "extra_patterns": self.extra_patterns,
+            "allow_patterns": self.allow_patterns,
+            "disable_images_pref": self.disable_images_pref,
+        }
+        settings.update(changes)
+        return ResourcePolicy(**settings)
+
+    @property
+    def enabled(self):
+        return bool(self.patterns())
+
+    def patterns(self):
+        patterns = []
+        for resource_type in self.block_types:
+            patterns += TYPE_PATTERNS[resource_type]
+        if self.block_trackers:
+            patterns += TRACKER_PATTERNS
+        patterns += self.extra_patterns
+        return [p for p in patterns if p not in self.allow_patterns]
+
+    def chrome_prefs(self):
+        """Prefs to merge into the 'prefs' experimental option at launch"""
+        if self.disable_images_pref and "image" in self.block_types:
+            return {"profile.managed_default_content_settings.images": 2}
+        return {}
+
+    def configure_options(self, opts):
+        """Turns on the performance log the report is built from"""
+        network.enable_performance_log(opts)
+
+    def apply(self, driver):
+        """
+        (Re)applies the block list to the driver's current tab; CDP commands only
+        reach that target, so call it again after switching to a new tab
+        """
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns()})
+        _applied[driver] = self
+
+    def classify(self, url):
+        for resource_type in self.block_types:
+            if any(fnmatchcase(url, p) for p in TYPE_PATTERNS[resource_type]):
+                return resource_type
+        return "tracker"
+
+    @staticmethod
+    def reset_report(driver):
+        """Drops network events collected so far (e.g. by the previous pooled request)"""
+        network.reset(driver)
+
+    def report(self, driver):
+        """
+        Summary of network use since the last reset:
+        requests made, bytes transferred, requests blocked by type and an estimate of bytes saved.
+        """
+        messages = network.events(driver)
+        if messages is None:
+            return None
+
+        urls = {}
+        transferred = 0
+        finished = 0
+        blocked = {}
+        for message in messages:
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+            elif method == "Network.loadingFinished":
+                finished += 1
+                transferred += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                kind = self.classify(urls.get(params.get("requestId"), ""))
+                blocked[kind] = blocked.get(kind, 0) + 1
+
+        return {
+            "requests": finished,
+            "bytes_transferred": transferred,
+            "blocked_requests": sum(blocked.values()),
+            "blocked_by_type": blocked,
+            "estimated_bytes_saved": sum(TYPICAL_BYTES.get(k, 0) * n for k, n in blocked.items()),
+        }
+
+
+def applied(driver):
+    """The policy last applied to `driver`, or None"""
+    return _applied.get(driver)
@@ -0,0 +1,117 @@
+"""
+One serializer for scrape results.
+
+Result records (Experience, Education, Profile, ...) are slotted
+dataclasses that mix in `Record` for to_dict()/to_json(). The field names
+of each class are read once and cached, so converting a record is a single
+pass over a tuple. JSON goes through orjson when it is installed and the
+stdlib json module otherwise; both produce UTF-8 text with non-ASCII
+characters kept as they are.
+
+`profile_dict` is the profile JSON the app, scrape_api.py and
+scrape_batch.py return, with "N/A" for fields that were not found.
+"""
+import json
+from dataclasses import fields, is_dataclass
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see requirements.txt
+    orjson = None
+
+MISSING = "N/A"
+
+# Item fields of the lists in the profile JSON
+EXPERIENCE_FIELDS = ("position_title", "institution_name", "from_date", "to_date", "duration", "location")
+EDUCATION_FIELDS = ("institution_name", "degree", "from_date", "to_date")
+ACCOMPLISHMENT_FIELDS = ("category", "title")
+PROFILE_FIELDS = (
+    "name", "headline", "job_title", "company", "location", "about",
+    "experiences", "educations", "interests", "accomplishments",
+)
+# The profile fields each Person section fills; job_title and company come from the experiences
+PROFILE_SECTION_FIELDS = {
+    "top_card": ("name", "headline", "location"),
+    "about": ("about",),
+    "experiences": ("job_title", "company", "experiences"),
+    "educations": ("educations",),
+    "interests": ("interests",),
+    "accomplishments": ("accomplishments",),
+    "contacts": (),
+}
+PROFILE_ITEM_FIELDS = {
+    "experiences": EXPERIENCE_FIELDS,
+    "educations": EDUCATION_FIELDS,
+    "accomplishments": ACCOMPLISHMENT_FIELDS,
+}
+
+_field_names = {}
+
+
+def field_names(cls):
+    names = _field_names.get(cls)
+    if names is None:
+        names = _field_names[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def to_dict(record, only=None, missing=None, items=None):
+    """
+    Plain dict of a dataclass record. `only` picks and orders the keys, `missing`
+    replaces None and "" values, `items` maps list fields to the `only` of their items.
+    """
+    items = items or {}
+    return {
+        name: _plain(getattr(record, name, None), missing, items.get(name))
+        for name in (only or field_names(type(record)))
+    }
+
+
+def _plain(value, missing, only):
+    if value is None or value == "":
+        return missing
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_plain(item, missing, only) for item in value]
+    if is_dataclass(value):
+        return to_dict(value, only, missing)
+    if isinstance(value, dict):
+        return {key: _plain(item, missing, None) for key, item in value.items()}
+    return value
+
+
+def dumps(data, indent=False):
+    """JSON text of plain data; unknown types (datetime, ...) become str()"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, default=str, indent=2 if indent else None)
+
+
+def to_json(record, indent=False, **options):
+    return dumps(to_dict(record, **options), indent=indent)
+
+
+def dump(data, path, indent=True):
+    """Writes `data` as a UTF-8 JSON file"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps(data, indent=indent))
+
+
+def profile_dict(profile, missing=MISSING):
+    """The profile part of the result JSON; `profile` is a Profile record or a Person"""
+    if not isinstance(profile, Record):
+        profile = profile.result()
+    return to_dict(profile, PROFILE_FIELDS, missing, PROFILE_ITEM_FIELDS)
+
+
+class Record:
+    """Mixin for slotted result dataclasses"""
+    __slots__ = ()
+
+    def to_dict(self, only=None, missing=None):
+        return to_dict(self, only, missing)
+
+    def to_json(self, indent=False):
+        return to_json(self, indent)
@@ -0,0 +1,92 @@
+"""
+Per-phase timing for the scrapers.
+
+Scrapers report how long each phase took: driver_startup, cookie_load,
+navigation, wait, extraction and persistence. Phases nest, and a phase
+only reports its own time, with nested phases subtracted. "extraction"
+wrapping a whole scrape therefore ends up as the time spent outside
+page loads and waits, and all phases of one scrape add up to its total.
+
+Register a hook to receive every measurement:
+
+    timing.add_hook(lambda owner, phase, seconds, ok: print(owner, phase, seconds))
+
+or gather the phases of one scrape on the current thread:
+
+    with timing.collect() as phases:
+        Person(url, driver=driver)
+    phases  # {"navigation": 3.1, "wait": 7.9, "extraction": 1.2}
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+PHASES = ("driver_startup", "cookie_load", "navigation", "wait", "extraction", "persistence")
+
+_hooks = []
+_local = threading.local()
+
+
+def add_hook(hook):
+    """hook(owner, phase, seconds, ok) is called after every phase, on the scraping thread"""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+        _local.collectors = []
+    return _local.stack
+
+
+def emit(owner, phase_name, seconds, ok=True):
+    """Reports a measurement taken elsewhere (e.g. a driver pool launching a browser)"""
+    owner = owner if isinstance(owner, str) else type(owner).__name__
+    _stack()
+    for phases in _local.collectors:
+        phases[phase_name] = phases.get(phase_name, 0.0) + seconds
+    for hook in list(_hooks):
+        try:
+            hook(owner, phase_name, seconds, ok)
+        except Exception:
+            # A broken metrics hook must never fail a scrape
+            pass
+
+
+@contextmanager
+def phase(owner, phase_name):
+    """Times the block as `phase_name`; time spent in nested phases is not counted twice"""
+    stack = _stack()
+    frame = {"children": 0.0}
+    stack.append(frame)
+    started = perf_counter()
+    ok = True
+    try:
+        yield
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        elapsed = perf_counter() - started
+        stack.pop()
+        if stack:
+            stack[-1]["children"] += elapsed
+        emit(owner, phase_name, max(0.0, elapsed - frame["children"]), ok)
+
+
+@contextmanager
+def collect():
+    """Sums up the phases measured on this thread inside the block"""
+    _stack()
+    phases = {}
+    _local.collectors.append(phases)
+    try:
+        yield phases
+    finally:
+        _local.collectors.remove(phases)
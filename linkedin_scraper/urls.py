@@ -0,0 +1,45 @@
+import re
+from urllib.parse import urlsplit, unquote, parse_qs
+
+LINKEDIN_HOST = "www.linkedin.com"
+
+
+def canonical_profile_url(url):
+    """
+    Normalizes a profile URL so the same person always maps to the same key:
+    https + www host (in.linkedin.com, de.linkedin.com, ... -> www), no query
+    string or fragment (?trk=..., ?originalSubdomain=...), lowercase slug,
+    no trailing slash and no sub pages like /details/experience.
+    """
+    if not url:
+        return url
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = LINKEDIN_HOST
+
+    segments = [s for s in unquote(parts.path).split("/") if s]
+    if len(segments) >= 2 and segments[0].lower() == "in":
+        # /in/<slug>/anything -> /in/<slug>
+        segments = ["in", segments[1].lower()]
+
+    return f"https://{host}/" + "/".join(segments)
+
+
+def job_id(url):
+    """
+    Posting id of a job URL, from /jobs/view/<id>/ or ?currentJobId=<id>
+    (search and collection pages); None if there is none.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url)
+    match = re.search(r"/jobs/view/(?:[^/]*-)?(\d+)", parts.path)
+    if match:
+        return match.group(1)
+    ids = parse_qs(parts.query).get("currentJobId")
+    return ids[0] if ids else None
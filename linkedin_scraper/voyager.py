@@ -0,0 +1,233 @@
+"""
+Maps LinkedIn's internal API (voyager) JSON onto the scraper objects.
+
+Profile, company and job pages are hydrated from normalized JSON responses:
+{"data": ..., "included": [{"$type": ..., "entityUrn": ..., ...}, ...]}.
+The helpers here pick entities out of captured payloads by $type and turn
+them into the same field values the DOM scrapers produce. Every mapper
+only returns the fields it actually found, so DOM values are never
+overwritten with None.
+"""
+import re
+from datetime import date, datetime, timezone
+
+# Responses worth capturing (CDP wildcard syntax, see network.responses)
+API_PATTERN = "*linkedin.com/voyager/api/*"
+
+# $type suffixes; both the old and the dash API flavours end like this
+PROFILE = "identity.profile.Profile"
+POSITION = "identity.profile.Position"
+EDUCATION = "identity.profile.Education"
+COMPANY = "organization.Company"
+JOB_POSTING = "jobs.JobPosting"
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def entities(payloads, type_suffix):
+    """All entities of that $type across the payloads, first occurrence of each entityUrn wins"""
+    found = []
+    seen = set()
+    for _, payload in payloads:
+        if not isinstance(payload, dict):
+            continue
+        candidates = list(payload.get("included") or [])
+        data = payload.get("data")
+        if isinstance(data, dict):
+            candidates.append(data)
+            candidates += [e for e in data.get("elements") or [] if isinstance(e, dict)]
+        for entity in candidates:
+            if not isinstance(entity, dict) or not str(entity.get("$type", "")).endswith(type_suffix):
+                continue
+            urn = entity.get("entityUrn")
+            if urn in seen:
+                continue
+            if urn:
+                seen.add(urn)
+            found.append(entity)
+    return found
+
+
+def _slug(url, prefix):
+    match = re.search(rf"/{prefix}/([^/?#]+)", url or "")
+    return match.group(1).lower() if match else None
+
+
+def find_profile(items, linkedin_url):
+    """The Profile entity of the person at linkedin_url (not the viewer's own profile)"""
+    slug = _slug(linkedin_url, "in")
+    for entity in items:
+        if slug and str(entity.get("publicIdentifier", "")).lower() == slug:
+            return entity
+    return None
+
+
+def profile_id(urn):
+    """The profile id in a profile URN or in the (profileId,n) key of a position/education URN"""
+    if not urn:
+        return None
+    match = re.search(r":\(([^,)]+)", str(urn))
+    return match.group(1) if match else _urn_id(urn)
+
+
+def owned_by(items, profile_urn):
+    """The entities that belong to the profile with that URN (detail pages also load other people's)"""
+    owner = profile_id(profile_urn)
+    if not owner:
+        return []
+    return [entity for entity in items if profile_id(entity.get("profileUrn") or entity.get("entityUrn")) == owner]
+
+
+def find_company(items, linkedin_url):
+    slug = _slug(linkedin_url, "company")
+    for entity in items:
+        if slug and slug in (str(entity.get("universalName", "")).lower(), str(entity.get("entityUrn", "")).rsplit(":", 1)[-1]):
+            return entity
+    return None
+
+
+def find_job(items, linkedin_url):
+    job_id = _slug(linkedin_url, "jobs/view") or ""
+    for entity in items:
+        if job_id and (str(entity.get("jobPostingId")) == job_id or str(entity.get("entityUrn", "")).endswith(":" + job_id)):
+            return entity
+    return None
+
+
+def format_date(value):
+    """{"month": 3, "year": 2020} -> "Mar 2020", {"year": 2020} -> "2020" (like the DOM shows it)"""
+    if not value or not value.get("year"):
+        return None
+    month = value.get("month")
+    return f"{MONTHS[month - 1]} {value['year']}" if month else str(value["year"])
+
+
+def format_duration(start, end=None):
+    """LinkedIn style duration, counting both the first and the last month: "1 yr 3 mos" """
+    if not start or not start.get("year"):
+        return None
+    if not end or not end.get("year"):
+        today = date.today()
+        end = {"year": today.year, "month": today.month}
+    months = (end["year"] - start["year"]) * 12 + (end.get("month") or 12) - (start.get("month") or 1) + 1
+    if months <= 0:
+        return None
+    years, months = divmod(months, 12)
+    parts = []
+    if years:
+        parts.append(f"{years} yr{'s' if years > 1 else ''}")
+    if months:
+        parts.append(f"{months} mo{'s' if months > 1 else ''}")
+    return " ".join(parts)
+
+
+def _date_range(entity):
+    """(start, end) from either dateRange (dash) or timePeriod (old API)"""
+    period = entity.get("dateRange") or entity.get("timePeriod") or {}
+    return period.get("start") or period.get("startDate"), period.get("end") or period.get("endDate")
+
+
+def _urn_id(urn):
+    return str(urn).rsplit(":", 1)[-1] if urn else None
+
+
+def _text(value):
+    """Plain text from either a string or a {"text": ...} attributed text"""
+    if isinstance(value, dict):
+        return value.get("text")
+    return value
+
+
+def _compact(values):
+    return {key: value for key, value in values.items() if value not in (None, "", [])}
+
+
+def profile_fields(entity):
+    name = " ".join(p for p in (entity.get("firstName"), entity.get("lastName")) if p)
+    location = entity.get("locationName") or entity.get("geoLocationName")
+    if not location:
+        geo = (entity.get("geoLocation") or {}).get("geo") or {}
+        location = geo.get("defaultLocalizedName")
+    return _compact({
+        "name": name,
+        "headline": entity.get("headline"),
+        "location": location,
+        "about": _text(entity.get("summary")),
+    })
+
+
+def experience_fields(entity):
+    start, end = _date_range(entity)
+    company_id = _urn_id(entity.get("companyUrn"))
+    return _compact({
+        "position_title": entity.get("title"),
+        "institution_name": entity.get("companyName"),
+        "from_date": format_date(start),
+        "to_date": format_date(end) or ("Present" if start else None),
+        "duration": format_duration(start, end),
+        "location": entity.get("locationName"),
+        "description": _text(entity.get("description")),
+        "linkedin_url": f"https://www.linkedin.com/company/{company_id}/" if company_id else None,
+    })
+
+
+def education_fields(entity):
+    start, end = _date_range(entity)
+    school_id = _urn_id(entity.get("schoolUrn"))
+    degree = ", ".join(p for p in (entity.get("degreeName"), entity.get("fieldOfStudy")) if p)
+    return _compact({
+        "institution_name": entity.get("schoolName"),
+        "degree": degree,
+        "from_date": str(start["year"]) if start and start.get("year") else None,
+        "to_date": str(end["year"]) if end and end.get("year") else None,
+        "description": _text(entity.get("description")),
+        "linkedin_url": f"https://www.linkedin.com/school/{school_id}/" if school_id else None,
+    })
+
+
+def company_fields(entity):
+    hq = entity.get("headquarter") or {}
+    headquarters = ", ".join(p for p in (hq.get("city"), hq.get("geographicArea"), hq.get("country")) if p)
+    staff = entity.get("staffCountRange") or {}
+    if staff.get("start") and staff.get("end"):
+        company_size = f"{staff['start']:,}-{staff['end']:,} employees"
+    elif staff.get("start"):
+        company_size = f"{staff['start']:,}+ employees"
+    else:
+        company_size = None
+    industries = entity.get("companyIndustries") or entity.get("industry") or []
+    if isinstance(industries, dict):
+        industries = list(industries.values())
+    industry = ", ".join(i.get("localizedName") for i in industries if isinstance(i, dict) and i.get("localizedName"))
+    phone = entity.get("phone")
+    company_type = entity.get("companyType")
+    return _compact({
+        "name": entity.get("name"),
+        "about_us": _text(entity.get("description")),
+        "website": entity.get("websiteUrl") or entity.get("companyPageUrl"),
+        "phone": phone.get("number") if isinstance(phone, dict) else phone,
+        "headquarters": headquarters,
+        "founded": str((entity.get("foundedOn") or {}).get("year") or "") or None,
+        "industry": industry,
+        "company_type": company_type.get("localizedName") if isinstance(company_type, dict) else company_type,
+        "company_size": company_size,
+        "specialties": "\n".join(entity.get("specialities") or []),
+        "headcount": entity.get("staffCount") or entity.get("employeeCount"),
+    })
+
+
+def job_fields(entity):
+    company = entity.get("companyDetails") or {}
+    # old API: companyDetails -> {"companyResolutionResult": {"name", "url"}}
+    resolved = next((v.get("companyResolutionResult") for v in company.values() if isinstance(v, dict) and "companyResolutionResult" in v), None)
+    resolved = resolved or company.get("companyResolutionResult") or {}
+    listed_at = entity.get("listedAt") or entity.get("originalListedAt")
+    return _compact({
+        "job_title": entity.get("title"),
+        "company": resolved.get("name") or entity.get("companyName"),
+        "company_linkedin_url": resolved.get("url"),
+        "location": entity.get("formattedLocation"),
+        "posted_date": datetime.fromtimestamp(listed_at / 1000, tz=timezone.utc).date().isoformat() if listed_at else None,
+        "applicant_count": entity.get("applies"),
+        "job_description": _text(entity.get("description")),
+    })
@@ -5,21 +5,25 @@ SICHERE VERSION - Browser wird bei jedem Request neu erstellt
 Starte mit: python scrape_api_safe.py
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from datetime import datetime
-import json
 import os
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from linkedin_scraper import Person
-import time
+from linkedin_scraper.chromedriver import chrome_service
+from linkedin_scraper.resources import ResourcePolicy
+from linkedin_scraper import Person, auth
+from linkedin_scraper.serialize import profile_dict
+from linkedin_scraper.cookies import inject as inject_cookies, jars as cookie_jars
+from app import ResultJSONProvider
+from app.store import profile_store
+from app.batch import ndjson_line, NDJSON_MIMETYPE
 
 app = Flask(__name__)
+app.json = ResultJSONProvider(app)
 
 # Config
 COOKIES_DIR = "linkedin_session"
@@ -34,33 +38,25 @@ def setup_driver():
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--disable-gpu")
+    # Bilder, Fonts, Videos und Tracker werden nicht geladen
+    policy = ResourcePolicy()
+    policy.configure_options(opts)
     
-    return webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+    driver = webdriver.Chrome(
+        service=chrome_service(),
         options=opts
     )
+    policy.apply(driver)
+    return driver
 
 
 def load_cookies(driver):
-    """Lädt gespeicherte Session"""
-    if not os.path.exists(COOKIES_FILE):
-        return False
-    
+    """Lädt gespeicherte Session (per CDP, ohne Seitenaufruf)"""
     try:
-        driver.get("https://www.linkedin.com")
-        time.sleep(1)
-        
-        with open(COOKIES_FILE, 'r') as f:
-            cookies = json.load(f)
-        
-        for cookie in cookies:
-            try:
-                driver.add_cookie(cookie)
-            except:
-                pass
-        
-        driver.refresh()
-        time.sleep(2)
+        cookies = cookie_jars.get(COOKIES_FILE)
+        if cookies is None:
+            return False
+        inject_cookies(driver, cookies)
         return True
     except:
         return False
@@ -79,6 +75,8 @@ def scrape_profile(url):
     try:
         driver = setup_driver()
         load_cookies(driver)
+        # Jeder Request hat einen neuen Browser, der Login-Status gilt fuer die Session
+        auth.bind(driver, COOKIES_FILE)
         
         person = Person(
             linkedin_url=url,
@@ -89,63 +87,12 @@ def scrape_profile(url):
         
         # Speichere Cookies
         try:
-            with open(COOKIES_FILE, 'w') as f:
-                json.dump(driver.get_cookies(), f)
+            cookie_jars.save(COOKIES_FILE, driver.get_cookies())
         except:
             pass
         
-        # Extrahiere Daten - mit sicherer Attribut-Pruefung
-        data["name"] = getattr(person, 'name', None) or "N/A"
-        data["job_title"] = getattr(person, 'job_title', None) or "N/A"
-        data["company"] = getattr(person, 'company', None) or "N/A"
-        data["location"] = getattr(person, 'location', None) or "N/A"
-        
-        # About - sicher extrahieren
-        about = getattr(person, 'about', None)
-        data["about"] = about[0] if about and len(about) > 0 else "N/A"
-        
-        # Experiences - mit sicherer Attribut-Pruefung
-        data["experiences"] = []
-        experiences = getattr(person, 'experiences', None)
-        if experiences:
-            for exp in experiences:
-                data["experiences"].append({
-                    "position_title": getattr(exp, 'position_title', None) or "N/A",
-                    "institution_name": getattr(exp, 'institution_name', None) or "N/A",
-                    "from_date": getattr(exp, 'from_date', None) or "N/A",
-                    "to_date": getattr(exp, 'to_date', None) or "N/A",
-                    "duration": getattr(exp, 'duration', None) or "N/A",
-                    "location": getattr(exp, 'location', None) or "N/A"
-                })
-        
-        # Educations - mit sicherer Attribut-Pruefung
-        data["educations"] = []
-        educations = getattr(person, 'educations', None)
-        if educations:
-            for edu in educations:
-                data["educations"].append({
-                    "institution_name": getattr(edu, 'institution_name', None) or "N/A",
-                    "degree": getattr(edu, 'degree', None) or "N/A",
-                    "from_date": getattr(edu, 'from_date', None) or "N/A",
-                    "to_date": getattr(edu, 'to_date', None) or "N/A"
-                })
-        
-        # Interests - mit sicherer Attribut-Pruefung
-        data["interests"] = []
-        interests = getattr(person, 'interests', None)
-        if interests:
-            for interest in interests:
-                data["interests"].append(getattr(interest, 'institution_name', None) or str(interest))
-        
-        # Accomplishments - mit sicherer Attribut-Pruefung
-        data["accomplishments"] = []
-        accomplishments = getattr(person, 'accomplishments', None)
-        if accomplishments:
-            for acc in accomplishments:
-                data["accomplishments"].append({
-                    "category": getattr(acc, 'category', None) or "N/A",
-                    "title": getattr(acc, 'title', None) or "N/A"
-                })
+        # Extrahiere Daten - gleiches Profil-JSON wie app/scraper.py und scrape_batch.py
+        data.update(profile_dict(person))
         
         data["status"] = "success"
         
@@ -194,18 +141,7 @@ def scrape():
         if not url:
             return jsonify({"status": "error", "error": "URL erforderlich"}), 400
         
-        result = scrape_profile(url)
-        
-        # Speichere Result nur wenn erfolgreich
-        if result['status'] == 'success' and result.get('name') and result.get('name') != 'N/A':
-            try:
-                os.makedirs("scraped_data", exist_ok=True)
-                filename = f"scraped_data/{result.get('name', 'unknown').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                # Fehler beim Speichern - nicht kritisch
-                pass
+        result = scrape_and_save(url)
         
         return jsonify(result)
     
@@ -217,6 +153,17 @@ def scrape():
         }), 500
 
 
+def scrape_and_save(url):
+    """Scrapt ein Profil im Batch und speichert es, wenn es einen Namen hat"""
+    result = scrape_profile(url)
+    
+    # Speichere Result nur wenn erfolgreich und Name existiert
+    if result['status'] == 'success' and result.get('name') and result.get('name') != 'N/A':
+        # Upsert in scraped_data/profiles.db, der Writer-Thread schreibt im Hintergrund
+        profile_store.save(result)
+    return result
+
+
 @app.route('/scrape/batch', methods=['POST'])
 def scrape_batch():
     """Scrapte mehrere Profile"""
@@ -227,21 +174,13 @@ def scrape_batch():
         if not urls:
             return jsonify({"status": "error", "error": "URLs erforderlich"}), 400
         
-        results = []
-        for url in urls:
-            result = scrape_profile(url)
-            results.append(result)
-            
-            # Speichere Result nur wenn erfolgreich und Name existiert
-            if result['status'] == 'success' and result.get('name') and result.get('name') != 'N/A':
-                try:
-                    os.makedirs("scraped_data", exist_ok=True)
-                    filename = f"scraped_data/{result.get('name', 'unknown').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(result, f, indent=2, ensure_ascii=False)
-                except Exception as e:
-                    # Fehler beim Speichern - nicht kritisch
-                    pass
+        # Streaming: jedes Profil als eigene NDJSON-Zeile, sobald es fertig ist
+        if data.get('stream') or NDJSON_MIMETYPE in request.headers.get('Accept', ''):
+            lines = (ndjson_line(scrape_and_save(url)) for url in urls)
+            return Response(stream_with_context(lines), mimetype=NDJSON_MIMETYPE,
+                            headers={"X-Accel-Buffering": "no"})
+        
+        results = [scrape_and_save(url) for url in urls]
         
         return jsonify({
             "status": "success",
@@ -268,7 +207,7 @@ if __name__ == '__main__':
     print("  GET  /health")
     print("  GET  /status")
     print("  POST /scrape       - Einzelnes Profil scrapen")
-    print("  POST /scrape/batch - Mehrere Profile scrapen")
+    print("  POST /scrape/batch - Mehrere Profile scrapen (\"stream\": true -> NDJSON)")
     print("="*60 + "\n")
     
     app.run(host='0.0.0.0', port=5000, debug=False, threaded=False)
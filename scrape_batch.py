@@ -8,9 +8,10 @@ LinkedIn Scraper für n8n - Batch Processing
 """
 
 import os
-import json
 import time
 import sys
+import threading
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 from selenium import webdriver
@@ -18,7 +19,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from linkedin_scraper import Person
+from linkedin_scraper.chromedriver import chrome_service
+from linkedin_scraper.resources import ResourcePolicy
+from linkedin_scraper import Person, auth, serialize
+from linkedin_scraper.objects import Profile
+from linkedin_scraper.serialize import profile_dict
+from linkedin_scraper.cookies import inject as inject_cookies, jars as cookie_jars
+from app.batch import BatchExecutor, ndjson_line
+from app.store import profile_store
 
 
 class LinkedInScraperBatch:
@@ -28,15 +36,13 @@ class LinkedInScraperBatch:
     COOKIES_DIR = "linkedin_session"
     COOKIES_FILE = os.path.join(COOKIES_DIR, "cookies.json")
     
+    # Parallele Worker teilen sich Cookie-Datei und Login-Prompt
+    cookies_lock = threading.Lock()
+    login_lock = threading.Lock()
+    
     def __init__(self):
         self.driver = None
-        self.name = "N/A"
-        self.location = "N/A"
-        self.about = "N/A"
-        self.job_title = "N/A"
-        self.company = "N/A"
-        self.experiences = []
-        self.educations = []
+        self.profile = profile_dict(Profile())
         
         # Stelle sicher dass Cookies-Verzeichnis existiert
         os.makedirs(self.COOKIES_DIR, exist_ok=True)
@@ -47,56 +53,60 @@ class LinkedInScraperBatch:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
+        # Bilder, Fonts, Videos und Tracker werden nicht geladen
+        self.resource_policy = ResourcePolicy()
+        self.resource_policy.configure_options(chrome_options)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = webdriver.Chrome(service=chrome_service(), options=chrome_options)
+        self.resource_policy.apply(self.driver)
     
     def save_cookies(self):
         """Speichert Cookies nach dem Login"""
         try:
             cookies = self.driver.get_cookies()
-            with open(self.COOKIES_FILE, 'w') as f:
-                json.dump(cookies, f)
+            with self.cookies_lock:
+                cookie_jars.save(self.COOKIES_FILE, cookies)
             print(f"[OK] Session gespeichert in: {self.COOKIES_FILE}")
         except Exception as e:
             print(f"[ERROR] Fehler beim Speichern der Cookies: {e}")
     
     def load_cookies(self):
-        """Lädt gespeicherte Cookies"""
-        if os.path.exists(self.COOKIES_FILE):
-            try:
-                self.driver.get("https://www.linkedin.com")
-                time.sleep(1)
-                
-                with open(self.COOKIES_FILE, 'r') as f:
-                    cookies = json.load(f)
-                
-                for cookie in cookies:
-                    try:
-                        self.driver.add_cookie(cookie)
-                    except:
-                        pass  # Ignoriere abgelaufene Cookies
-                
-                print("[OK] Session geladen")
-                return True
-            except Exception as e:
-                print(f"⚠️  Fehler beim Laden der Cookies: {e}")
+        """Lädt gespeicherte Cookies (per CDP, ohne Seitenaufruf)"""
+        try:
+            with self.cookies_lock:
+                cookies = cookie_jars.get(self.COOKIES_FILE)
+            if cookies is None:
                 return False
-        return False
+            inject_cookies(self.driver, cookies)
+            print("[OK] Session geladen")
+            return True
+        except Exception as e:
+            print(f"⚠️  Fehler beim Laden der Cookies: {e}")
+            return False
     
     def check_login(self):
-        """Prüft ob man eingeloggt ist"""
+        """Prüft ob man eingeloggt ist - /feed/ wird nur geladen, wenn der letzte Check abgelaufen ist"""
+        # Alle Worker teilen sich den Login-Status der Cookie-Datei
+        state = auth.bind(self.driver, self.COOKIES_FILE)
+        # Nur ein bestaetigter Login wird uebernommen; ein frischer Browser prueft sonst selbst
+        if state.known():
+            return True
+        
         try:
             self.driver.get("https://www.linkedin.com/feed/")
             time.sleep(2)
             
             # Wenn wir auf Login-Seite sind, sind wir nicht eingeloggt
-            if "login" in self.driver.current_url.lower():
+            if auth.observe(self.driver) is False:
                 return False
             
             # Prüfe ob Feed lädt
             self.driver.find_element(By.TAG_NAME, "main")
+            state.record(True)
             return True
         except:
+            # Kann auch ein Timeout sein: die anderen Worker pruefen dann selbst
+            state.record(False, reason="feed did not load")
             return False
     
     def login(self):
@@ -105,6 +115,8 @@ class LinkedInScraperBatch:
         print("LinkedIn Login erforderlich")
         print("="*60)
         
+        # Für Captcha/2FA alles laden, danach wieder blockieren
+        ResourcePolicy.off().apply(self.driver)
         self.driver.get("https://www.linkedin.com/login")
         
         print("\n📋 Bitte einloggen im Browser:")
@@ -119,6 +131,8 @@ class LinkedInScraperBatch:
         # Speichern nach erfolgreicherem Login
         time.sleep(2)
         self.save_cookies()
+        auth.state(self.driver).confirm()
+        self.resource_policy.apply(self.driver)
         print("[OK] Login erfolgreich und Session gespeichert!\n")
     
     def scrape_profile(self, profile_url):
@@ -135,46 +149,13 @@ class LinkedInScraperBatch:
             
             # Speichere Cookies
             try:
-                with open(self.COOKIES_FILE, 'w') as f:
-                    json.dump(self.driver.get_cookies(), f)
+                with self.cookies_lock:
+                    cookie_jars.save(self.COOKIES_FILE, self.driver.get_cookies())
             except:
                 pass
             
-            # Extrahiere Daten - mit sicherer Attribut-Pruefung
-            self.name = getattr(person, 'name', None) or "N/A"
-            self.job_title = getattr(person, 'job_title', None) or "N/A"
-            self.company = getattr(person, 'company', None) or "N/A"
-            self.location = getattr(person, 'location', None) or "N/A"
-            
-            # About - sicher extrahieren
-            about = getattr(person, 'about', None)
-            self.about = about[0] if about and len(about) > 0 else "N/A"
-            
-            # Experiences - mit sicherer Attribut-Pruefung
-            self.experiences = []
-            experiences = getattr(person, 'experiences', None)
-            if experiences:
-                for exp in experiences:
-                    self.experiences.append({
-                        "position_title": getattr(exp, 'position_title', None) or "N/A",
-                        "institution_name": getattr(exp, 'institution_name', None) or "N/A",
-                        "from_date": getattr(exp, 'from_date', None) or "N/A",
-                        "to_date": getattr(exp, 'to_date', None) or "N/A",
-                        "duration": getattr(exp, 'duration', None) or "N/A",
-                        "location": getattr(exp, 'location', None) or "N/A"
-                    })
-            
-            # Educations - mit sicherer Attribut-Pruefung
-            self.educations = []
-            educations = getattr(person, 'educations', None)
-            if educations:
-                for edu in educations:
-                    self.educations.append({
-                        "institution_name": getattr(edu, 'institution_name', None) or "N/A",
-                        "degree": getattr(edu, 'degree', None) or "N/A",
-                        "from_date": getattr(edu, 'from_date', None) or "N/A",
-                        "to_date": getattr(edu, 'to_date', None) or "N/A"
-                    })
+            # Extrahiere Daten - gleiches Profil-JSON wie die API
+            self.profile = profile_dict(person)
             
             return True
         
@@ -190,14 +171,8 @@ class LinkedInScraperBatch:
         """Konvertiert zu Dictionary"""
         return {
             "timestamp": datetime.now().isoformat(),
-            "name": self.name,
             "linkedin_url": profile_url,
-            "company": self.company,
-            "job_title": self.job_title,
-            "location": self.location,
-            "about": self.about,
-            "experiences": self.experiences,
-            "educations": self.educations
+            **self.profile
         }
     
     def close(self):
@@ -225,7 +200,9 @@ def scrape_url(profile_url):
                 print("⚠️  Keine gespeicherte Session gefunden")
             
             print("[ERROR] Nicht eingeloggt - Bitte manuell einloggen")
-            scraper.login()
+            # Nur ein Worker darf gleichzeitig nach dem Login fragen
+            with LinkedInScraperBatch.login_lock:
+                scraper.login()
         
         # Scrape
         if scraper.scrape_profile(profile_url):
@@ -244,36 +221,72 @@ def scrape_url(profile_url):
         scraper.close()
 
 
+def stream_ndjson(executor, urls):
+    """
+    Schreibt jedes Ergebnis als eine JSON-Zeile auf stdout, sobald es fertig ist.
+    Alle anderen Ausgaben gehen nach stderr, damit stdout direkt weiterverarbeitet werden kann.
+    """
+    out = sys.stdout
+    success = 0
+    with redirect_stdout(sys.stderr):
+        for url, result in zip(urls, executor.imap(urls)):
+            if result:
+                success += 1
+                save_result(result)
+            else:
+                result = {"linkedin_url": url, "status": "error"}
+            out.write(ndjson_line(result))
+            out.flush()
+        print(f"[DONE] FERTIG: {success}/{len(urls)} Profile gescraped")
+
+
+def save_result(result):
+    """Speichert ein Ergebnis in der Profil-Datenbank (Upsert nach Profil-URL)"""
+    profile_store.save(result)
+    return profile_store.path
+
+
 def main():
     """CLI - Akzeptiert URLs als Argumente"""
     if len(sys.argv) < 2:
         print("[ERROR] Fehler: Keine URLs angegeben!")
         print("\nVerwendung:")
-        print("  python scrape_batch.py <url1> <url2> <url3> ...")
+        print("  python scrape_batch.py [--workers N] [--ndjson] <url1> <url2> <url3> ...")
+        print("\n  --ndjson  Jedes Profil sofort als eine JSON-Zeile auf stdout (Logs auf stderr)")
         print("\nBeispiel:")
         print("  python scrape_batch.py https://linkedin.com/in/profile1 https://linkedin.com/in/profile2")
         sys.exit(1)
     
-    # URLs aus Kommandozeile
-    urls = sys.argv[1:]
+    # URLs aus Kommandozeile, optional --workers N (parallele Browser) und --ndjson
+    args = sys.argv[1:]
+    workers = 1
+    if "--workers" in args:
+        pos = args.index("--workers")
+        workers = int(args[pos + 1])
+        del args[pos:pos + 2]
+    ndjson = "--ndjson" in args
+    urls = [a for a in args if a != "--ndjson"]
+    
+    executor = BatchExecutor(lambda url, session_id: scrape_url(url), workers=workers)
+    
+    if ndjson:
+        return stream_ndjson(executor, urls)
+    effective = min(executor.workers, executor.limiter.limit, len(urls))
     
     print("\n" + "="*60)
-    print(f"[>>>] LinkedIn Batch Scraper - {len(urls)} URLs")
+    print(f"[>>>] LinkedIn Batch Scraper - {len(urls)} URLs, {effective} Browser parallel")
     print("="*60)
     
     results = []
     
-    for i, url in enumerate(urls, 1):
-        print(f"\n[{i}/{len(urls)}] Verarbeite: {url}")
-        result = scrape_url(url)
+    # Ergebnisse kommen in Eingabe-Reihenfolge zurueck
+    for i, (url, result) in enumerate(zip(urls, executor.imap(urls)), 1):
+        print(f"\n[{i}/{len(urls)}] Fertig: {url}")
         
         if result:
             results.append(result)
             # Speichern
-            os.makedirs("scraped_data", exist_ok=True)
-            filename = f"scraped_data/{result['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            filename = save_result(result)
             print(f"[SAVE] Gespeichert: {filename}")
     
     # Summary
@@ -290,7 +303,7 @@ def main():
     }
     
     print("\n[JSON] Output:")
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    print(serialize.dumps(output, indent=True))
     
     return output
 
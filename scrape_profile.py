@@ -10,9 +10,8 @@ import sys
 from datetime import datetime
 from linkedin_scraper import Person, actions
 from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from linkedin_scraper.chromedriver import chrome_service
 
 
 def setup_driver():
@@ -24,7 +23,7 @@ def setup_driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=chrome_service(),
         options=chrome_options
     )
     return driver
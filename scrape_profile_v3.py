@@ -13,9 +13,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from linkedin_scraper.chromedriver import chrome_service
 
 
 def setup_driver():
@@ -25,7 +24,7 @@ def setup_driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=chrome_service(),
         options=chrome_options
     )
     return driver
@@ -13,8 +13,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from linkedin_scraper.chromedriver import chrome_service
 
 
 class LinkedInScraper:
@@ -36,7 +35,7 @@ class LinkedInScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         
         self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=chrome_service(),
             options=chrome_options
         )
     
@@ -29,6 +29,8 @@ setup(
     download_url = 'https://github.com/joeyism/linkedin_scraper/dist/' + version + '.tar.gz', 
     keywords = ['linkedin', 'scraping', 'scraper'],
     classifiers = [], 
-    install_requires=[package.split("\n")[0] for package in open("requirements.txt", "r").readlines()]
+    install_requires=[package.split("\n")[0] for package in open("requirements.txt", "r").readlines()],
+    # Faster result JSON; serialize.py falls back to the json module without it
+    extras_require={"fast": ["orjson"]}
 )
 
@@ -0,0 +1,60 @@
+import time
+
+from app.cache import ProfileCache
+
+URL = "https://www.linkedin.com/in/jane-doe"
+
+
+def test_hit_returns_marked_copy():
+    cache = ProfileCache(ttl=60)
+    data = {"name": "Jane Doe", "experiences": []}
+    cache.set(URL + "?trk=x", data)
+    data["experiences"].append("changed")
+    hit = cache.get("https://de.linkedin.com/in/Jane-Doe/")
+    assert hit["cached"] is True and hit["experiences"] == []
+    hit["name"] = "changed"
+    assert cache.get(URL)["name"] == "Jane Doe"
+    assert cache.stats()["hits"] == 2
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = ProfileCache(ttl=60)
+    cache.set(URL, {"name": "Jane Doe"})
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get(URL) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_max_age_asks_for_fresher_data(monkeypatch):
+    cache = ProfileCache(ttl=600)
+    cache.set(URL, {"name": "Jane Doe"})
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    assert cache.get(URL, max_age=10) is None
+    assert cache.get(URL, max_age=60) is not None
+    assert cache.max_age(6000) == 600
+
+
+def test_least_recently_used_goes_first():
+    cache = ProfileCache(ttl=60, max_entries=2)
+    for slug in ("a", "b"):
+        cache.set(f"https://www.linkedin.com/in/{slug}", {"name": slug})
+    cache.get("https://www.linkedin.com/in/a")
+    cache.set("https://www.linkedin.com/in/c", {"name": "c"})
+    assert cache.get("https://www.linkedin.com/in/b") is None
+    assert cache.get("https://www.linkedin.com/in/a")["name"] == "a"
+
+
+def test_covers_only_scraped_sections():
+    cache = ProfileCache(ttl=60)
+    cache.set(URL, {"name": "Jane Doe", "sections": ["top_card"]})
+    assert cache.get(URL, sections=["top_card"]) is not None
+    assert cache.get(URL, sections=["top_card", "experiences"]) is None
+    assert ProfileCache.covers({"name": "legacy result"}, ["experiences"])
+
+
+def test_zero_ttl_disables_cache():
+    cache = ProfileCache(ttl=0)
+    cache.set(URL, {"name": "Jane Doe"})
+    assert cache.get(URL) is None
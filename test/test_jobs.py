@@ -0,0 +1,55 @@
+from app.jobs import JobQueue, ScrapeJob
+
+
+def finished(job, indexes):
+    for index in indexes:
+        job.done.append({"url": job.urls[index], "status": "success", "index": index})
+
+
+def test_page_is_stable_while_items_finish_out_of_order():
+    job = ScrapeJob(["a", "b", "c", "d"])
+    job.status = "running"
+    finished(job, [2, 0])
+    first, offset = job.page(0, 10)
+    assert [r["index"] for r in first] == [2, 0]
+    assert offset == 2
+
+    # An earlier item finishing late is appended, nothing already returned shifts
+    finished(job, [1])
+    second, offset = job.page(offset, 10)
+    assert [r["index"] for r in second] == [1]
+    assert offset == 3
+
+
+def test_page_keeps_offset_while_job_runs():
+    job = ScrapeJob(["a", "b"])
+    assert job.page(0, 10) == ([], 0)
+
+
+def test_page_ends_once_job_is_over_and_everything_was_returned():
+    job = ScrapeJob(["a", "b", "c"])
+    finished(job, [1, 0, 2])
+    job.status = "done"
+    results, offset = job.page(0, 2)
+    assert [r["index"] for r in results] == [1, 0]
+    assert offset == 2
+    results, offset = job.page(offset, 2)
+    assert [r["index"] for r in results] == [2]
+    assert offset is None
+
+
+def test_queue_runs_every_item_and_tags_input_index():
+    def scrape(url, session_id):
+        if url == "bad":
+            raise RuntimeError("boom")
+        return {"url": url, "status": "success", "session": session_id}
+
+    queue = JobQueue(scrape, workers=2)
+    job = queue.submit(["a", "bad", "c"], session_id="s1")
+    queue._queue.join()
+    assert job.status == "done"
+    assert job.completed == 3 and job.succeeded == 2
+    assert sorted(r["index"] for r in job.done) == [0, 1, 2]
+    assert job.results[1]["error"] == "boom"
+    assert job.results[0]["session"] == "s1"
+    assert job.page(0, 10)[1] is None
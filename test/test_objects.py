@@ -0,0 +1,29 @@
+import pytest
+
+from linkedin_scraper.objects import Scraper
+
+
+class Site(Scraper):
+    WAITS = {"list": (1, 5)}
+
+
+def limits(site, waits=None):
+    scraper = Site.__new__(Site)
+    scraper.waits = waits or {}
+    return scraper.wait_limits(site)
+
+
+def test_wait_limits_defaults():
+    assert limits("list") == (1, 5)
+    assert limits("unknown") == Scraper.DEFAULT_WAIT
+
+
+@pytest.mark.parametrize("override, expected", [
+    ((2, 8), (2, 8)),
+    ((None, 3), (1, 3)),
+    ([0.5, None], (0.5, 5)),
+    ({"max_wait": 3}, (1, 3)),
+    ({"min_delay": 0}, (0, 5)),
+])
+def test_wait_limits_merge_field_by_field(override, expected):
+    assert limits("list", {"list": override}) == expected
@@ -0,0 +1,30 @@
+from benchmarks import fixtures
+from linkedin_scraper import parsers
+
+
+def test_parse_experiences_flattens_grouped_roles():
+    experiences = parsers.parse_experiences(fixtures.experience_page(count=8))
+    # 7 single positions, the 8th entry is one company with 3 roles
+    assert len(experiences) == 10
+    single, grouped = experiences[0], experiences[-3:]
+    assert single.position_title in fixtures.TITLES
+    assert single.linkedin_url == "https://www.linkedin.com/company/1000/"
+    assert single.from_date and single.to_date and single.duration
+    assert isinstance(single.description, str)
+    assert {e.institution_name for e in grouped} == {grouped[0].institution_name}
+    assert all(e.linkedin_url == "https://www.linkedin.com/company/1007/" for e in grouped)
+    assert all(e.location in fixtures.CITIES for e in grouped)
+
+
+def test_parse_educations():
+    educations = parsers.parse_educations(fixtures.education_page(count=3))
+    assert len(educations) == 3
+    assert all(e.institution_name in fixtures.SCHOOLS for e in educations)
+    assert all(e.degree in fixtures.DEGREES for e in educations)
+    assert int(educations[0].to_date) > int(educations[0].from_date)
+
+
+def test_split_work_times():
+    assert parsers.split_work_times("Jan 2020 - Present · 4 yrs 2 mos") == ("Jan 2020", "Present", "4 yrs 2 mos")
+    assert parsers.split_work_times("2019") == ("2019", "", None)
+    assert parsers.split_work_times("") == ("", "", None)
@@ -0,0 +1,96 @@
+import pytest
+
+from app.store import ProfileStore
+from linkedin_scraper.serialize import PROFILE_SECTION_FIELDS
+
+URL = "https://www.linkedin.com/in/jane-doe"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(path=str(tmp_path / "profiles.db"), flush_interval=0)
+    yield store
+    store.close()
+
+
+def profile(**fields):
+    data = {
+        "url": URL + "/?trk=public_profile",
+        "status": "success",
+        "name": "Jane Doe",
+        "headline": "Engineer",
+        "company": "ACME",
+        "job_title": "Engineer",
+        "experiences": [{"position_title": "Engineer", "institution_name": "ACME"}],
+        "educations": [{"institution_name": "MIT", "degree": "BSc"}],
+        "sections": list(PROFILE_SECTION_FIELDS),
+    }
+    data.update(fields)
+    return data
+
+
+def save(store, data):
+    store.save(data)
+    store.flush()
+
+
+def test_save_keys_on_canonical_url(store):
+    save(store, profile())
+    stored = store.get("https://de.linkedin.com/in/Jane-Doe/details/experience/")
+    assert stored["name"] == "Jane Doe"
+    assert "stored_age" in stored
+
+
+def test_unchanged_rescrape_keeps_version(store):
+    save(store, profile())
+    save(store, profile(timings={"navigation": 1.2}))
+    assert [v["version"] for v in store.history(URL)] == [1]
+
+
+def test_changed_rescrape_adds_version(store):
+    save(store, profile())
+    save(store, profile(headline="Manager"))
+    history = store.history(URL)
+    assert [v["version"] for v in history] == [2, 1]
+    assert history[0]["data"]["headline"] == "Manager"
+
+
+def test_save_snapshots_result(store):
+    data = profile()
+    store.save(data)
+    data["name"] = "Changed later"
+    store.flush()
+    assert store.get(URL)["name"] == "Jane Doe"
+
+
+def test_partial_scrape_merges_into_stored_row(store):
+    save(store, profile())
+    save(store, profile(headline="Manager", experiences=[], educations=[], company="N/A", sections=["top_card"]))
+    stored = store.get(URL)
+    assert stored["headline"] == "Manager"
+    assert stored["company"] == "ACME"
+    assert stored["educations"] == [{"institution_name": "MIT", "degree": "BSc"}]
+    assert set(stored["sections"]) == set(PROFILE_SECTION_FIELDS)
+
+
+def test_partial_scrape_without_changes_keeps_version(store):
+    save(store, profile())
+    save(store, profile(experiences=[], educations=[], sections=["top_card"]))
+    assert [v["version"] for v in store.history(URL)] == [1]
+
+
+def test_find_and_count_filter_case_insensitively(store):
+    save(store, profile())
+    save(store, profile(url="https://www.linkedin.com/in/john", name="John Roe", company="Initech"))
+    assert [r["name"] for r in store.find(company="acme")] == ["Jane Doe"]
+    assert store.count(name="JOHN ROE") == 1
+    assert store.count(since=0) == 2
+
+
+def test_iter_results_sets_row_url_and_scraped_at(store):
+    save(store, profile())
+    save(store, profile(url="https://www.linkedin.com/in/john", name="John Roe"))
+    results = list(store.iter_results(batch_size=1))
+    assert [r["url"] for r in results] == [URL, "https://www.linkedin.com/in/john"]
+    assert results[0]["scraped_at"] <= results[1]["scraped_at"]
+    assert list(store.iter_results(name="John Roe"))[0]["name"] == "John Roe"
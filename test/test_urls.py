@@ -0,0 +1,40 @@
+import pytest
+
+from linkedin_scraper.urls import canonical_profile_url, job_id
+
+CANONICAL = "https://www.linkedin.com/in/jane-doe"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/jane-doe",
+    "https://www.linkedin.com/in/jane-doe/",
+    "http://linkedin.com/in/jane-doe",
+    "https://de.linkedin.com/in/Jane-Doe/?originalSubdomain=de",
+    "https://www.linkedin.com/in/jane-doe?trk=public_profile#experience",
+    "https://www.linkedin.com/in/jane-doe/details/experience/",
+    "www.linkedin.com/in/jane-doe",
+    "  https://www.linkedin.com/in/jane%2Ddoe  ",
+])
+def test_canonical_profile_url(url):
+    assert canonical_profile_url(url) == CANONICAL
+
+
+def test_canonical_profile_url_passes_empty_values_through():
+    assert canonical_profile_url(None) is None
+    assert canonical_profile_url("") == ""
+
+
+def test_canonical_profile_url_keeps_other_pages():
+    assert canonical_profile_url("https://www.linkedin.com/company/acme/about/") == "https://www.linkedin.com/company/acme/about"
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/jobs/view/3812345678/", "3812345678"),
+    ("https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3812345678?trk=x", "3812345678"),
+    ("https://www.linkedin.com/jobs/search/?keywords=python&currentJobId=3812345678", "3812345678"),
+    ("https://www.linkedin.com/jobs/collections/recommended/?currentJobId=42", "42"),
+    ("https://www.linkedin.com/jobs/search/?keywords=python", None),
+    (None, None),
+])
+def test_job_id(url, expected):
+    assert job_id(url) == expected
@@ -0,0 +1,54 @@
+from linkedin_scraper import voyager
+
+PROFILE_URN = "urn:li:fsd_profile:ACoAAjane"
+
+
+def payload(*included):
+    return ("https://www.linkedin.com/voyager/api/graphql", {"data": {}, "included": list(included)})
+
+
+def test_entities_dedupes_by_urn_across_payloads():
+    position = {"$type": "com.linkedin.voyager.dash.identity.profile.Position", "entityUrn": "urn:li:fsd_profilePosition:(ACoAAjane,1)"}
+    other = {"$type": "com.linkedin.voyager.dash.identity.profile.Education", "entityUrn": "urn:li:fsd_profileEducation:(ACoAAjane,2)"}
+    found = voyager.entities([payload(position, other), payload(dict(position, title="later"))], voyager.POSITION)
+    assert found == [position]
+
+
+def test_find_profile_matches_public_identifier():
+    viewer = {"publicIdentifier": "me", "entityUrn": "urn:li:fsd_profile:ACoAAme"}
+    jane = {"publicIdentifier": "Jane-Doe", "entityUrn": PROFILE_URN}
+    assert voyager.find_profile([viewer, jane], "https://www.linkedin.com/in/jane-doe/") is jane
+    assert voyager.find_profile([viewer], "https://www.linkedin.com/in/jane-doe/") is None
+
+
+def test_owned_by_keeps_entities_of_the_profile():
+    mine = {"entityUrn": "urn:li:fsd_profilePosition:(ACoAAjane,1)"}
+    old_api = {"entityUrn": "urn:li:fs_position:(ACoAAjane,2)"}
+    by_field = {"entityUrn": "urn:li:fsd_profilePosition:3", "profileUrn": PROFILE_URN}
+    sidebar = {"entityUrn": "urn:li:fsd_profilePosition:(ACoAAother,4)"}
+    assert voyager.owned_by([mine, old_api, by_field, sidebar], PROFILE_URN) == [mine, old_api, by_field]
+    assert voyager.owned_by([mine], None) == []
+
+
+def test_experience_fields():
+    fields = voyager.experience_fields({
+        "title": "Engineer",
+        "companyName": "ACME",
+        "companyUrn": "urn:li:fsd_company:1234",
+        "dateRange": {"start": {"year": 2020, "month": 1}, "end": {"year": 2021, "month": 3}},
+        "description": {"text": "Built things"},
+    })
+    assert fields == {
+        "position_title": "Engineer",
+        "institution_name": "ACME",
+        "from_date": "Jan 2020",
+        "to_date": "Mar 2021",
+        "duration": "1 yr 3 mos",
+        "description": "Built things",
+        "linkedin_url": "https://www.linkedin.com/company/1234/",
+    }
+
+
+def test_education_fields_only_returns_found_fields():
+    fields = voyager.education_fields({"schoolName": "MIT", "degreeName": "BSc", "fieldOfStudy": "Physics"})
+    assert fields == {"institution_name": "MIT", "degree": "BSc, Physics"}